@@ -0,0 +1,265 @@
+#!/usr/bin/python
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  benchmarks/client.py
+#
+# contents:
+#  - client-overhead microbenchmarks: the cpu time redfishtool spends per request, without the network.
+#       requests are answered by a stub requests adapter that returns a canned json response, so the times are
+#       only the client code: building the url and headers, auth, the requests library, json parsing, the GET memo...
+#  - each benchmark is run in a loop for about --seconds, --repeat times. The fastest repeat is reported in
+#       usec per call (the other repeats are slower from noise, not from the code)
+#  - the usec depend on the machine and its load, so each repeat is also divided by the time of a calibration loop
+#       (json parsing and dict work like the client code does) run just before it.  The baseline file has the median
+#       of these ratios, so it can be compared on another machine.  A benchmark regresses if its ratio is more than --threshold percent
+#       over the baseline ratio.  The regressions are reported, and only fail the run with --fail
+#  - usage:  python benchmarks/client.py [options] [<benchmark name>...]
+#       --seconds=<sec>       -- time of each repeat. Default=0.2
+#       --repeat=<num>        -- Default=5
+#       --baseline=<file>     -- the baseline file. Default: benchmarks/client-baseline.json
+#       --update-baseline     -- write the results to the baseline file, instead of comparing them
+#       --threshold=<pct>     -- Default=50
+#       --fail                -- exit with 1 if a benchmark regressed
+#       <benchmark name>      -- only run the benchmarks with these names. Default: all
+#  - exit code: 0, or 1 if --fail and a benchmark regressed
+#
+import os
+import sys
+import json
+import time
+import getopt
+import statistics
+import datetime
+
+topDir=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, topDir)
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from redfishtoollib.redfishtoolTransport import RfTransport
+
+defaultBaseline=os.path.join(topDir, "benchmarks", "client-baseline.json")
+
+memberBody={"@odata.id": "/redfish/v1/Systems/1", "@odata.type": "#ComputerSystem.v1_5_0.ComputerSystem",
+            "Id": "1", "Name": "System 1", "AssetTag": "", "PowerState": "On", "IndicatorLED": "Off",
+            "Status": {"State": "Enabled", "Health": "OK"},
+            "Boot": {"BootSourceOverrideEnabled": "Disabled", "BootSourceOverrideTarget": "None"},
+            "Processors": {"@odata.id": "/redfish/v1/Systems/1/Processors"},
+            "Memory": {"@odata.id": "/redfish/v1/Systems/1/Memory"},
+            "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}]}}
+
+rootBody={"@odata.id": "/redfish/v1", "@odata.type": "#ServiceRoot.v1_5_0.ServiceRoot", "Id": "RootService",
+          "Systems": {"@odata.id": "/redfish/v1/Systems"},
+          "ProtocolFeaturesSupported": {"SelectQuery": True, "ExpandQuery": {"ExpandAll": True, "Levels": True}}}
+
+
+# a requests adapter that answers every request with the same json response, without a connection
+class RfStubAdapter(HTTPAdapter):
+    def __init__(self, body):
+        super().__init__()
+        self.content=json.dumps(body).encode("utf-8")
+
+    def send(self, request, **kwargs):
+        r=requests.Response()
+        r.status_code=200
+        r.reason="OK"
+        r._content=self.content
+        r.headers=CaseInsensitiveDict({"Content-Type": "application/json", "Content-Length": str(len(self.content))})
+        r.encoding="utf-8"
+        r.url=request.url
+        r.request=request
+        r.elapsed=datetime.timedelta(0)
+        return(r)
+
+
+# return a transport that sends its requests to the stub adapter, mounted on the transport's own session
+def stubTransport(auth="Basic"):
+    rft=RfTransport()
+    rft.rhost="127.0.0.1"
+    rft.user="admin"
+    rft.password="password"
+    rft.secure="Never"
+    rft.auth=auth
+    if( auth == "Session" ):
+        rft.authToken="0123456789abcdef"
+    rft.rootResponseDict=rootBody
+    rft.getHttpSession().mount("http://", RfStubAdapter(memberBody))
+    return(rft)
+
+
+def benchGet(auth="Basic", prop=None):
+    rft=stubTransport(auth)
+    def run():
+        rft.clearRequestMemo()
+        rft.rftSendRecvRequest(rft.AUTHENTICATED_API, "GET", "http://127.0.0.1/redfish/v1/Systems",
+                               relPath="/redfish/v1/Systems/1", prop=prop)
+    return(run)
+
+def benchGetMemo():
+    rft=stubTransport()
+    rft.rftSendRecvRequest(rft.AUTHENTICATED_API, "GET", "http://127.0.0.1/redfish/v1/Systems", relPath="/redfish/v1/Systems/1")
+    return(lambda: rft.rftSendRecvRequest(rft.AUTHENTICATED_API, "GET", "http://127.0.0.1/redfish/v1/Systems",
+                                          relPath="/redfish/v1/Systems/1"))
+
+def benchPatch():
+    rft=stubTransport()
+    return(lambda: rft.rftSendRecvRequest(rft.AUTHENTICATED_API, "PATCH", "http://127.0.0.1/redfish/v1/Systems/1",
+                                          reqData='{"AssetTag": "x"}', headersInput={"If-Match": 'W/"1"'}))
+
+def benchHttpRequest():
+    rft=stubTransport()
+    return(lambda: rft.httpRequest("GET", "http://127.0.0.1/redfish/v1/Systems/1", headers={"Accept": "application/json"},
+                                   verify=False, timeout=(3,10)))
+
+def benchSessionRequest():
+    session=stubTransport().httpSession
+    return(lambda: session.request("GET", "http://127.0.0.1/redfish/v1/Systems/1", headers={"Accept": "application/json"},
+                                   verify=False, timeout=(3,10)))
+
+def benchPrintVerbose():
+    rft=stubTransport()
+    url="http://127.0.0.1/redfish/v1/Systems/1"
+    return(lambda: rft.printVerbose(5,"Transport.ProcessRequest: url={}".format(url)))
+
+def benchPrintVerboseFmt():
+    rft=stubTransport()
+    url="http://127.0.0.1/redfish/v1/Systems/1"
+    return(lambda: rft.printVerboseFmt(5,"Transport.ProcessRequest: url={}",url))
+
+def benchPrintStatus():
+    rft=stubTransport()
+    r=rft.httpRequest("GET", "http://127.0.0.1/redfish/v1/Systems/1")
+    return(lambda: rft.printStatus(3,r=r,authMsg="Basic"))
+
+def benchParseOdataType():
+    rft=stubTransport()
+    return(lambda: rft.parseOdataType(rft, memberBody))
+
+
+# the calibration loop: python work like the client code does, with no redfishtool or requests code in it
+def benchCalibration():
+    text=json.dumps(memberBody)
+    def run():
+        d=json.loads(text)
+        members=[dict(d, Id=str(i)) for i in range(4)]
+        return(sorted(m["Id"] for m in members if m.get("PowerState") == "On"))
+    return(run)
+
+
+# name, function that returns the function to time
+benchmarks=[
+    ("rftSendRecvRequest GET",          lambda: benchGet()),
+    ("rftSendRecvRequest GET Session",  lambda: benchGet(auth="Session")),
+    ("rftSendRecvRequest GET -P",       lambda: benchGet(prop="AssetTag")),
+    ("rftSendRecvRequest GET memo hit", benchGetMemo),
+    ("rftSendRecvRequest PATCH",        benchPatch),
+    ("httpRequest",                     benchHttpRequest),
+    ("requests Session.request",        benchSessionRequest),
+    ("printVerbose not printed",        benchPrintVerbose),
+    ("printVerboseFmt not printed",     benchPrintVerboseFmt),
+    ("printStatus not printed",         benchPrintStatus),
+    ("parseOdataType",                  benchParseOdataType),
+]
+
+
+# return the number of calls of fn that take about <seconds>
+def countLoops(fn, seconds):
+    loops=1
+    while True:
+        elapsed=timeLoops(fn, loops) * loops
+        if( elapsed >= seconds / 4 ):
+            break
+        loops*=2
+    return(max(1, int(loops * seconds / max(elapsed, 1e-9))))
+
+# return the seconds per call of <loops> calls of fn
+def timeLoops(fn, loops):
+    t1=time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return((time.perf_counter() - t1) / loops)
+
+# return the usec per call of the fastest repeat of fn, and the median ratio of its time to the time of the
+# calibration loop run just before it in each repeat.  Timing them together cancels most of the machine load
+def timeCall(fn, calibration, seconds, repeat):
+    loops=countLoops(fn, seconds)
+    calibrationLoops=countLoops(calibration, seconds / 2)
+    times=list()
+    ratios=list()
+    for _ in range(repeat):
+        calibrationTime=timeLoops(calibration, calibrationLoops)
+        elapsed=timeLoops(fn, loops)
+        times.append(elapsed)
+        ratios.append(elapsed / calibrationTime)
+    return(min(times) * 1000000, statistics.median(ratios))
+
+
+def main(argv):
+    seconds=0.2
+    repeat=5
+    baselineFile=defaultBaseline
+    update=False
+    threshold=50.0
+    failOnRegression=False
+    try:
+        opts, args = getopt.getopt(argv[1:], "", ["seconds=", "repeat=", "baseline=", "update-baseline", "threshold=",
+                                                  "fail"])
+    except getopt.GetoptError as e:
+        print("Error: {}".format(e), file=sys.stderr)
+        return(1)
+    for opt, arg in opts:
+        if opt == "--seconds":
+            seconds=float(arg)
+        elif opt == "--repeat":
+            repeat=int(arg)
+        elif opt == "--baseline":
+            baselineFile=arg
+        elif opt == "--update-baseline":
+            update=True
+        elif opt == "--threshold":
+            threshold=float(arg)
+        elif opt == "--fail":
+            failOnRegression=True
+
+    baseline=dict()
+    if( (not update) and os.path.exists(baselineFile) ):
+        with open(baselineFile) as f:
+            baseline=json.load(f)
+
+    rc=0
+    results=dict()
+    calibration=benchCalibration()
+    print("ratio = time per call / time of the calibration loop run with it")
+    print("{:34s} {:>12s} {:>12s} {:>12s}".format("benchmark", "usec/call", "ratio", "baseline"))
+    for name,setup in benchmarks:
+        if( args and (name not in args) ):
+            continue
+        usec,ratio=timeCall(setup(), calibration, seconds, repeat)
+        ratio=round(ratio, 4)
+        results[name]=ratio
+        base=baseline.get(name)
+        if( base is None ):
+            print("{:34s} {:12.2f} {:12.4f}".format(name, usec, ratio))
+            continue
+        status="ok"
+        if( ratio > base * (1 + threshold / 100.0) ):
+            status="REGRESSED: {:+.0f}%".format((ratio / base - 1) * 100)
+            if( failOnRegression ):
+                rc=1
+        print("{:34s} {:12.2f} {:12.4f} {:12.4f}  {}".format(name, usec, ratio, base, status))
+
+    if( update ):
+        if( args and os.path.exists(baselineFile) ):
+            with open(baselineFile) as f:
+                results=dict(json.load(f), **results)
+        with open(baselineFile, "w") as f:
+            json.dump(results, f, indent=4)
+            f.write("\n")
+        print("wrote baseline {}".format(baselineFile))
+    return(rc)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
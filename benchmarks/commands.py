@@ -0,0 +1,286 @@
+#!/usr/bin/python
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  benchmarks/commands.py
+#
+# contents:
+#  - end-to-end benchmark: runs each command in the commands list against the mock Redfish service
+#       (redfishtoollib/redfishtoolMockBmc.py) with injected latency, and records for each command:
+#       requests -- the number of http requests it sent (from --stats-file)
+#       wallMs   -- the median wall time of --runs runs, in msec
+#       peakKiB  -- the peak memory allocated by python during the command (tracemalloc), in KiB
+#  - the results are compared to the baseline file. A command regresses if:
+#       it sends more requests than the baseline, or
+#       its wall time is over the baseline by more than --time-threshold percent and --time-slack-ms, or
+#       its peak memory is over the baseline by more than --memory-threshold percent
+#  - the mock runs in a separate process, so the memory and time are only the client's.  The commands run in this
+#       process, after one warm-up run, so the wall time does not include python start-up (see benchmarks/startup.py)
+#  - usage:  python benchmarks/commands.py [options] [<command name>...]
+#       --runs=<num>              -- timed runs of each command. Default=5
+#       --latency=<sec>           -- latency of each mock response. Default=0.005
+#       --baseline=<file>         -- the baseline file. Default: benchmarks/commands-baseline.json
+#       --update-baseline         -- write the results to the baseline file, instead of comparing them
+#       --time-threshold=<pct>    -- Default=25
+#       --time-slack-ms=<msec>    -- Default=10
+#       --memory-threshold=<pct>  -- Default=25
+#       --requests-only           -- only compare the request counts. wall times and memory depend on the machine
+#       <command name>            -- only run the commands with these names. Default: all
+#  - then checks the output of a fleet (-r <rhost>,<rhost>) run with -v and -sss of each command in fleetChecks:
+#       stdout must only have the json record of each host.  The status lines printed by the threads that read
+#       collection members must be in the output of their host's record, not between the records
+#  - exit code: 0 if no command regressed, 1 if a command regressed or failed, or a fleet output check failed
+#
+import os
+import io
+import sys
+import json
+import time
+import getopt
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+import contextlib
+
+topDir=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, topDir)
+from redfishtoollib import main as redfishtoolMain
+
+defaultBaseline=os.path.join(topDir, "benchmarks", "commands-baseline.json")
+
+# the synthetic tree the mock serves
+mockTree={"systems": 32, "processors": 4, "dimms": 8, "log-entries": 200, "sensors": 8, "page-size": 50,
+          "task-polls": 1}
+
+# name, argv of the command, argv of a command run after each run to undo its changes (or None)
+commands=[
+    ("Systems get",            ["Systems", "-I", "1"], None),
+    ("Systems get Session",    ["-A", "Session", "Systems", "-I", "1"], None),
+    ("Systems list",           ["Systems", "list"], None),
+    ("Systems -a",             ["Systems", "-a"], None),
+    ("Systems Processors -a",  ["Systems", "-I", "1", "Processors", "-a"], None),
+    ("Systems Inventory",      ["Systems", "-I", "1", "Inventory"], None),
+    ("Systems Logs Entries",   ["Systems", "-I", "1", "Logs", "-i", "SEL", "-E"], None),
+    ("Systems reset",          ["Systems", "-I", "1", "reset", "GracefulRestart"], None),
+    ("Systems -a reset",       ["Systems", "-a", "reset", "GracefulRestart"], None),
+    ("Chassis Power",          ["Chassis", "-1", "Power"], None),
+    ("Chassis Thermal",        ["Chassis", "-1", "Thermal"], None),
+    ("Chassis Sensors",        ["Chassis", "-1", "Sensors"], None),
+    ("Chassis Logs Entries",   ["Chassis", "-1", "Logs", "-i", "Log", "-E"], None),
+    ("Managers get",           ["Managers", "-1"], None),
+    ("AccountService adduser", ["AccountService", "adduser", "benchuser", "benchpass123", "Operator"],
+                               ["AccountService", "deleteuser", "benchuser"]),
+    ("raw GET",                ["raw", "GET", "/redfish/v1/Systems/1"], None),
+]
+
+# name, argv of a command run on 2 hosts with -v -sss by the fleet output check
+fleetChecks=[
+    ("fleet Systems -F -M",    ["Systems", "-F", "-M", "PowerState:On"]),
+    ("fleet Systems -a",       ["Systems", "-a", "setAssetTag", "fleetcheck"]),
+]
+
+
+# start the mock in a new process.  returns (process, rhost)
+def startMock(latency):
+    argv=[sys.executable, "-m", "redfishtoollib.redfishtoolMockBmc", "--latency={}".format(latency)]
+    argv+=["--{}={}".format(name, value) for name,value in mockTree.items()]
+    p=subprocess.Popen(argv, cwd=topDir, stdout=subprocess.PIPE, universal_newlines=True)
+    line=p.stdout.readline()    # "<program> listening on http://<rhost>  (user: <user>, password: <password>)"
+    if( " listening on http://" not in line ):
+        p.kill()
+        raise RuntimeError("the mock did not start: {}".format(line))
+    return(p, line.split("http://",1)[1].split()[0])
+
+
+# run one command in this process.  returns (rc, requests, seconds)
+def runCommand(rhost, argv, statsFile):
+    if( os.path.exists(statsFile) ):
+        os.remove(statsFile)
+    argv=["redfishtool", "-r", rhost, "-u", "admin", "-p", "password", "-S", "Never",
+          "--stats-file=" + statsFile] + argv
+    t1=time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        try:
+            redfishtoolMain(argv)
+            rc=0
+        except SystemExit as e:
+            rc=e.code or 0
+    elapsed=time.perf_counter() - t1
+    requests=None
+    if( os.path.exists(statsFile) ):
+        with open(statsFile) as f:
+            requests=json.loads(f.readline())["requests"]
+    return(rc, requests, elapsed)
+
+
+# run a command warmUp + runs times, and once more with tracemalloc.  returns the result dict, or None if it failed
+def benchmarkCommand(rhost, argv, cleanupArgv, runs, statsFile):
+    times=list()
+    requests=None
+    for i in range(runs + 1):
+        rc,requests,elapsed=runCommand(rhost, argv, statsFile)
+        if( cleanupArgv is not None ):
+            runCommand(rhost, cleanupArgv, statsFile)
+        if( rc != 0 ):
+            return({"rc": rc})
+        if( i > 0 ):     # the first run is the warm-up
+            times.append(elapsed)
+
+    tracemalloc.start()
+    try:
+        rc,_,_=runCommand(rhost, argv, statsFile)
+        _,peak=tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if( cleanupArgv is not None ):
+        runCommand(rhost, cleanupArgv, statsFile)
+    return({"requests": requests, "wallMs": round(statistics.median(times) * 1000, 1), "peakKiB": round(peak / 1024, 1)})
+
+
+# run a command on the fleet -r <rhost>,<rhost> with -v -sss.  returns the list of problems with its stdout
+def checkFleetOutput(rhost, argv):
+    argv=["redfishtool", "-r", rhost + "," + rhost, "-u", "admin", "-p", "password", "-S", "Never", "-v", "-sss"] + argv
+    output=io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+        try:
+            redfishtoolMain(argv)
+        except SystemExit:
+            pass
+    problems=list()
+    records=0
+    for line in output.getvalue().splitlines():
+        try:
+            record=json.loads(line)
+        except ValueError:
+            record=None
+        if( isinstance(record, dict) and ("rhost" in record) ):
+            records+=1
+        else:
+            problems.append("line outside the host records: {}".format(line[:100]))
+    if( records != 2 ):
+        problems.append("{} host records, expected 2".format(records))
+    return(problems)
+
+
+# compare a result to its baseline.  returns the list of regressions
+def compareResult(result, base, options):
+    regressions=list()
+    if( result["requests"] > base["requests"] ):
+        regressions.append("requests {} > {}".format(result["requests"], base["requests"]))
+    if( options["requestsOnly"] ):
+        return(regressions)
+    maxMs=base["wallMs"] * (1 + options["timeThreshold"] / 100.0) + options["timeSlackMs"]
+    if( result["wallMs"] > maxMs ):
+        regressions.append("wall time {} ms > {:.1f} ms".format(result["wallMs"], maxMs))
+    maxKiB=base["peakKiB"] * (1 + options["memoryThreshold"] / 100.0)
+    if( result["peakKiB"] > maxKiB ):
+        regressions.append("peak memory {} KiB > {:.1f} KiB".format(result["peakKiB"], maxKiB))
+    return(regressions)
+
+
+def main(argv):
+    options={"runs": 5, "latency": 0.005, "baseline": defaultBaseline, "update": False, "timeThreshold": 25.0,
+             "timeSlackMs": 10.0, "memoryThreshold": 25.0, "requestsOnly": False}
+    try:
+        opts, args = getopt.getopt(argv[1:], "", ["runs=", "latency=", "baseline=", "update-baseline", "time-threshold=",
+                                                  "time-slack-ms=", "memory-threshold=", "requests-only"])
+    except getopt.GetoptError as e:
+        print("Error: {}".format(e), file=sys.stderr)
+        return(1)
+    for opt, arg in opts:
+        if opt == "--runs":
+            options["runs"]=int(arg)
+        elif opt == "--latency":
+            options["latency"]=float(arg)
+        elif opt == "--baseline":
+            options["baseline"]=arg
+        elif opt == "--update-baseline":
+            options["update"]=True
+        elif opt == "--time-threshold":
+            options["timeThreshold"]=float(arg)
+        elif opt == "--time-slack-ms":
+            options["timeSlackMs"]=float(arg)
+        elif opt == "--memory-threshold":
+            options["memoryThreshold"]=float(arg)
+        elif opt == "--requests-only":
+            options["requestsOnly"]=True
+
+    selected=[c for c in commands if( (not args) or (c[0] in args) )]
+    if( not selected ):
+        print("Error: no commands named: {}".format(", ".join(args)), file=sys.stderr)
+        return(1)
+
+    config={"latency": options["latency"], "mock": mockTree}
+    baseline=None
+    if( not options["update"] ):
+        try:
+            with open(options["baseline"]) as f:
+                baseline=json.load(f)
+        except (OSError, ValueError) as e:
+            print("Error: can't read baseline {}: {}. create it with --update-baseline".format(options["baseline"], e),
+                  file=sys.stderr)
+            return(1)
+        if( baseline.get("config") != config ):
+            print("Error: the baseline was recorded with another --latency or mock tree: {}".format(baseline.get("config")),
+                  file=sys.stderr)
+            return(1)
+
+    mock,rhost=startMock(options["latency"])
+    statsFile=os.path.join(tempfile.mkdtemp(), "stats.json")
+    rc=0
+    results=dict()
+    try:
+        print("{:24s} {:>16s} {:>22s} {:>22s}".format("command", "requests", "wall ms", "peak KiB"))
+        for name,cmdArgv,cleanupArgv in selected:
+            result=benchmarkCommand(rhost, cmdArgv, cleanupArgv, options["runs"], statsFile)
+            if( "rc" in result ):
+                print("{:24s} FAILED rc={}".format(name, result["rc"]))
+                rc=1
+                continue
+            results[name]=result
+            base=baseline["commands"].get(name) if( baseline is not None ) else None
+            if( base is None ):
+                print("{:24s} {:>16} {:>22} {:>22}".format(name, result["requests"], result["wallMs"], result["peakKiB"]))
+                continue
+            regressions=compareResult(result, base, options)
+            print("{:24s} {:>16s} {:>22s} {:>22s}  {}".format(name,
+                  "{} ({})".format(result["requests"], base["requests"]),
+                  "{} ({})".format(result["wallMs"], base["wallMs"]),
+                  "{} ({})".format(result["peakKiB"], base["peakKiB"]),
+                  "REGRESSED: " + ", ".join(regressions) if regressions else "ok"))
+            if( regressions ):
+                rc=1
+
+        if( not args ):
+            for name,cmdArgv in fleetChecks:
+                problems=checkFleetOutput(rhost, cmdArgv)
+                print("{:24s} {}".format(name, "FAILED: " + problems[0] if problems else "output ok"))
+                if( problems ):
+                    rc=1
+    finally:
+        mock.terminate()
+        mock.wait()
+        if( os.path.exists(statsFile) ):
+            os.remove(statsFile)
+        os.rmdir(os.path.dirname(statsFile))
+
+    if( options["update"] ):
+        if( rc != 0 ):
+            print("Error: not updating the baseline, a command failed", file=sys.stderr)
+            return(rc)
+        if( os.path.exists(options["baseline"]) and args ):
+            with open(options["baseline"]) as f:
+                results=dict(json.load(f)["commands"], **results)
+        with open(options["baseline"], "w") as f:
+            json.dump({"config": config, "commands": results}, f, indent=4)
+            f.write("\n")
+        print("wrote baseline {}".format(options["baseline"]))
+    elif( baseline is not None ):
+        print("(baseline in parentheses)")
+    return(rc)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  benchmarks/startup.py
+#
+# contents:
+#  - start-up benchmark: measures how much longer "redfishtool -V" and "redfishtool help" take to start than a bare
+#       python interpreter, and checks that they don't import the modules that are only needed to talk to a rhost
+#  - usage:  python benchmarks/startup.py [--runs=<num>] [--budget-ms=<msec>]
+#       --runs=<num>       -- times each command is run. the fastest run is used. Default=10
+#       --budget-ms=<msec> -- max start-up time over the bare interpreter. Default=30
+#  - exit code: 0 if within budget, 1 if a command is over budget or imports a lazily imported module
+#
+import os
+import sys
+import time
+import getopt
+import subprocess
+
+# modules that must not be imported by commands that don't send requests
+lazyModules=["requests", "urllib3", "dateutil", "concurrent.futures", "socketserver",
+             "redfishtoollib.Systems", "redfishtoollib.Chassis", "redfishtoollib.Managers",
+             "redfishtoollib.AccountService", "redfishtoollib.SessionService", "redfishtoollib.raw"]
+
+commands={"-V": ["-V"], "help": ["help"]}
+
+topDir=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+redfishtool=os.path.join(topDir, "redfishtool.py")
+
+# run the main() of redfishtool with argv in a new interpreter, and print the names of the modules it imported
+listModules=("import sys\n"
+             "sys.path.insert(0, {!r})\n"
+             "from redfishtoollib import main\n"
+             "try:\n"
+             "    main(['redfishtool'] + sys.argv[1:])\n"
+             "except SystemExit:\n"
+             "    pass\n"
+             "sys.stderr.write(' '.join(sys.modules))\n").format(topDir)
+
+
+# return the fastest wall time in seconds of runs runs of the command
+def timeCommand(cmd, runs):
+    best=None
+    for _ in range(runs):
+        t1=time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        elapsed=time.perf_counter()-t1
+        if( (best is None) or (elapsed < best) ):
+            best=elapsed
+    return(best)
+
+
+def importedLazyModules(argv):
+    p=subprocess.run([sys.executable, "-c", listModules] + argv, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.PIPE, universal_newlines=True, check=False)
+    modules=set(p.stderr.split())
+    return([m for m in lazyModules if m in modules])
+
+
+def main(argv):
+    runs=10
+    budgetMs=30.0
+    try:
+        opts, args = getopt.getopt(argv[1:], "", ["runs=", "budget-ms="])
+    except getopt.GetoptError as e:
+        print("Error: {}".format(e), file=sys.stderr)
+        return(1)
+    for opt, arg in opts:
+        if opt == "--runs":
+            runs=int(arg)
+        elif opt == "--budget-ms":
+            budgetMs=float(arg)
+
+    # compile the package first, so that the timings don't include compiling it
+    subprocess.run([sys.executable, "-m", "compileall", "-q", os.path.join(topDir, "redfishtoollib")], check=False)
+
+    bare=timeCommand([sys.executable, "-c", "pass"], runs)
+    print("bare interpreter:        {:7.1f} ms".format(bare*1000))
+    rc=0
+    for name,cmdArgv in commands.items():
+        elapsed=timeCommand([sys.executable, redfishtool] + cmdArgv, runs)
+        overMs=(elapsed-bare)*1000
+        status="ok"
+        if( overMs > budgetMs ):
+            status="OVER BUDGET ({:.0f} ms)".format(budgetMs)
+            rc=1
+        print("redfishtool {:12s} {:7.1f} ms  (+{:.1f} ms)  {}".format(name, elapsed*1000, overMs, status))
+        imported=importedLazyModules(cmdArgv)
+        if( imported ):
+            print("   imports lazily imported modules: {}".format(", ".join(imported)))
+            rc=1
+    return(rc)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
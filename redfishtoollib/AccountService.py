@@ -103,11 +103,11 @@ class RfAccountServiceMain():
             "examples":                     op.examples
         }
 
-        rft.printVerbose(5,"AccountService:runOperation: operation: {}".format(self.operation))
-        rft.printVerbose(5,"AccountService:runOperation: args:  {}".format(self.args))
+        rft.printVerboseFmt(5,"AccountService:runOperation: operation: {}",self.operation)
+        rft.printVerboseFmt(5,"AccountService:runOperation: args:  {}",self.args)
             
         if self.operation in operationTable:
-            rft.printVerbose(5,"AccountService:runOperation: found Oper: {} in table. executing".format(rft.subcommand))
+            rft.printVerboseFmt(5,"AccountService:runOperation: found Oper: {} in table. executing",rft.subcommand)
             rc,r,j,d=operationTable[self.operation](self, op, rft, cmdTop=True)
             return(rc,r,j,d)
         
@@ -118,7 +118,7 @@ class RfAccountServiceMain():
 
 
     def AccountServiceMain(self,rft,cmdTop=False):
-        rft.printVerbose(4,"AccountServiceMain:  subcommand: {}".format(rft.subcommand))
+        rft.printVerboseFmt(4,"AccountServiceMain:  subcommand: {}",rft.subcommand)
         
         if( rft.help ):
             self.displayHelp(rft)
@@ -138,13 +138,13 @@ class RfAccountServiceMain():
             self.args = args[1:]        # now args points to the 1st argument
             self.argnum =len(self.args)
             
-        rft.printVerbose(5,"AccountService: operation={}, args={}".format(self.operation,self.args))
+        rft.printVerboseFmt(5,"AccountService: operation={}, args={}",self.operation,self.args)
                           
         # now execute the operation.
         rc,r,j,d = self.runOperation(rft)
                 
         if(rc !=0 ):
-            rft.printVerbose(5,"AccountService: operation returned with error: rc={}".format(rc))
+            rft.printVerboseFmt(5,"AccountService: operation returned with error: rc={}",rc)
             return(rc,r,False,None)
         
         #else, if here, the subcommand executed without error.  Return with 0 exit code
@@ -163,14 +163,14 @@ class RfAccountServiceOperations():
 
     def hello(self,sc,op,rft,cmdTop=False):
         rft.printVerbose(4,"in hello")
-        rft.printVerbose(4,"   subcmd:{}, operation:{}, args:{}".format(rft.subcommand,sc.operation,sc.args))
+        rft.printVerboseFmt(4,"   subcmd:{}, operation:{}, args:{}",rft.subcommand,sc.operation,sc.args)
         print("hello world from AccountService")
         return(0,None,False,None)
 
 
 
     def get(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # 1st get serviceRoot
         svcRoot=RfServiceRoot()
@@ -187,7 +187,7 @@ class RfAccountServiceOperations():
             rft.printErr("Error:  root does not have a AccountService link")
             return(4)
         
-        rft.printVerbose(4,"AccountService: get AccountService: link is: {}".format(accountServiceLink))
+        rft.printVerboseFmt(4,"AccountService: get AccountService: link is: {}",accountServiceLink)
       
         if cmdTop is True:   prop=rft.prop
               
@@ -200,7 +200,7 @@ class RfAccountServiceOperations():
 
     
     def patch(self,sc,op,rft,cmdTop=False, prop=None, patchData=None, r=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         # verify we have got an argument which is the patch structure
         # its in form '{ "AssetTag": <val>, "IndicatorLed": <val> }'
         ##print("patchData: {}".format(patchData))
@@ -236,7 +236,7 @@ class RfAccountServiceOperations():
         
 
     def getAccounts(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation: getAccounts collection".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation: getAccounts collection",rft.subcommand,sc.operation)
 
         # get the AccountService resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -301,7 +301,7 @@ class RfAccountServiceOperations():
         
 
     def getRoles(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation: getRoles collection".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation: getRoles collection",rft.subcommand,sc.operation)
 
         # get the AccountService resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -368,7 +368,7 @@ class RfAccountServiceOperations():
 
     # adduser <username> <passwd> [<roleId>] ---add a new user
     def addUser(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # verify we got 2 args <username> and <passwd>
         # if we got 3rd arg <roleId>, use it, otherwise use builtin Operator role
@@ -439,7 +439,7 @@ class RfAccountServiceOperations():
 
     # deleteuser <username>
     def deleteUser(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # verify one addl arg username
         # get Accounts collection
@@ -481,7 +481,7 @@ class RfAccountServiceOperations():
 
     # useradmin <username> {enable|disable|unlock|{setRoleId <roleId>}}
     def userAdmin(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # verify we have two addl arg, and it is a valid keyword: enable,disable,unlock,setRoleId=...
         # create the patch strint
@@ -574,7 +574,7 @@ class RfAccountServiceOperations():
 
     # setusername <id> <username>
     def setUsername(self, sc, op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4, "{}:{}: in operation".format(rft.subcommand, sc.operation))
+        rft.printVerboseFmt(4, "{}:{}: in operation",rft.subcommand,sc.operation)
 
         # verify we have two addl args (<id> and <username>)
         # create the patch string
@@ -636,7 +636,7 @@ class RfAccountServiceOperations():
 
     # setpassword <username> <password>
     def setPassword(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # verify we have two addl args:  <username> <passwd>.
         # create the patch string
@@ -696,7 +696,7 @@ class RfAccountServiceOperations():
     
       
     def examples(self,sc,op,rft,cmdTop=False,prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print(" {} -r<ip> AccountService                          # gets the AccountService".format(rft.program))
         print(" {} -r<ip> AccountService patch {{ \"AccountLockoutThreshold\": 5 }} ]# set failed login lockout threshold".format(rft.program))
         print(" {} -r<ip> AccountService Accounts                 # gets Accounts collection".format(rft.program))
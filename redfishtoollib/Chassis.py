@@ -108,11 +108,11 @@ class RfChassisMain():
             "examples":                     op.examples
         }
 
-        rft.printVerbose(5,"Chassis:runOperation: operation: {}".format(self.operation))
-        rft.printVerbose(5,"Chassis:runOperation: args:  {}".format(self.args))
+        rft.printVerboseFmt(5,"Chassis:runOperation: operation: {}",self.operation)
+        rft.printVerboseFmt(5,"Chassis:runOperation: args:  {}",self.args)
             
         if self.operation in operationTable:
-            rft.printVerbose(5,"Chassis:runOperation: found Oper: {} in table. executing".format(rft.subcommand))
+            rft.printVerboseFmt(5,"Chassis:runOperation: found Oper: {} in table. executing",rft.subcommand)
             rc,r,j,d=operationTable[self.operation](self, op, rft, cmdTop=True)
             return(rc,r,j,d)
         
@@ -123,7 +123,7 @@ class RfChassisMain():
 
 
     def ChassisMain(self,rft,cmdTop=False):
-        rft.printVerbose(4,"ChassisMain:  subcommand: {}".format(rft.subcommand))
+        rft.printVerboseFmt(4,"ChassisMain:  subcommand: {}",rft.subcommand)
         
         if( rft.help ):
             self.displayHelp(rft)
@@ -147,7 +147,7 @@ class RfChassisMain():
             self.args = args[1:]        # now args points to the 1st argument
             self.argnum =len(self.args)
             
-        rft.printVerbose(5,"Chassis: operation={}, args={}".format(self.operation,self.args))
+        rft.printVerboseFmt(5,"Chassis: operation={}, args={}",self.operation,self.args)
                 
         # check if the command requires a collection member target -I|-M|-L|-1|-F eg sysIdoptn
         nonIdCommands = ["collection", "list", "examples", "hello"]
@@ -160,7 +160,7 @@ class RfChassisMain():
         rc,r,j,d = self.runOperation(rft)
                 
         if(rc !=0 ):
-            rft.printVerbose(5,"Chassis: operation returned with error: rc={}".format(rc))
+            rft.printVerboseFmt(5,"Chassis: operation returned with error: rc={}",rc)
             return(rc,r,False,None)
         
         #else, if here, the subcommand executed without error.  Return with 0 exit code
@@ -179,12 +179,12 @@ class RfChassisOperations():
 
     def hello(self,sc,op,rft,cmdTop=False):
         rft.printVerbose(4,"in hello")
-        rft.printVerbose(4,"   subcmd:{}, operation:{}, args:{}".format(rft.subcommand,sc.operation,sc.args))
+        rft.printVerboseFmt(4,"   subcmd:{}, operation:{}, args:{}",rft.subcommand,sc.operation,sc.args)
         print("hello world from Chassis")
         return(0,None,False,None)
     
     def getCollection(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in getCollection".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in getCollection",rft.subcommand,sc.operation)
         
         # 1st get serviceRoot
         svcRoot=RfServiceRoot()
@@ -201,7 +201,7 @@ class RfChassisOperations():
             rft.printErr("Error: service root does not have a Chassis link")
             return(4)
         
-        rft.printVerbose(4,"Chassis:getCollection: link is: {}".format(systemsLink))
+        rft.printVerboseFmt(4,"Chassis:getCollection: link is: {}",systemsLink)
 
 
         # if a -a option was entered with "Chassis" or "Chassis collection" operation,
@@ -226,17 +226,22 @@ class RfChassisOperations():
 
 
     def get(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
-        # getCollection
-        rc,r,j,d=op.getCollection(sc,op, rft)
-        if( rc != 0):  return(rc,r,False,None)
-        collUrl=r.url
+        # -a runs the operation on each member with -L <member link> and the url of the collection it already read
+        if( (rft.collectionUrl is not None) and (rft.Link is not None) ):
+            collUrl=rft.collectionUrl
+            sysPath,r=rft.Link,None
+        else:
+            # getCollection
+            rc,r,j,d=op.getCollection(sc,op, rft)
+            if( rc != 0):  return(rc,r,False,None)
+            collUrl=r.url
 
-        # search collection to find path to system
-        sysPath,rc,r,j,d=rft.getPathBy(rft, r, d, prop)
-        if( rc !=0 ):    #if a path was not found, its an error
-            return(rc,r,j,d)
+            # search collection to find path to system
+            sysPath,rc,r,j,d=rft.getPathBy(rft, r, d, prop)
+            if( rc !=0 ):    #if a path was not found, its an error
+                return(rc,r,j,d)
         
         rft.printVerbose(4,"ChassisOperations:get: got a path, now get entries")
         
@@ -256,7 +261,7 @@ class RfChassisOperations():
 
 
     def clist(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
         # getCollection
         collName="Chassis"
@@ -274,49 +279,31 @@ class RfChassisOperations():
         if rft.allOptn:
             # Issue command to all chassis in collection
 
-            # get the list of chassis
-            rc, r, j, d = op.clist(sc, op, rft, cmdTop=cmdTop, prop=prop)
+            # get the links of the chassis from the collection
+            rc, r, j, d = op.getCollection(sc, op, rft)
             if rc != 0 or not j or d is None or not isinstance(d, dict) or 'Members' not in d:
                 rft.printErr("Unable to get list of Chassis; return code = {}, list data = {}".format(rc, d))
                 return rc, r, j, d
-
-            # save existing rft options
-            saved_allOptn = rft.allOptn
-            saved_Link = rft.Link
-            saved_gotIdOptn = rft.gotIdOptn
-            saved_IdOptnCount = rft.IdOptnCount
-
-            # set rft options to process a single item
-            rft.allOptn = False
-            rft.gotIdOptn = True
-            rft.IdOptnCount = 1
-
-            # iterate through chassis and run operation on each based on the link (@odata.id value)
-            members = d.get('Members')
-            rc, r, j, d = 8, None, False, None
-            for member in members:
+            links = []
+            for member in d.get('Members'):
                 if '@odata.id' in member:
-                    link = member.get('@odata.id')
-                    # set rft.Link to point to the target chassis
-                    rft.Link = link
-                    # perform the operation
-                    rc, r, j, d = run_single(sc, op, rft, cmdTop=cmdTop, prop=prop)
+                    links.append(member.get('@odata.id'))
                 else:
                     rft.printErr("No '@odata.id' found in chassis member: {}".format(member))
+            if not links:
+                rft.printErr("No Chassis found in the collection")
+                return 8, None, False, None
 
-            # restore existing rft options
-            rft.allOptn = saved_allOptn
-            rft.Link = saved_Link
-            rft.gotIdOptn = saved_gotIdOptn
-            rft.IdOptnCount = saved_IdOptnCount
-            return rc, r, j, d
+            # run the operation on each chassis concurrently (up to --max-inflight at a time), each in its own
+            # call context selecting the chassis with its link (@odata.id value).  returns the result of each chassis
+            return rft.runOnMembers(rft, r.url, links, lambda: run_single(sc, op, rft, cmdTop=cmdTop, prop=prop))
         else:
             # Issue command to single specified chassis
             return run_single(sc, op, rft, cmdTop=cmdTop, prop=prop)
 
 
     def patch_single(self,sc,op,rft,cmdTop=False, prop=None, patchData=None, r=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         # verify we have got an argument which is the patch structure
         # its in form '{ "AssetTag": <val>, "IndicatorLed": <val> }'
         ##print("patchData: {}".format(patchData))
@@ -354,7 +341,7 @@ class RfChassisOperations():
 
 
     def setAssetTag_single(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         propName="AssetTag"
         
@@ -387,7 +374,7 @@ class RfChassisOperations():
 
 
     def setIndicatorLed_single(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         propName="IndicatorLED"
         
@@ -424,7 +411,7 @@ class RfChassisOperations():
 
 
     def getPower(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         resName="Power"
 
         # get the Chassis resource first
@@ -449,7 +436,7 @@ class RfChassisOperations():
 
 
     def getThermal(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         resName="Thermal"
         # get the Chassis resource first
         rc,r,j,d=op.get(sc, op, rft, cmdTop, resName)
@@ -473,7 +460,7 @@ class RfChassisOperations():
 
 
     def getPowerReading(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
                          
         if cmdTop is True:  prop=rft.prop
 
@@ -509,7 +496,7 @@ class RfChassisOperations():
             indxMatch=re.search(indxPattern,rft.IdLevel2)
             if( indxMatch ):
                 indx=int(rft.IdLevel2)  # convert base10 to integer
-                rft.printVerbose(4,"getPowerReading: Indx={}".format(indx))
+                rft.printVerboseFmt(4,"getPowerReading: Indx={}",indx)
             else:
                 rft.printErr("Error: getPowerReading: invalid PowerControl index value: {}".format(rft.IdLevel2))
                 rft.printErr("Chassis getPowerReading [current] [-i<indx>] --<indx> is integer 0 - 99 (default is 0)")
@@ -538,7 +525,7 @@ class RfChassisOperations():
 
     #setPowerLimit [-i<indx>] <limit> [<exception> [<correctionTime>]] -- set powerLimit control properties")
     def setPowerLimit_single(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
                          
         if cmdTop is True:  prop=rft.prop
 
@@ -551,7 +538,7 @@ class RfChassisOperations():
                     limit=None
                 else:
                     limit=int(sc.args[1])  # keep it a string
-                rft.printVerbose(4,"setPowerLimit: limit={}".format(limit))
+                rft.printVerboseFmt(4,"setPowerLimit: limit={}",limit)
                 powerLimitData={"LimitInWatts": limit }
             else:
                 rft.printErr("Error: setPowerLimit: invalid <limit> value specified: {}".format(sc.args[1]))
@@ -571,7 +558,7 @@ class RfChassisOperations():
                 rft.printErr("Chassis setPowerLimit [-i<indx>] <limit> [<exception> [<correctionTime>]] --limit=null | 0-99999")
                 return(8,None,False,None)
             else:
-                rft.printVerbose(4,"setPowerLimit: exception={}".format(exceptionVal))
+                rft.printVerboseFmt(4,"setPowerLimit: exception={}",exceptionVal)
                 powerLimitData["LimitException"]=exceptionVal
                 includeException=True
                          
@@ -582,7 +569,7 @@ class RfChassisOperations():
             correctionMatch=re.search(correctionPattern,sc.args[3])  # sc.args[3]=<correctionInMs>
             if( correctionMatch ):
                 correctionTime=int(sc.args[3])  # keep it a string
-                rft.printVerbose(4,"setPowerLimit: correctionInMs={}".format(correctionTime))
+                rft.printVerboseFmt(4,"setPowerLimit: correctionInMs={}",correctionTime)
                 powerLimitData["CorrectionInMs"]=correctionTime 
                 includeCorrectionTime=True
             else:
@@ -613,7 +600,7 @@ class RfChassisOperations():
             indxMatch=re.search(indxPattern,rft.IdLevel2)
             if( indxMatch ):
                 indx=int(rft.IdLevel2)  # convert base10 to integer
-                rft.printVerbose(4,"setPowerLimit: Indx={}".format(indx))
+                rft.printVerboseFmt(4,"setPowerLimit: Indx={}",indx)
             else:
                 rft.printErr("Error: setPowerLimit: invalid PowerControl index: {}".format(rft.IdLevel2))
                 rft.printErr("Chassis setPowerLimit [current] [-i<indx>] --<indx> is integer 0 - 99 (default is 0)")
@@ -645,7 +632,7 @@ class RfChassisOperations():
         powerControlArray[indx]=powerLimitRes
         patchData["PowerControl"]=powerControlArray
         
-        rft.printVerbose(4,"setPowerLimit: patchData: {}".format(json.dumps(patchData)))
+        rft.printVerboseFmt(4,"setPowerLimit: patchData: {}",json.dumps(patchData))
 
         #call the generic patch command to send the patch.  This takes care of etag support
         rc,r,j,d=rft.patchResource(rft, r, patchData)
@@ -663,7 +650,7 @@ class RfChassisOperations():
 
     
     def getLogService(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,":{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,":{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the Chassis resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -745,12 +732,12 @@ class RfChassisOperations():
 
     
     def clearLog(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         return(8,None,False,None)
 
     
     def getSensors(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         sys.stdout.write("%-50s %-10s %-10s\n" % ("Sensor", "Reading", "UpperCritical"))
         resName="Thermal"
@@ -811,7 +798,7 @@ class RfChassisOperations():
 
 
     def examples(self,sc,op,rft,cmdTop=False,prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print(" {} -r<ip> Chassis                          # shows the Chassis collection".format(rft.program))
         print(" {} -r<ip> Chassis list                     # lists Id, Uri, AssetTag for all Chassis".format(rft.program))
         print(" {} -r<ip> Chassis -I <id>                  # gets the Chassis with Id=<d>".format(rft.program))
@@ -108,11 +108,11 @@ class RfManagersMain():
             "examples":                     op.examples
         }
 
-        rft.printVerbose(5,"Managers:runOperation: operation: {}".format(self.operation))
-        rft.printVerbose(5,"Managers:runOperation: args:  {}".format(self.args))
+        rft.printVerboseFmt(5,"Managers:runOperation: operation: {}",self.operation)
+        rft.printVerboseFmt(5,"Managers:runOperation: args:  {}",self.args)
             
         if self.operation in operationTable:
-            rft.printVerbose(5,"Managers:runOperation: found Oper: {} in table. executing".format(rft.subcommand))
+            rft.printVerboseFmt(5,"Managers:runOperation: found Oper: {} in table. executing",rft.subcommand)
             rc,r,j,d=operationTable[self.operation](self, op, rft, cmdTop=True)
             return(rc,r,j,d)
         
@@ -123,7 +123,7 @@ class RfManagersMain():
 
 
     def ManagersMain(self,rft,cmdTop=False):
-        rft.printVerbose(4,"ManagersMain:  subcommand: {}".format(rft.subcommand))
+        rft.printVerboseFmt(4,"ManagersMain:  subcommand: {}",rft.subcommand)
         
         if( rft.help ):
             self.displayHelp(rft)
@@ -147,7 +147,7 @@ class RfManagersMain():
             self.args = args[1:]        # now args points to the 1st argument
             self.argnum =len(self.args)
             
-        rft.printVerbose(5,"Managers: operation={}, args={}".format(self.operation,self.args))
+        rft.printVerboseFmt(5,"Managers: operation={}, args={}",self.operation,self.args)
                 
         # check if the command requires a collection member target -I|-M|-L|-1|-F eg sysIdoptn
         nonIdCommands=["collection", "list", "examples", "hello"]
@@ -160,7 +160,7 @@ class RfManagersMain():
         rc,r,j,d = self.runOperation(rft)
                 
         if(rc !=0 ):
-            rft.printVerbose(5,"Managers: operation returned with error: rc={}".format(rc))
+            rft.printVerboseFmt(5,"Managers: operation returned with error: rc={}",rc)
             return(rc,r,False,None)
         
         #else, if here, the subcommand executed without error.  Return with 0 exit code
@@ -179,12 +179,12 @@ class RfManagersOperations():
 
     def hello(self,sc,op,rft,cmdTop=False):
         rft.printVerbose(4,"in hello")
-        rft.printVerbose(4,"   subcmd:{}, operation:{}, args:{}".format(rft.subcommand,sc.operation,sc.args))
+        rft.printVerboseFmt(4,"   subcmd:{}, operation:{}, args:{}",rft.subcommand,sc.operation,sc.args)
         print("hello world from Managers")
         return(0,None,False,None)
 
     def getCollection(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in getCollection".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in getCollection",rft.subcommand,sc.operation)
         
         # 1st get serviceRoot
         svcRoot=RfServiceRoot()
@@ -201,7 +201,7 @@ class RfManagersOperations():
             rft.printErr("Error: service root does not have a Managers link")
             return(4)
         
-        rft.printVerbose(4,"Managers:getCollection: link is: {}".format(systemsLink))
+        rft.printVerboseFmt(4,"Managers:getCollection: link is: {}",systemsLink)
 
 
         # if a -a option was entered with "Managers" or "Managers collection" operation,
@@ -226,7 +226,7 @@ class RfManagersOperations():
 
 
     def get(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
         # getCollection
         rc,r,j,d=op.getCollection(sc,op, rft)
@@ -256,7 +256,7 @@ class RfManagersOperations():
 
 
     def list(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
         # getCollection
         collName="Managers"
@@ -270,7 +270,7 @@ class RfManagersOperations():
 
 
     def patch(self,sc,op,rft,cmdTop=False, prop=None, patchData=None, r=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         # verify we have got an argument which is the patch structure
         # its in form '{ "AssetTag": <val>, "IndicatorLed": <val> }'
         ##print("patchData: {}".format(patchData))
@@ -306,7 +306,7 @@ class RfManagersOperations():
         #     ...reset <resetType>
         #   where <resetType> is a subset of Redfish defined redfish resetType values
         #   and will be validated against the allowable values read from the remote service
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
         # get the resetType from args
         validResetTypes=["On","ForceOff","GracefulShutdown","ForceRestart","Nmi","GracefulRestart",
@@ -369,7 +369,7 @@ class RfManagersOperations():
 
     # setDateTime -- command to set the Managers time--and timezone
     def setDateTime(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         propName="DateTime"
         # get the target dateTime from args
@@ -383,7 +383,7 @@ class RfManagersOperations():
             dateMatch=re.search(datePattern,sc.args[1])  # sc.args[1]=<dateTimeString>
             if( dateMatch ):
                 dateTimeString=(sc.args[1])  # keep it a string
-                rft.printVerbose(4,"setDateTime: dateTime={}".format(dateTimeString))
+                rft.printVerboseFmt(4,"setDateTime: dateTime={}",dateTimeString)
             else:
                 rft.printErr("Error:   setDateTime: invalid <dateTime> value specified: {}".format(sc.args[1]))
                 rft.printErr("Managers setDateTime <dateTimeString> # eg: YYYY-MM-DDThh:mm:ss[+/-]hh:ss")
@@ -410,7 +410,7 @@ class RfManagersOperations():
 
     # setTimeOffset  -- command to change the Managers timezone offset (w/o changing time)
     def setTimeOffset(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         propName="DateTimeLocalOffset"
         # get the target offset from args
@@ -424,7 +424,7 @@ class RfManagersOperations():
             dateMatch=re.search(datePattern,sc.args[1])  # sc.args[1]=<timeOffset>
             if( dateMatch ):
                 timeOffsetString=dateMatch.group(1) # keep it a string. <timeOffsetString>
-                rft.printVerbose(4,"setDateTime: timeOffset={}".format(timeOffsetString))
+                rft.printVerboseFmt(4,"setDateTime: timeOffset={}",timeOffsetString)
             else:
                 rft.printErr("Error:   setTimeOffset: invalid <timeOffset> value specified: {}".format(sc.args[1]))
                 rft.printErr("Managers setTimeOffset offset=<timeOffset> # eg: where <timeOffset>=[+/-]hh:ss")
@@ -449,7 +449,7 @@ class RfManagersOperations():
 
 
     def getNetworkProtocol(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the Manager resource first
         rc,r,j,d=op.get(sc,op, rft)     
@@ -474,13 +474,13 @@ class RfManagersOperations():
 
     # setIpAddress  -- command to set the IP address of the MC
     def setIpAddress(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print("Not Implemented Yet")
         return(6,None,False,None)
 
     
     def getEnetInterfaces(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the Manager resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -545,7 +545,7 @@ class RfManagersOperations():
 
 
     def getSerialInterfaces(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the Manager resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -610,7 +610,7 @@ class RfManagersOperations():
 
     
     def getLogService(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,":{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,":{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the Manager resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -692,13 +692,13 @@ class RfManagersOperations():
 
     
     def clearLog(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print("NOT IMPLEMENTED YET")
         return(8,None,False,None)
 
       
     def examples(self,sc,op,rft,cmdTop=False,prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print(" {} -r<ip>                           # shows the Managers collection".format(rft.program))
         print(" {} -r<ip> Managers list                     # lists Id, Uri, AssetTag for all Managers".format(rft.program))
         print(" {} -r<ip> Managers -I <id>                  # gets the Manager with Id=<d>".format(rft.program))
@@ -10,7 +10,6 @@
 #  - getOdataServiceDocument    GET /redfish/v1/odata
 #  - getOdataMetadataDocument   GET /redfish/v1/$metadata
 #
-import requests
 import json
 from urllib.parse import urljoin, urlparse, urlunparse
 
@@ -27,15 +26,16 @@ class RfServiceRoot:
             print(" {} {} -r<rhost> [-vh]   -- get serviceRoot resource".format(rft.program,rft.subcommand))
             return(0,None,False,None)
         
-        # execute GET /redfish  to negotiate protocol version and get root path
-        # rootPath is stored in rft.rootPath
-        rc,r,j,d=rft.getVersionsAndSetRootPath(rft)
-        if( rc!=0): return(rc,r,j,d)
-        #
         if cmdTop is True:  prop=rft.prop
 
-        # get root service.  if -P prop, showproperty
-        rc,r,j,d=rft.rftSendRecvRequest(rft.UNAUTHENTICATED_API, 'GET', rft.rootUri, relPath=rft.rootPath,prop=prop)
+        with rft.traceSpan("discovery"):
+            # execute GET /redfish  to negotiate protocol version and get root path
+            # rootPath is stored in rft.rootPath
+            rc,r,j,d=rft.getVersionsAndSetRootPath(rft)
+            if( rc!=0): return(rc,r,j,d)
+
+            # get root service.  if -P prop, showproperty
+            rc,r,j,d=rft.rftSendRecvRequest(rft.UNAUTHENTICATED_API, 'GET', rft.rootUri, relPath=rft.rootPath,prop=prop)
 
         #save the rootService response.  The transport may need it later to get link to session and login
         rft.rootResponseDict=d
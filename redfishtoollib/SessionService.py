@@ -21,6 +21,7 @@
 #  - Sessions - get Sessions collection, Session instance, list Sessions, get all Sessions
 #  - login - Session login (post to add a new session)
 #  - logout - Session logout (delete to delete a session)
+#  - flushCache - logout the session saved by --session-cache for rhost and user, and delete it from the cache
 #  - examples --prints some example apis
 #
 from   .redfishtoolTransport  import RfTransport
@@ -61,6 +62,8 @@ class RfSessionServiceMain():
         print("                                   the user is -u<user>, password is -p<password>")
         print("     logout                    -- logout or delete the session by identified by -i<SessionId> or -l<link>")
         print("                                   where <link> is the session path returned in Location from login")
+        print("     flushCache                -- logout the session saved by --session-cache for -r<rhost> -u<user>")
+        print("                                   and delete it from the session cache")
         print("     examples                  -- example commands with syntax")
         print("     hello                     -- Systems hello -- debug command")
         return(0)
@@ -78,15 +81,16 @@ class RfSessionServiceMain():
             "Sessions":                     op.getSessions,
             "login":                        op.sessionLogin,
             "logout":                       op.sessionLogout,
+            "flushCache":                   op.flushSessionCache,
             "hello":                        op.hello,
             "examples":                     op.examples
         }
 
-        rft.printVerbose(5,"SessionService:runOperation: operation: {}".format(self.operation))
-        rft.printVerbose(5,"SessionService:runOperation: args:  {}".format(self.args))
+        rft.printVerboseFmt(5,"SessionService:runOperation: operation: {}",self.operation)
+        rft.printVerboseFmt(5,"SessionService:runOperation: args:  {}",self.args)
             
         if self.operation in operationTable:
-            rft.printVerbose(5,"SessionService:runOperation: found Oper: {} in table. executing".format(rft.subcommand))
+            rft.printVerboseFmt(5,"SessionService:runOperation: found Oper: {} in table. executing",rft.subcommand)
             rc,r,j,d=operationTable[self.operation](self, op, rft, cmdTop=True)
             return(rc,r,j,d)
         
@@ -97,7 +101,7 @@ class RfSessionServiceMain():
 
 
     def SessionServiceMain(self,rft,cmdTop=False):
-        rft.printVerbose(4,"SessionServiceMain:  subcommand: {}".format(rft.subcommand))
+        rft.printVerboseFmt(4,"SessionServiceMain:  subcommand: {}",rft.subcommand)
         
         if( rft.help ):
             self.displayHelp(rft)
@@ -117,13 +121,13 @@ class RfSessionServiceMain():
             self.args = args[1:]        # now args points to the 1st argument
             self.argnum =len(self.args)
             
-        rft.printVerbose(5,"SessionService: operation={}, args={}".format(self.operation,self.args))
+        rft.printVerboseFmt(5,"SessionService: operation={}, args={}",self.operation,self.args)
                           
         # now execute the operation.
         rc,r,j,d = self.runOperation(rft)
                 
         if(rc !=0 ):
-            rft.printVerbose(5,"SessionService: operation returned with error: rc={}".format(rc))
+            rft.printVerboseFmt(5,"SessionService: operation returned with error: rc={}",rc)
             return(rc,r,False,None)
         
         #else, if here, the subcommand executed without error.  Return with 0 exit code
@@ -142,14 +146,14 @@ class RfSessionServiceOperations():
 
     def hello(self,sc,op,rft,cmdTop=False):
         rft.printVerbose(4,"in hello")
-        rft.printVerbose(4,"   subcmd:{}, operation:{}, args:{}".format(rft.subcommand,sc.operation,sc.args))
+        rft.printVerboseFmt(4,"   subcmd:{}, operation:{}, args:{}",rft.subcommand,sc.operation,sc.args)
         print("hello world from SessionService")
         return(0,None,False,None)
 
 
 
     def get(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # 1st get serviceRoot
         svcRoot=RfServiceRoot()
@@ -166,7 +170,7 @@ class RfSessionServiceOperations():
             rft.printErr("Error:  root does not have a SessionService link")
             return(4)
         
-        rft.printVerbose(4,"SessionService: get SessionService: link is: {}".format(sessionServiceLink))
+        rft.printVerboseFmt(4,"SessionService: get SessionService: link is: {}",sessionServiceLink)
       
         if cmdTop is True:   prop=rft.prop
               
@@ -179,7 +183,7 @@ class RfSessionServiceOperations():
 
     
     def patch(self,sc,op,rft,cmdTop=False, prop=None, patchData=None, r=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         # verify we have got an argument which is the patch structure
         # its in form '{ "AssetTag": <val>, "IndicatorLed": <val> }'
         ##print("patchData: {}".format(patchData))
@@ -214,7 +218,7 @@ class RfSessionServiceOperations():
 
         
     def setSessionTimeout(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         propName="SessionTimeout"
         
@@ -244,7 +248,7 @@ class RfSessionServiceOperations():
 
 
     def getSessions(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation: getSessions collection".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation: getSessions collection",rft.subcommand,sc.operation)
 
         # get the system resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -311,7 +315,7 @@ class RfSessionServiceOperations():
 
     #SessionService -u <username> -p <passwd> login,  returns authToken and sessionId
     def sessionLogin(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         #note that <username> and <password> were passed-in in -u and -p options and are stores in
         # rft.user and rft.password
@@ -336,7 +340,7 @@ class RfSessionServiceOperations():
 
     #SessionService -t<token> logout [-i<sessionId>|-l<sessionLink>],   returns 204 no content
     def sessionLogout(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         if( (rft.linkLevel2 is None) and( rft.IdLevel2 is None) ):
             rft.printErr("Error, logout:  no sessionId or sessionLink specified")
@@ -375,14 +379,41 @@ class RfSessionServiceOperations():
             rft.printErr("Error: Logout: the session delete failed")
             return(rc,r,j,d)
         else:
-            rft.printVerbose(1," SessionLogout successful".format(skip1=True, printV12=cmdTop))
+            rft.printVerbose(1," SessionLogout successful", skip1=True, printV12=cmdTop)
             return(rc,r,j,d)
 
 
+
+    #SessionService -r<rhost> -u<user> flushCache,  logout the session cached by --session-cache and forget it
+    def flushSessionCache(self,sc,op,rft,cmdTop=False, prop=None):
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
+
+        if( rft.loadCachedSession(rft) is False ):
+            rft.printVerbose(1," SessionService: flushCache: no cached session for user {} on {}".format(rft.user,rft.rhost))
+            return(0,None,False,None)
+        # don't login again if the cached session was already deleted or expired--there is nothing to logout
+        rft.sessionFromCache=False
+
+        # 1st get serviceRoot
+        svcRoot=RfServiceRoot()
+        rc,r,j,d = svcRoot.getServiceRoot(rft)
+        if( rc != 0 ):
+            rft.printErr("SessionService: flushCache: Error getting service root, aborting")
+            return(rc,r,False,None)
+
+        rc,r,j,d=rft.rfSessionDelete(rft)
+        # forget the session even if the delete failed, eg because the session had already expired
+        rft.dropCachedSession(rft)
+        if(rc!=0):
+            rft.printErr("Error: flushCache: the cached session was removed from the cache, but the session delete failed")
+            return(rc,r,j,d)
+        rft.printVerbose(1," SessionService: flushCache: cached session logged out", skip1=True, printV12=cmdTop)
+        return(rc,r,j,d)
+
     
       
     def examples(self,sc,op,rft,cmdTop=False,prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print(" {} -r<ip> SessionService                   # gets the sessionService".format(rft.program))
         print(" {} -r<ip> SessionService setSessionTimeout <timeout> # sets the session timeout property".format(rft.program))
         print(" {} -r<ip> SessionService Sessions             # gets Sessions collection".format(rft.program))
@@ -391,6 +422,7 @@ class RfSessionServiceOperations():
         print(" {} -r<ip> SessionService patch {{A: B,C: D,...}} # patch the json-formatted {{prop: value...}} data to the sessionService object".format(rft.program))
         print(" {} -r<ip> SessionService login <usernm> <passwd> # login (create session)".format(rft.program))
         print(" {} -r<ip> SessionService logout <sessionId>      # logout (delete session <sessId>".format(rft.program))
+        print(" {} -r<ip> SessionService flushCache              # logout the session saved by --session-cache".format(rft.program))
         return(0,None,False,None)
 
 
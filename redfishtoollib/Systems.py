@@ -115,11 +115,11 @@ class RfSystemsMain():
             "examples":                     op.examples
         }
 
-        rft.printVerbose(5,"Systems:runOperation: operation: {}".format(self.operation))
-        rft.printVerbose(5,"Systems:runOperation: args:  {}".format(self.args))
+        rft.printVerboseFmt(5,"Systems:runOperation: operation: {}",self.operation)
+        rft.printVerboseFmt(5,"Systems:runOperation: args:  {}",self.args)
             
         if self.operation in operationTable:
-            rft.printVerbose(5,"Systems:runOperation: found Oper: {} in table. executing".format(rft.subcommand))
+            rft.printVerboseFmt(5,"Systems:runOperation: found Oper: {} in table. executing",rft.subcommand)
             rc,r,j,d=operationTable[self.operation](self, op, rft, cmdTop=True)
             return(rc,r,j,d)
         
@@ -130,7 +130,7 @@ class RfSystemsMain():
 
 
     def SystemsMain(self,rft,cmdTop=False):
-        rft.printVerbose(4,"SystemsMain:  subcommand: {}".format(rft.subcommand))
+        rft.printVerboseFmt(4,"SystemsMain:  subcommand: {}",rft.subcommand)
         
         if( rft.help ):
             self.displayHelp(rft)
@@ -154,7 +154,7 @@ class RfSystemsMain():
             self.args = args[1:]        # now args points to the 1st argument
             self.argnum =len(self.args)
             
-        rft.printVerbose(5,"Systems: operation={}, args={}".format(self.operation,self.args))
+        rft.printVerboseFmt(5,"Systems: operation={}, args={}",self.operation,self.args)
                 
         # check if the command requires a collection member target -I|-M|-L|-1|-F eg sysIdoptn
         nonIdCommands = ["collection", "list", "examples", "hello"]
@@ -167,7 +167,7 @@ class RfSystemsMain():
         rc,r,j,d = self.runOperation(rft)
                 
         if(rc !=0 ):
-            rft.printVerbose(5,"Systems: operation returned with error: rc={}".format(rc))
+            rft.printVerboseFmt(5,"Systems: operation returned with error: rc={}",rc)
             return(rc,r,False,None)
         
         #else, if here, the subcommand executed without error.  Return with 0 exit code
@@ -186,12 +186,12 @@ class RfSystemsOperations():
 
     def hello(self,sc,op,rft,cmdTop=False):
         rft.printVerbose(4,"in hello")
-        rft.printVerbose(4,"   subcmd:{}, operation:{}, args:{}".format(rft.subcommand,sc.operation,sc.args))
+        rft.printVerboseFmt(4,"   subcmd:{}, operation:{}, args:{}",rft.subcommand,sc.operation,sc.args)
         print("hello world from Systems")
         return(0,None,False,None)
     
     def getCollection(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in getCollection".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in getCollection",rft.subcommand,sc.operation)
         
         # 1st get serviceRoot
         svcRoot=RfServiceRoot()
@@ -209,7 +209,7 @@ class RfSystemsOperations():
             rft.printErr("Error: service root does not have a Systems link")
             return(4)
         
-        rft.printVerbose(4,"Systems:getCollection: link is: {}".format(systemsLink))
+        rft.printVerboseFmt(4,"Systems:getCollection: link is: {}",systemsLink)
 
 
         # if a -a option was entered with "Systems" or "Systems collection" operation,
@@ -234,17 +234,22 @@ class RfSystemsOperations():
 
 
     def get(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
-        # getCollection
-        rc,r,j,d=op.getCollection(sc,op, rft)
-        if( rc != 0):  return(rc,r,False,None)
-        collUrl=r.url
+        # -a runs the operation on each member with -L <member link> and the url of the collection it already read
+        if( (rft.collectionUrl is not None) and (rft.Link is not None) ):
+            collUrl=rft.collectionUrl
+            sysPath,r=rft.Link,None
+        else:
+            # getCollection
+            rc,r,j,d=op.getCollection(sc,op, rft)
+            if( rc != 0):  return(rc,r,False,None)
+            collUrl=r.url
 
-        # search collection to find path to system
-        sysPath,rc,r,j,d=rft.getPathBy(rft, r, d)
-        if( rc !=0 ):    #if a path was not found, its an error
-            return(rc,r,j,d)
+            # search collection to find path to system
+            sysPath,rc,r,j,d=rft.getPathBy(rft, r, d)
+            if( rc !=0 ):    #if a path was not found, its an error
+                return(rc,r,j,d)
         
         rft.printVerbose(4,"SystemsOperations:get: got a path, now get entries")
         
@@ -264,7 +269,7 @@ class RfSystemsOperations():
 
 
     def list(self,sc,op,rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
         # getCollection
         collName="Systems"
@@ -282,49 +287,31 @@ class RfSystemsOperations():
         if rft.allOptn:
             # Issue command to all systems in collection
 
-            # get the list of systems
-            rc, r, j, d = op.list(sc, op, rft, cmdTop=cmdTop, prop=prop)
+            # get the links of the systems from the collection
+            rc, r, j, d = op.getCollection(sc, op, rft)
             if rc != 0 or not j or d is None or not isinstance(d, dict) or 'Members' not in d:
                 rft.printErr("Unable to get list of Systems; return code = {}, list data = {}".format(rc, d))
                 return rc, r, j, d
-
-            # save existing rft options
-            saved_allOptn = rft.allOptn
-            saved_Link = rft.Link
-            saved_gotIdOptn = rft.gotIdOptn
-            saved_IdOptnCount = rft.IdOptnCount
-
-            # set rft options to process a single item
-            rft.allOptn = False
-            rft.gotIdOptn = True
-            rft.IdOptnCount = 1
-
-            # iterate through systems and run operation on each based on the link (@odata.id value)
-            members = d.get('Members')
-            rc, r, j, d = 8, None, False, None
-            for member in members:
+            links = []
+            for member in d.get('Members'):
                 if '@odata.id' in member:
-                    link = member.get('@odata.id')
-                    # set rft.Link to point to the target system
-                    rft.Link = link
-                    # perform the operation
-                    rc, r, j, d = run_single(sc, op, rft, cmdTop=cmdTop, prop=prop)
+                    links.append(member.get('@odata.id'))
                 else:
                     rft.printErr("No '@odata.id' found in system member: {}".format(member))
+            if not links:
+                rft.printErr("No Systems found in the collection")
+                return 8, None, False, None
 
-            # restore existing rft options
-            rft.allOptn = saved_allOptn
-            rft.Link = saved_Link
-            rft.gotIdOptn = saved_gotIdOptn
-            rft.IdOptnCount = saved_IdOptnCount
-            return rc, r, j, d
+            # run the operation on each system concurrently (up to --max-inflight at a time), each in its own
+            # call context selecting the system with its link (@odata.id value).  returns the result of each system
+            return rft.runOnMembers(rft, r.url, links, lambda: run_single(sc, op, rft, cmdTop=cmdTop, prop=prop))
         else:
             # Issue command to single specified system
             return run_single(sc, op, rft, cmdTop=cmdTop, prop=prop)
 
 
     def patch_single(self,sc,op,rft,cmdTop=False, prop=None, patchData=None, r=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         # verify we have got an argument which is the patch structure
         # its in form '{ "AssetTag": <val>, "IndicatorLed": <val> }'
         ##print("patchData: {}".format(patchData))
@@ -366,7 +353,7 @@ class RfSystemsOperations():
         #     ...reset <resetType>
         #   where <resetType> is a subset of Redfish defined redfish resetType values
         #   and will be validated against the allowable values read from the remote service
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
         # get the resetType from args
         validResetTypes=["On","ForceOff","GracefulShutdown","ForceRestart","Nmi","GracefulRestart",
@@ -433,7 +420,7 @@ class RfSystemsOperations():
 
 
     def setAssetTag_single(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         propName="AssetTag"
         
@@ -466,7 +453,7 @@ class RfSystemsOperations():
 
 
     def setIndicatorLed_single(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         propName="IndicatorLED"
         
@@ -511,7 +498,7 @@ class RfSystemsOperations():
         #          ...setBootOverride Continuous <targetVal>
         #          ...setBootOverride Disabled
         #   where TargetValue is subset of Redfish defined targets supported by rhost
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         
         # get the next boot value from args
         validTargetVals=("None","Pxe","Floppy","Cd","Usb","Hdd",
@@ -609,7 +596,7 @@ class RfSystemsOperations():
 
 
     def getProcessors(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation: getProcessorColl".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation: getProcessorColl",rft.subcommand,sc.operation)
 
         # get the system resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -673,7 +660,7 @@ class RfSystemsOperations():
 
 
     def getInventory(self,sc,op, rft, cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation: getInventory".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation: getInventory",rft.subcommand,sc.operation)
 
         sys.stdout.write("%-20s %2s %-20s %2s %-10s\n" % ("Component","|","Present","|","Functional"))
         # Get Processor and Memory Inventory
@@ -739,7 +726,7 @@ class RfSystemsOperations():
 
     
     def getEnetInterfaces(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the system resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -804,7 +791,7 @@ class RfSystemsOperations():
 
 
     def getSimpleStorage(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the system resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -869,7 +856,7 @@ class RfSystemsOperations():
 
     
     def getLogService(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,":{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,":{}:{}: in operation",rft.subcommand,sc.operation)
 
         # get the system resource
         rc,r,j,d=op.get(sc,op, rft)     
@@ -951,12 +938,12 @@ class RfSystemsOperations():
 
     
     def clearLog(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         return(8,None,False,None)
 
       
     def examples(self,sc,op,rft,cmdTop=False,prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print(" {} -r<ip> Systems                          # shows the systems collection".format(rft.program))
         print(" {} -r<ip> Systems list                     # lists Id, Uri, AssetTag for all systems".format(rft.program))
         print(" {} -r<ip> Systems -I <id>                  # gets the system with Id=<d>".format(rft.program))
@@ -97,11 +97,11 @@ class RfRawMain():
             "examples":             op.examples
         }
 
-        rft.printVerbose(5,"raw: runOperation: operation: {}".format(self.operation))
-        rft.printVerbose(5,"raw:runOperation:  args:  {}".format(self.args))
+        rft.printVerboseFmt(5,"raw: runOperation: operation: {}",self.operation)
+        rft.printVerboseFmt(5,"raw:runOperation:  args:  {}",self.args)
             
         if self.operation in operationTable:
-            rft.printVerbose(5,"raw:runOperation: found Oper: {} in table. executing".format(rft.subcommand))
+            rft.printVerboseFmt(5,"raw:runOperation: found Oper: {} in table. executing",rft.subcommand)
             rc,r,j,d=operationTable[self.operation](self, op, rft, cmdTop=True)
             return(rc,r,j,d)
         
@@ -112,7 +112,7 @@ class RfRawMain():
 
 
     def RawMain(self,rft,cmdTop=False):
-        rft.printVerbose(4,"RawMain:  subcommand: {}".format(rft.subcommand))
+        rft.printVerboseFmt(4,"RawMain:  subcommand: {}",rft.subcommand)
         
         if( rft.help ):
             self.displayHelp(rft)
@@ -139,14 +139,14 @@ class RfRawMain():
         self.args = args[1:]        # now args points to the 1st argument
         self.argnum =len(self.args)
             
-        rft.printVerbose(5,"raw: operation={}, args={}".format(self.operation,self.args))
+        rft.printVerboseFmt(5,"raw: operation={}, args={}",self.operation,self.args)
                 
            
         # now execute the operation.
         rc,r,j,d = self.runOperation(rft)
                 
         if(rc !=0 ):
-            rft.printVerbose(5,"raw: operation returned with error: rc={}".format(rc))
+            rft.printVerboseFmt(5,"raw: operation returned with error: rc={}",rc)
             return(rc,r,False,None)
         
         #else, if here, the subcommand executed without error.  Return with 0 exit code
@@ -175,18 +175,18 @@ class RfRawOperations():
                              
     def hello(self,sc,op,rft,cmdTop=False):
         rft.printVerbose(4,"in hello")
-        rft.printVerbose(4,"   subcmd:{}, operation:{}, args:{}".format(rft.subcommand,sc.operation,sc.args))
+        rft.printVerboseFmt(4,"   subcmd:{}, operation:{}, args:{}",rft.subcommand,sc.operation,sc.args)
         print("hello world from raw subcommand")
         return(0,None,False,None)
 
     
     def httpGet(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in raw".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in raw",rft.subcommand,sc.operation)
         
         # we verified that we had two args in RawMain(), so we can just read the <uri> arg here
         path=sc.args[1]
         method="GET"
-        rft.printVerbose(4,"raw: GET: method:{} path:{}".format(method,path))
+        rft.printVerboseFmt(4,"raw: GET: method:{} path:{}",method,path)
 
         apiType=self.getApiType(rft,path)   # UNAUTHENTICATED API or Authenticated API
 
@@ -207,12 +207,12 @@ class RfRawOperations():
             return(rc,r,False,None)
 
     def httpHead(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in raw".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in raw",rft.subcommand,sc.operation)
         
         # we verified that we had two args in RawMain(), so we can just read the <uri> arg here
         path=sc.args[1]
         method="HEAD"
-        rft.printVerbose(4,"raw: HEAD: method:{} path:{}".format(method,path))
+        rft.printVerboseFmt(4,"raw: HEAD: method:{} path:{}",method,path)
 
         apiType=self.getApiType(rft,path)   # UNAUTHENTICATED API or Authenticated API
         
@@ -233,7 +233,7 @@ class RfRawOperations():
     
 
     def httpPatch(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in raw".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in raw",rft.subcommand,sc.operation)
 
         # load patch data--verify its good json
         #  get the patchData from rft.requestData  readin on commandline via: -d <patchData>
@@ -248,7 +248,7 @@ class RfRawOperations():
         # we verified that we had two args in RawMain(), so we can just read the <uri> arg here
         path=sc.args[1]
         method="PATCH"
-        rft.printVerbose(4,"raw: PATCH: method:{} path:{}".format(method,path))
+        rft.printVerboseFmt(4,"raw: PATCH: method:{} path:{}",method,path)
 
         apiType=self.getApiType(rft,path)   # UNAUTHENTICATED API or Authenticated API
 
@@ -271,7 +271,7 @@ class RfRawOperations():
 
 
     def httpPost(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in raw".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in raw",rft.subcommand,sc.operation)
 
         # load post data--verify its good json
         #  get the postData from rft.requestData  readin on commandline via: -d <patchData>
@@ -285,7 +285,7 @@ class RfRawOperations():
         # we verified that we had two args in RawMain(), so we can just read the <uri> arg here
         path=sc.args[1]
         method="POST"
-        rft.printVerbose(4,"raw: POST: method:{} path:{}".format(method,path))
+        rft.printVerboseFmt(4,"raw: POST: method:{} path:{}",method,path)
 
         apiType=self.getApiType(rft,path)   # UNAUTHENTICATED API or Authenticated API
 
@@ -308,7 +308,7 @@ class RfRawOperations():
 
 
     def httpPut(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in raw".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in raw",rft.subcommand,sc.operation)
 
         # load put data--verify its good json
         #  get the postData from rft.requestData  readin on commandline via: -d <patchData>
@@ -322,7 +322,7 @@ class RfRawOperations():
         # we verified that we had two args in RawMain(), so we can just read the <uri> arg here
         path=sc.args[1]
         method="PUT"
-        rft.printVerbose(4,"raw: POST: method:{} path:{}".format(method,path))
+        rft.printVerboseFmt(4,"raw: POST: method:{} path:{}",method,path)
 
         apiType=self.getApiType(rft,path)   # UNAUTHENTICATED API or Authenticated API
 
@@ -345,12 +345,12 @@ class RfRawOperations():
 
 
     def httpDelete(self,sc,op,rft,cmdTop=False, prop=None):
-        rft.printVerbose(4,"{}:{}: in raw".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in raw",rft.subcommand,sc.operation)
 
         # we verified that we had two args in RawMain(), so we can just read the <uri> arg here
         path=sc.args[1]
         method="DELETE"
-        rft.printVerbose(4,"raw: DELETE: method:{} path:{}".format(method,path))
+        rft.printVerboseFmt(4,"raw: DELETE: method:{} path:{}",method,path)
 
         apiType=self.getApiType(rft,path)   # UNAUTHENTICATED API or Authenticated API
 
@@ -371,7 +371,7 @@ class RfRawOperations():
     
       
     def examples(self,sc,op,rft,cmdTop=False,prop=None):
-        rft.printVerbose(4,"{}:{}: in operation".format(rft.subcommand,sc.operation))
+        rft.printVerboseFmt(4,"{}:{}: in operation",rft.subcommand,sc.operation)
         print(" {} -r<ip> raw GET /redfish/v1/   # returns the root collection".format(rft.program))
 
         return(0,None,False,None)
@@ -0,0 +1,215 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolAgent.py
+#
+# Contents:
+# 1. Class RfAgentHost -- the warm transport state the agent keeps for one rhost and set of credentials
+# 2. Class RfAgent -- a long running redfishtool process that runs commands sent to it over a unix socket
+#  - redfishtool --agent-serve [--agent-socket=<path>]   runs the agent in the foreground until it is killed.
+#       When killed (SIGTERM or ^C), it logs out the sessions it created and removes the socket
+#  - redfishtool --agent [--agent-socket=<path>] <options> <subcommand> ...   sends the command to the agent,
+#       and prints its output and exits with its exit code, the same as running the command directly.
+#       If no agent is running, the command is run directly
+#  - the agent keeps the connection pool, session login and discovery of each rhost between commands.
+#       Commands to the same rhost with the same credentials run one at a time, commands to different hosts
+#       run concurrently.  A host that has not been used for agentIdleTimeout seconds is logged out and
+#       rediscovered on its next command
+#  - default socket: $XDG_RUNTIME_DIR/redfishtool/agent.sock, or ~/.cache/redfishtool/agent.sock
+#       the socket is only accessible by the user.  File names in the commands (eg -c <cfgFile>) are opened
+#       by the agent, so use absolute paths
+#  - the client sends one json line {"argv": [...]}, and the agent answers one json line
+#       {"rc": <exitCode>, "stdout": <text>, "stderr": <text>}
+#
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import threading
+import socketserver
+from .redfishtoolFleet import RfThreadOutput
+from .redfishtoolCache import defaultCacheDir
+
+
+class RfAgentHost():
+    def __init__(self):
+        self.rft=None
+        self.lastUsed=None
+        self.lock=threading.Lock()
+
+
+class RfAgentRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request=json.loads(self.rfile.readline())
+            argv=request["argv"]
+        except (ValueError, KeyError, TypeError):
+            return
+        response=self.server.agent.runRequest(argv)
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class RfAgent():
+    def __init__(self, parseCommand=None, runCommand=None):
+        self.parseCommand=parseCommand     # parseCommand(argv) returns a transport with the command parsed into it
+        self.runCommand=runCommand         # runCommand(rft, cleanup) runs it and returns the exit code
+        self.hosts=dict()
+        self.hostsLock=threading.Lock()
+
+    # return the unix socket path: --agent-socket=<path>, or the default
+    @staticmethod
+    def getSocketPath(rft):
+        if( rft.agentSocket is not None ):
+            return(rft.agentSocket)
+        runtimeDir=os.environ.get("XDG_RUNTIME_DIR")
+        if( runtimeDir ):
+            return(os.path.join(runtimeDir, "redfishtool", "agent.sock"))
+        return(os.path.join(defaultCacheDir(), "agent.sock"))
+
+    # send the command in argv to the agent, print its output, and return its exit code.
+    # returns None if no agent is running, so the caller runs the command itself
+    @staticmethod
+    def runClient(rft, argv):
+        if( not hasattr(socket, "AF_UNIX") ):
+            return(None)
+        socketPath=RfAgent.getSocketPath(rft)
+        try:
+            sock=socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(socketPath)
+        except OSError:
+            rft.printVerboseFmt(4,"Agent: no agent at {}. running the command directly",socketPath)
+            return(None)
+        try:
+            with sock, sock.makefile("rwb") as f:
+                f.write((json.dumps({"argv": list(argv)}) + "\n").encode("utf-8"))
+                f.flush()
+                response=json.loads(f.readline())
+        except (OSError, ValueError) as e:
+            rft.printErr("Error: agent at {} failed: {}".format(socketPath, e))
+            return(5)
+        sys.stdout.write(response["stdout"])
+        sys.stdout.flush()
+        sys.stderr.write(response["stderr"])
+        sys.stderr.flush()
+        return(response["rc"])
+
+    # run the agent until it is killed.  returns the exit code
+    def serve(self, rft):
+        if( not hasattr(socket, "AF_UNIX") ):
+            rft.printErr("Error: --agent-serve needs unix domain sockets, which are not supported on this platform")
+            return(1)
+        socketPath=RfAgent.getSocketPath(rft)
+        try:
+            os.makedirs(os.path.dirname(socketPath), mode=0o700, exist_ok=True)
+            # remove the socket of an agent that is no longer running
+            if( os.path.exists(socketPath) ):
+                if( RfAgent.isAgentRunning(socketPath) ):
+                    rft.printErr("Error: an agent is already running at {}".format(socketPath))
+                    return(1)
+                os.unlink(socketPath)
+            oldUmask=os.umask(0o077)
+            try:
+                server=socketserver.ThreadingUnixStreamServer(socketPath, RfAgentRequestHandler)
+            finally:
+                os.umask(oldUmask)
+        except OSError as e:
+            rft.printErr("Error: can't create agent socket {}: {}".format(socketPath, e))
+            return(1)
+        server.daemon_threads=True
+        server.agent=self
+        rft.printVerbose(1,"Agent: listening on {}".format(socketPath))
+
+        # capture the output of each command in its own handler thread
+        stdout=sys.stdout
+        stderr=sys.stderr
+        sys.stdout=RfThreadOutput(stdout)
+        sys.stderr=RfThreadOutput(stderr)
+        # kill (SIGTERM) stops the agent like ^C, so it logs out its sessions and removes the socket
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            sys.stdout=stdout
+            sys.stderr=stderr
+            try:
+                os.unlink(socketPath)
+            except OSError:
+                pass
+            self.closeHosts()
+        return(0)
+
+    @staticmethod
+    def isAgentRunning(socketPath):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(socketPath)
+            return(True)
+        except OSError:
+            return(False)
+
+    # run one command for a client, and return its response
+    def runRequest(self, argv):
+        sys.stdout.startCapture()
+        sys.stderr.startCapture()
+        try:
+            rc=self.runAgentCommand(argv)
+        except SystemExit as e:    # option syntax error, -h, -V
+            rc=e.code if isinstance(e.code,int) else 1
+        except Exception as e:
+            print("   redfishtool: Error: {}: {}".format(type(e).__name__, e), file=sys.stderr)
+            rc=5
+        return({"rc": rc, "stdout": sys.stdout.stopCapture(), "stderr": sys.stderr.stopCapture()})
+
+    # run the command using the warm state of its rhost.  the new transport then holds the state for the next command
+    def runAgentCommand(self, argv):
+        rft=self.parseCommand(argv)
+        key=(rft.rhost, rft.user, rft.password, rft.auth, rft.token, rft.secure, rft.protocolVer)
+        with self.hostsLock:
+            host=self.hosts.get(key)
+            if( host is None ):
+                host=RfAgentHost()
+                self.hosts[key]=host
+
+        with host.lock:
+            if( (host.rft is not None) and (time.time() - host.lastUsed > rft.agentIdleTimeout) ):
+                rft.printVerboseFmt(4,"Agent: {} idle for more than {} sec. logging out",rft.rhost,rft.agentIdleTimeout)
+                self.closeHost(host)
+            if( host.rft is not None ):
+                rft.inheritTransportState(host.rft)
+            try:
+                rc=self.runCommand(rft, cleanup=False)
+                if( rft.trace is not None ):
+                    rft.trace.write(rft, rc)
+            finally:
+                # a session the agent created may expire while the agent holds it: login again if rhost returns 401
+                if( (rft.authToken is not None) and (rft.token is None) ):
+                    rft.reloginOn401=True
+                host.rft=rft
+                host.lastUsed=time.time()
+        return(rc)
+
+    # logout the session of a host and close its connections
+    def closeHost(self, host):
+        rft=host.rft
+        host.rft=None
+        if( rft is None ):
+            return(0)
+        rft.rfCleanup(rft)
+        rft.closeHttpSession()
+        rft.closeDiscoveryCache(0)
+        return(0)
+
+    def closeHosts(self):
+        with self.hostsLock:
+            hosts=list(self.hosts.values())
+            self.hosts=dict()
+        for host in hosts:
+            with host.lock:
+                self.closeHost(host)
+        return(0)
@@ -0,0 +1,92 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolBatch.py
+#
+# Contents:
+# 1. Class RfBatch -- runs the redfishtool commands in a file (--batch <file>) or stdin (--batch -) in one process
+#  - each line is the options and subcommand of one command, eg:  -I 1 Systems setBootOverride Once Pxe
+#       parsed with the same option grammar as the commandline, after the options on the commandline.
+#       blank lines and lines starting with # are ignored
+#  - the commands run one at a time, in order.  Commands to the same rhost with the same credentials share one
+#       connection pool, one session login (logged out at the end of the batch), and one discovery of rhost.
+#       The GET memo is not shared, so each command reads the current state of the resources it uses
+#  - prints one json record per command, as it completes:
+#       {"line": <lineNum>, "command": <line>, "rc": <exitCode>, "elapsed": <sec>, "data": <json output>, "errors": <stderr>}
+#  - the exit code is 0 if all commands succeeded, otherwise the largest exit code of any command
+#
+import io
+import sys
+import json
+import time
+import shlex
+import contextlib
+from .redfishtoolFleet import addOutputToRecord
+
+
+class RfBatch():
+    def __init__(self):
+        self.lineNum=0
+
+    # open the batch file (stdin if --batch -).  returns None if it can't be opened
+    def openBatchFile(self, rft):
+        if( rft.batchFile == "-" ):
+            f=sys.stdin
+        else:
+            try:
+                f=open(rft.batchFile, "r")
+            except OSError as e:
+                rft.printErr("Error: can't read batch file: {}: {}".format(rft.batchFile, e))
+                return(None)
+        return(f)
+
+    # run each command in the batch file.  runLine(lineArgv) parses and runs one command, and returns its rc.
+    # rft holds the state shared by the commands.  returns the exit code
+    def runBatch(self, rft, runLine):
+        f=self.openBatchFile(rft)
+        if( f is None ):
+            return(1)
+
+        batchRc=0
+        try:
+            for line in f:
+                self.lineNum+=1
+                line=line.strip()
+                if( (not line) or line.startswith("#") ):
+                    continue
+                record=self.runBatchLine(rft, runLine, line)
+                batchRc=max(batchRc, record["rc"])
+                print(json.dumps(record))
+                sys.stdout.flush()
+        finally:
+            if( f is not sys.stdin ):
+                f.close()
+
+            # logout the session the batch created, close the connection pool, and save the discovery cache
+            with rft.traceSpan("cleanup"):
+                rft.rfCleanup(rft)
+                rft.closeHttpSession()
+                rft.closeDiscoveryCache(batchRc)
+        return(batchRc)
+
+    # run one command, capturing its output, and return its record
+    def runBatchLine(self, rft, runLine, line):
+        output=io.StringIO()
+        errors=io.StringIO()
+        t1=time.time()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+            try:
+                rc=runLine(shlex.split(line))
+            except ValueError as e:    # shlex error, eg unbalanced quotes
+                rft.printErr("Error: batch line {}: {}".format(self.lineNum, e))
+                rc=1
+            except SystemExit as e:    # option syntax error
+                rc=e.code if isinstance(e.code,int) else 1
+            except Exception as e:
+                rft.printErr("Error: {}: {}".format(type(e).__name__, e))
+                rc=5
+        elapsed=time.time()-t1
+
+        record={"line": self.lineNum, "command": line, "rc": rc, "elapsed": round(elapsed,3)}
+        return(addOutputToRecord(record, output.getvalue(), errors.getvalue()))
@@ -0,0 +1,190 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolCache.py
+#
+# Contents:
+# 1. defaultCacheDir, cacheFilePath, writePrivateFile, readPrivateFile -- where and how the cache files are written
+# 2. Class RfCachedResponse -- stands in for a requests Response read from the discovery cache
+# 3. Class RfDiscoveryCache -- on-disk cache of the discovery responses for one rhost and user
+#  - the cached responses are: GET /redfish (versions), the service root, and the top-level collections
+#       linked from the service root (eg /redfish/v1/Systems).  The transport decides what to cache.
+#  - enabled with --cache-ttl=<sec>.  Responses older than <sec> are not used
+#  - one file per rhost and user in --cache-dir=<dir>,  default: $XDG_CACHE_HOME/redfishtool or ~/.cache/redfishtool
+#         files are created with mode 0600 in a 0700 directory
+#  - get, put -- read or add a cached response for a url
+#  - save -- write the cache file if anything was added.  called by main at end of a successful command
+#  - invalidate -- delete the cache file.  called by main if the command failed, so the next command rediscovers
+# 4. Class RfSessionCache -- on-disk cache of the Session login (X-Auth-Token, session link) for one rhost and user
+#  - enabled with --session-cache.  The session is not deleted at the end of the command, so later commands reuse it
+#  - the file has a salted hash of the user and password, so a command with another password does not reuse it
+#  - load, save, remove -- read, write, or delete the cached session
+#
+import os
+import json
+import time
+import threading
+
+
+# return the default cache directory:  $XDG_CACHE_HOME/redfishtool  or ~/.cache/redfishtool
+def defaultCacheDir():
+    cacheHome=os.environ.get("XDG_CACHE_HOME")
+    if( not cacheHome ):
+        cacheHome=os.path.join(os.path.expanduser("~"), ".cache")
+    return(os.path.join(cacheHome, "redfishtool"))
+
+
+# return the path of the cache file for key (eg "<user>@<rhost>").  The key is hashed so it is a safe file name
+def cacheFilePath(cacheDir, key, suffix):
+    import hashlib
+    keyHash=hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return(os.path.join(cacheDir, keyHash + suffix))
+
+
+# write data as json to path, readable only by the user.  The file is written to a temp file, then renamed over
+# the old one so that concurrent redfishtool commands never read a partial file
+# returns 0 if ok, 5 if the file could not be written
+def writePrivateFile(path, data):
+    tmpFile="{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd=os.open(tmpFile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmpFile, path)
+    except OSError:
+        try:
+            os.unlink(tmpFile)
+        except OSError:
+            pass
+        return(5)
+    return(0)
+
+
+# read a json file written by writePrivateFile.  returns None if it is missing or corrupt
+def readPrivateFile(path):
+    try:
+        with open(path, "r") as f:
+            return(json.load(f))
+    except (OSError, ValueError):
+        return(None)
+
+
+class RfCachedRequest():
+    def __init__(self, method, url):
+        self.method=method
+        self.url=url
+        self.headers={}
+        self.body=None
+
+
+class RfCachedResponse():
+    def __init__(self, entry):
+        from requests.structures import CaseInsensitiveDict
+        self.url=entry["url"]
+        self.status_code=entry["status_code"]
+        self.headers=CaseInsensitiveDict(entry["headers"])
+        self.text=entry["text"]
+        self.content=self.text.encode("utf-8")
+        self.encoding="utf-8"
+        self.request=RfCachedRequest("GET", entry["url"])
+        self.fromCache=True
+
+    def json(self):
+        return(json.loads(self.text))
+
+
+class RfDiscoveryCache():
+    def __init__(self, cacheDir, ttl, rhost, user):
+        self.ttl=ttl
+        self.key="{}@{}".format(user,rhost)
+        self.cacheFile=cacheFilePath(cacheDir, self.key, ".json")
+        self.entries=dict()
+        self.dirty=False
+        self.lock=threading.Lock()
+        self.load()
+
+    # read the cache file.  a missing, unreadable, or corrupt file, or one for a different rhost/user, is an empty cache
+    def load(self):
+        cache=readPrivateFile(self.cacheFile)
+        if( (not isinstance(cache,dict)) or (cache.get("key") != self.key) or (not isinstance(cache.get("entries"),dict)) ):
+            return
+        now=time.time()
+        for url,entry in cache["entries"].items():
+            if( isinstance(entry,dict) and (now - entry.get("time",0) <= self.ttl) ):
+                self.entries[url]=entry
+
+    # return a RfCachedResponse for url, or None if it is not cached or has expired
+    def get(self, url):
+        with self.lock:
+            entry=self.entries.get(url)
+        if( (entry is None) or (time.time() - entry["time"] > self.ttl) ):
+            return(None)
+        return(RfCachedResponse(entry))
+
+    # add the response r to a GET of url
+    def put(self, url, r):
+        entry={"time": time.time(), "url": r.url, "status_code": r.status_code,
+               "headers": dict(r.headers), "text": r.text}
+        with self.lock:
+            self.entries[url]=entry
+            self.dirty=True
+
+    # write the cache file if anything was added
+    def save(self):
+        with self.lock:
+            if( not self.dirty ):
+                return(0)
+            cache={"key": self.key, "entries": dict(self.entries)}
+            self.dirty=False
+        return(writePrivateFile(self.cacheFile, cache))
+
+    # delete all cached responses for this rhost and user
+    def invalidate(self):
+        with self.lock:
+            self.entries=dict()
+            self.dirty=False
+        try:
+            os.unlink(self.cacheFile)
+        except OSError:
+            pass
+        return(0)
+
+
+class RfSessionCache():
+    def __init__(self, cacheDir, rhost, user, password=None):
+        self.key="{}@{}".format(user,rhost)
+        self.password=password
+        self.cacheFile=cacheFilePath(cacheDir, self.key, ".session")
+
+    # return the hash of the credentials of this command with salt
+    def credentialsHash(self, salt):
+        import hashlib
+        return(hashlib.sha256("{}:{}:{}".format(salt, self.key, self.password or "").encode("utf-8")).hexdigest())
+
+    # return dict {"X-Auth-Token", "SessionId", "SessionLocation"} of the cached session, or None
+    # None if the session was saved by a command with another password
+    def load(self):
+        import hmac
+        session=readPrivateFile(self.cacheFile)
+        if( (not isinstance(session,dict)) or (session.get("key") != self.key) or
+            (not session.get("X-Auth-Token")) or (not session.get("SessionLocation")) or
+            (not session.get("salt")) or (not isinstance(session.get("credentials"),str)) ):
+            return(None)
+        if( not hmac.compare_digest(session["credentials"], self.credentialsHash(session["salt"])) ):
+            return(None)
+        return(session)
+
+    def save(self, authToken, sessionId, sessionLink):
+        salt=os.urandom(16).hex()
+        session={"key": self.key, "salt": salt, "credentials": self.credentialsHash(salt),
+                 "X-Auth-Token": authToken, "SessionId": sessionId, "SessionLocation": sessionLink}
+        return(writePrivateFile(self.cacheFile, session))
+
+    def remove(self):
+        try:
+            os.unlink(self.cacheFile)
+        except OSError:
+            pass
+        return(0)
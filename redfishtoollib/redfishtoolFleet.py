@@ -0,0 +1,198 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolFleet.py
+#
+# Contents:
+# 1. addOutputToRecord -- adds a command's output to its json result record.  also used by --batch
+# 2. Class RfThreadOutput -- replaces sys.stdout or sys.stderr so that the output of each thread can be captured
+#       separately.  Output from a thread that is not capturing is written to the original stream
+#  - getOutputCapture, inheritOutputCapture -- worker threads started by a command write to the capture of the
+#       thread that started them
+# 3. Class RfFleet -- runs one redfishtool command against many hosts in one process
+#  - used if -r specifies a list of hosts:   -r <host1>,<host2>,...   or   -r @<hostsFile>
+#       <hostsFile> has one host per line.  blank lines and lines starting with # are ignored
+#  - each host is run in a worker thread (--fleet-workers=<num>, default 16) with its own transport object, so
+#       each host has its own connection pool, session, and caches
+#  - the output of each host is a json record:
+#       {"rhost": <host>, "rc": <exitCode>, "elapsed": <sec>, "data": <json output>, "errors": <stderr text>}
+#       "output": <text> is returned instead of "data" if the output is not json (eg -v, or $metadata xml)
+#  - --fleet-output=ndjson (default) prints one record per line as each host completes.
+#       --fleet-output=json prints a json list of all records, in hosts order, when all hosts complete
+#  - the exit code is 0 if the command succeeded on all hosts, otherwise the largest exit code of any host
+#
+import io
+import sys
+import json
+import time
+import threading
+import contextlib
+
+
+# add the stdout and stderr text of a command to its result record:
+#   "data": <output parsed as json>,  or "output": <text> if it is not json,  and "errors": <stderr text>
+def addOutputToRecord(record, output, errors):
+    if( output.strip() ):
+        try:
+            record["data"]=json.loads(output)
+        except ValueError:
+            record["output"]=output
+    if( errors ):
+        record["errors"]=errors
+    return(record)
+
+
+class RfThreadOutput():
+    def __init__(self, stream):
+        self.stream=stream
+        self.local=threading.local()
+
+    # start capturing the output of the calling thread
+    def startCapture(self):
+        self.local.buffer=io.StringIO()
+
+    # stop capturing the output of the calling thread, and return what it wrote
+    def stopCapture(self):
+        buffer=getattr(self.local,"buffer",None)
+        self.local.buffer=None
+        if( buffer is None ):
+            return("")
+        return(buffer.getvalue())
+
+    # the capture buffer of the calling thread, or None if it is not capturing
+    def getCapture(self):
+        return(getattr(self.local,"buffer",None))
+
+    # make the calling thread write to buffer (the capture of another thread), or to the original stream if None
+    def setCapture(self, buffer):
+        self.local.buffer=buffer
+
+    def write(self, data):
+        buffer=getattr(self.local,"buffer",None)
+        if( buffer is not None ):
+            return(buffer.write(data))
+        return(self.stream.write(data))
+
+    def flush(self):
+        if( getattr(self.local,"buffer",None) is None ):
+            self.stream.flush()
+
+    def isatty(self):
+        if( getattr(self.local,"buffer",None) is not None ):
+            return(False)
+        return(self.stream.isatty())
+
+    def __getattr__(self, name):
+        return(getattr(self.stream, name))
+
+
+# return the output captures of the calling thread: the capture buffers of sys.stdout and sys.stderr.
+#   A thread that starts worker threads for a command passes them to the workers with inheritOutputCapture()
+def getOutputCapture():
+    return(tuple(stream.getCapture() if isinstance(stream, RfThreadOutput) else None
+                 for stream in (sys.stdout, sys.stderr)))
+
+# context manager run by a worker thread so its output goes to capture, the output captures of the thread that
+#   started it (see getOutputCapture).  The per-member reads and -a operations of a fleet host or an agent
+#   command then go to the output of that host or command, not to the fleet's stdout
+@contextlib.contextmanager
+def inheritOutputCapture(capture):
+    streams=[(stream,buffer) for stream,buffer in zip((sys.stdout, sys.stderr), capture)
+             if isinstance(stream, RfThreadOutput)]
+    saved=[stream.getCapture() for stream,buffer in streams]
+    for stream,buffer in streams:
+        stream.setCapture(buffer)
+    try:
+        yield
+    finally:
+        for (stream,buffer),savedBuffer in zip(streams,saved):
+            stream.setCapture(savedBuffer)
+
+
+class RfFleet():
+    def __init__(self):
+        self.stdout=None
+        self.stderr=None
+
+    # True if the -r <rhost> option is a list of hosts
+    @staticmethod
+    def isFleetRhost(rhost):
+        return( (rhost is not None) and ( rhost.startswith("@") or ("," in rhost) ) )
+
+    # return the list of hosts in -r <host1>,<host2>...  or in the file -r @<hostsFile>.  None if error
+    def readFleetHosts(self, rft, rhost):
+        if( rhost.startswith("@") ):
+            hostsFile=rhost[1:]
+            try:
+                with open(hostsFile, "r") as f:
+                    lines=f.read().splitlines()
+            except OSError as e:
+                rft.printErr("Error: can't read hosts file: {}: {}".format(hostsFile, e))
+                return(None)
+            hosts=list()
+            for line in lines:
+                line=line.strip()
+                if( line and (not line.startswith("#")) ):
+                    hosts.append(line.split()[0])
+        else:
+            hosts=[host.strip() for host in rhost.split(",") if host.strip()]
+        if( not hosts ):
+            rft.printErr("Error: no hosts specified in -r {}".format(rhost))
+            return(None)
+        return(hosts)
+
+    # run the command against every host in rft.rhost.  runHost(rhost) runs the command for one host, returns the rc
+    # returns the exit code:  0 if all hosts returned 0, otherwise the largest rc
+    def runFleet(self, rft, runHost):
+        hosts=self.readFleetHosts(rft, rft.rhost)
+        if( hosts is None ):
+            return(1)
+        rft.printVerboseFmt(4,"Fleet: running {} on {} hosts with {} workers",rft.subcommand,len(hosts),rft.fleetWorkers)
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        # capture the stdout and stderr of each host's worker thread
+        self.stdout=sys.stdout
+        self.stderr=sys.stderr
+        sys.stdout=RfThreadOutput(self.stdout)
+        sys.stderr=RfThreadOutput(self.stderr)
+        records=[None]*len(hosts)
+        executor=ThreadPoolExecutor(max_workers=min(rft.fleetWorkers, len(hosts)))
+        try:
+            futures={executor.submit(self.runFleetHost, runHost, host): i for i,host in enumerate(hosts)}
+            for future in as_completed(futures):
+                record=future.result()
+                records[futures[future]]=record
+                if( rft.fleetOutput == "ndjson" ):
+                    self.stdout.write(json.dumps(record) + "\n")
+                    self.stdout.flush()
+        finally:
+            executor.shutdown(wait=True)
+            sys.stdout=self.stdout
+            sys.stderr=self.stderr
+
+        if( rft.fleetOutput == "json" ):
+            print(json.dumps(records, indent=4))
+            sys.stdout.flush()
+
+        rcs=[record["rc"] for record in records]
+        return(max(rcs))
+
+    # run the command for one host in this worker thread, and return its record
+    def runFleetHost(self, runHost, rhost):
+        sys.stdout.startCapture()
+        sys.stderr.startCapture()
+        t1=time.time()
+        try:
+            rc=runHost(rhost)
+        except SystemExit as e:
+            rc=e.code if isinstance(e.code,int) else 1
+        except Exception as e:
+            print("   redfishtool: Error: {}: {}".format(type(e).__name__, e), file=sys.stderr)
+            rc=5
+        elapsed=time.time()-t1
+        output=sys.stdout.stopCapture()
+        errors=sys.stderr.stopCapture()
+
+        record={"rhost": rhost, "rc": rc, "elapsed": round(elapsed,3)}
+        return(addOutputToRecord(record, output, errors))
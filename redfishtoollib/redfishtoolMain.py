@@ -7,9 +7,18 @@
 # contains:
 #  - functions called for usage:
 #     -- displayUsage, displayOptions, listSubcommands, displayHelp
-#  - Main routine, with argc/argv option parsing, and valid argument/option checking
-#    after parsing options, runs cmd with runSubCmd function, outputs result, cleansup sessions created
-#  - runSubCmd -- Main subcommand command table and subcommand execution
+#  - Main routine:  parses options, then runs the command (or runs it against each host of a fleet -r <hostList>)
+#  - parseOptions -- argc/argv option parsing, and valid argument/option checking
+#  - runCommand -- runs cmd with runSubCmd function, outputs result, cleansup sessions created. returns exit code
+#  - runHostCommand -- parses and runs the command with its own transport against one host of a fleet
+#  - runBatchCommand, runSharedCommand -- parses and runs one command of a --batch file, sharing the batch transport state
+#  - getBatchLineArgv -- the commandline options that are parsed before the options of each --batch line
+#  - writeTrace -- writes the --trace file at the end of the command, fleet, or batch
+#  - runProfiled -- runs the command, fleet, or batch with the --profile=cpu|mem profiler on
+#  - importCommandModules -- imports the lazily imported modules before --profile starts the profiler
+#  - parseCommand -- parses a command sent to the --agent-serve agent into a new transport
+#  - runSubCmd -- subcommand execution. subcommand modules are imported when run
+#  - getSubCmdTable -- Main subcommand command table
 #  - hello subcommand for testing
 #  - help  subcommand
 #  - about subcommand for info about this version of redfishtool
@@ -18,15 +27,9 @@ import sys
 import getopt
 import re
 import json
-import os
+import importlib
 from .redfishtoolTransport   import RfTransport
-from .ServiceRoot import RfServiceRoot
-from .Systems import RfSystemsMain
-from .Chassis import RfChassisMain
-from .Managers import RfManagersMain
-from .SessionService import RfSessionServiceMain
-from .AccountService import RfAccountServiceMain
-from .raw import RfRawMain
+from .redfishtoolFleet import RfFleet
 
 def displayUsage(rft,*argv,**kwargs):
         rft.printErr("  Usage:",noprog=True)
@@ -42,13 +45,15 @@ def displayOptions(rft):
         print("                              -v(header), -vv(+addl info), -vvv(Request trace), -vvvv(+subCmd dbg), -vvvvv(max dbg)")
         print("   -s,          --status            -- status level, can repeat up to 5 times for more status output")
         print("                               -s(http_status), ")
-        print("                               -ss(+r.url, +r.elapsed executionTime ), ")
+        print("                               -ss(+r.url, +r.elapsed executionTime, +connect/tls/send/ttfb/body times ), ")
         print("                               -sss(+request hdrs,data,authType, +response status_code, +response executionTime, ")
         print("                                    +login auth token/sessId/sessUri)")
         print("                               -ssss(+response headers), -sssss(+response data")
         print("   -u <user>,   --user=<usernm>     -- username used for remote redfish authentication")
         print("   -p <passwd>, --password=<passwd> -- password used for remote redfish authentication")
         print("   -r <rhost>,  --rhost=<rhost>     -- remote redfish service hostname or IP:port")
+        print("                                       or a list of hosts: <rhost1>,<rhost2>,...  or @<hostsFile> with one host per line")
+        print("                                       to run the command against each host. See --fleet-workers, --fleet-output")
         print("   -t <token>,  --token=<token>     -- redfish auth session token-for sessions across multiple calls")
         print("   -q,          --quiet             -- quiet mode--suppress error, warning, and diagnostic messages")
         print("   -c <cfgFile>,--config=<cfgFile>  -- read options (including credentials) from file <cfgFile>")
@@ -66,6 +71,8 @@ def displayOptions(rft):
         print("   -F,  --First                     -- Use the 1st link returned in the collection or 1st \"matching\" link if used with -M")
         print("   -1,  --One                       -- Use the single link returned in the collection. Return error if more than one member exists")
         print("   -a,  --all                       -- Returns all members if the operation is a Get on a top-level collection like Systems")
+        print("                                    --   For Systems and Chassis reset, patch, setAssetTag, setIndicatorLed, setPowerLimit: runs the")
+        print("                                    --   operation on all members, up to --max-inflight at a time, and returns the rc of each member")
         print("   -L <Link>,  --Link=<Link>        -- Use <Link> (eg /redfish/v1/Systems/1) to reference the collection member. ")
         print("                                    --   If <Link> is not one of the links in the collection, and error is returned.")
         print("  Options to specify 2nd-level collection members: eg: Systems -I<sysId> Processors -i<procId>")
@@ -90,6 +97,41 @@ def displayOptions(rft):
         print("   -n,        --no-proxy            -- Ignore any PROXY environment variables.")
         print("   -H <hdrs>, --Headers=<hdrs>      -- Specify the request header list--overrides defaults. Format \"{ A:B, C:D...}\" ")
         print("   -D <flag>,  --Debug=<flag>       -- Flag for dev debug. <flag> is a 32-bit uint: 0x<hex> or <dec> format")
+        print("                --pool-size=<num>   -- max number of keep-alive connections pooled for each host.  Default=10")
+        print("                --pool-idle-timeout=<sec> -- reconnect instead of reusing pooled connections idle > <sec>. Default=15")
+        print("                --max-inflight=<num> -- max concurrent requests to rhost when reading collection members, and")
+        print("                                    --   max members an -a operation runs on at a time. Default=4")
+        print("                --max-pages=<num>   -- max number of pages read from a paged collection (nextLink). Default: no limit")
+        print("                --no-compression    -- don't ask rhost for gzip/deflate compressed responses")
+        print("                --cache-ttl=<sec>   -- cache /redfish, the service root and top-level collections on disk for <sec>")
+        print("                                       seconds, and reuse them in later commands to the same rhost. Default=0 (no cache)")
+        print("                --cache-dir=<dir>   -- directory for the cache files. Default: $XDG_CACHE_HOME/redfishtool or ~/.cache/redfishtool")
+        print("                --fleet-workers=<num> -- max number of hosts in a -r <hostList> run concurrently. Default=16")
+        print("                --fleet-output=<fmt> -- output of -r <hostList>: ndjson (a json record per line as each host completes)")
+        print("                                       or json (a list of records in host order). Default=ndjson")
+        print("                --batch=<file>      -- run the command (options and subcommand) on each line of <file>, or stdin if")
+        print("                                       <file> is -, sharing one connection and session. prints a json record per line")
+        print("                                       the commandline options apply to each line, except --trace and --profile")
+        print("                                       which apply to the whole batch")
+        print("                --session-cache     -- with -A Session, save the session login and reuse it in later commands to the same")
+        print("                                       rhost and user. Logout with: SessionService flushCache")
+        print("                --agent-serve       -- run as an agent that keeps the connections, session and discovery of each rhost")
+        print("                                       and runs the commands sent to it by --agent, until it is killed")
+        print("                --agent             -- send the command to the running agent. runs it directly if there is no agent")
+        print("                --agent-socket=<path> -- unix socket of the agent. Default: $XDG_RUNTIME_DIR/redfishtool/agent.sock")
+        print("                                       or ~/.cache/redfishtool/agent.sock")
+        print("                --agent-idle-timeout=<sec> -- agent logs out of an rhost not used for <sec> seconds. Default=600")
+        print("                --stats             -- at the end of the command, write a json summary of the http requests it sent")
+        print("                                       to stderr: count by method and status, latency p50/p95/max, bytes, retries...")
+        print("                --stats-file=<file> -- append the json summary of the http requests to <file>, one line per command")
+        print("                --trace=<file>      -- write the timeline of the command: spans for discovery, login, resolution,")
+        print("                                       operation, cleanup and each http request, in Chrome trace json format")
+        print("                                       (open in https://ui.perfetto.dev or chrome://tracing)")
+        print("                --profile=<mode>    -- profile the command. cpu: write a cProfile pstats file and print the functions")
+        print("                                       with the most cumulative time. mem: print the peak memory and the lines that")
+        print("                                       allocated the most memory (tracemalloc). to stderr")
+        print("                --profile-file=<file> -- cpu: the pstats file. Default: redfishtool.pstats. mem: also write the")
+        print("                                       tracemalloc snapshot to <file>")
         print("")
         
 def listSubcommands(rft):
@@ -123,14 +165,167 @@ def main(argv):
     #instantiate transport object which initializes default options
     rft=RfTransport()
 
+    # parse the options and subcommand into rft.  exits if there is a syntax error, or for -V, -h
+    parseOptions(rft, argv)
+
+    # if --agent-serve, run the commands sent by --agent clients until killed.  see redfishtoolAgent.py
+    if( rft.agentServe is True ):
+        from .redfishtoolAgent import RfAgent
+        agent=RfAgent(parseCommand, runCommand)
+        rc=agent.serve(rft)
+        sys.exit(rc)
+
+    # if --agent, let the running agent run the command with its warm session.  run it here if there is no agent
+    # a --profile command is run here, so that it is the command that is profiled
+    if( (rft.agentClient is True) and (rft.batchFile is None) and (not RfFleet.isFleetRhost(rft.rhost))
+            and (rft.profile is None) ):
+        from .redfishtoolAgent import RfAgent
+        rc=RfAgent.runClient(rft, argv)
+        if( rc is not None ):
+            sys.exit(rc)
+
+    # if --batch <file>, run each command in the file, sharing rft's connection pool and session.  see redfishtoolBatch.py
+    if( rft.batchFile is not None ):
+        if( RfFleet.isFleetRhost(rft.rhost) ):
+            rft.printErr("Error: --batch can't be used with a -r <hostList>")
+            sys.exit(1)
+        from .redfishtoolBatch import RfBatch
+        batch=RfBatch()
+        batchArgv=getBatchLineArgv(argv)
+        rc=runProfiled(rft, lambda: batch.runBatch(rft, lambda lineArgv: runBatchCommand(rft, batchArgv + lineArgv)))
+        writeTrace(rft, rc)
+        sys.exit(rc)
+
+    # if -r <host1>,<host2>,...  or  -r @<hostsFile>,  run the command against every host.  see redfishtoolFleet.py
+    if( RfFleet.isFleetRhost(rft.rhost) ):
+        fleet=RfFleet()
+        rc=runProfiled(rft, lambda: fleet.runFleet(rft, lambda rhost: runHostCommand(argv, rhost, rft.trace, rft.profile)))
+        writeTrace(rft, rc)
+        sys.exit(rc)
+
+    rc=runProfiled(rft, lambda: runCommand(rft))
+    writeTrace(rft, rc)
+    sys.exit(rc)
+
+
+# --trace: write the timeline of the command.  The hosts of a fleet, and the commands of a batch, share one trace
+def writeTrace(rft, rc):
+    if( rft.trace is None ):
+        return(0)
+    return(rft.trace.write(rft, rc))
+
+
+# --profile: run the command with the profiler on, and report.  run is called with no args and returns the exit code
+def runProfiled(rft, run):
+    if( rft.profile is None ):
+        return(run())
+    importCommandModules(rft)
+    return(rft.profile.run(rft, run))
+
+
+# --profile: import the modules that the command imports on first use (requests, urllib3, the subcommand modules...)
+# before the profiler is started, so the profile shows the command instead of the one-time imports
+def importCommandModules(rft):
+    import netrc
+    import ipaddress
+    import concurrent.futures
+    import requests
+    import requests.utils
+    import urllib3.exceptions
+    from . import redfishtoolTiming
+    for subCmd in getSubCmdTable(rft).values():
+        if( isinstance(subCmd,tuple) ):
+            importlib.import_module(subCmd[0], __package__)
+    return(0)
+
+
+# parse the command in argv into a new transport, and return it.  used by the agent to parse each command it is sent
+def parseCommand(argv):
+    rft=RfTransport()
+    parseOptions(rft, argv)
+    return(rft)
+
+
+# run the command in argv against rhost with its own transport.  used to run one host of a fleet command
+# trace and profile are the --trace and --profile of the fleet, or None
+def runHostCommand(argv, rhost, trace=None, profile=None):
+    rft=RfTransport()
+    parseOptions(rft, argv)
+    rft.rhost=rhost
+    rft.trace=trace
+    rft.profile=profile
+    with rft.traceSpan("host", rhost=rhost):
+        return(runCommand(rft))
+
+
+# run one command of a --batch.  argv is the commandline options (see getBatchLineArgv) followed by the options and
+# subcommand of the line.
+# If the command goes to the batch rhost with the batch credentials, it reuses batchRft's pool, session and discovery,
+# and gives them back when done.  Otherwise it runs like a separate command
+def runBatchCommand(batchRft, argv):
+    rft=RfTransport()
+    parseOptions(rft, argv)
+    if( RfFleet.isFleetRhost(rft.rhost) ):
+        rft.printErr("Error: a -r <hostList> can't be used in a --batch command")
+        return(1)
+    rft.trace=batchRft.trace
+    rft.profile=batchRft.profile
+    with rft.traceSpan("batchCommand", subcommand=rft.subcommand, rhost=rft.rhost):
+        return(runSharedCommand(batchRft, rft))
+
+
+# run the command parsed into rft, sharing batchRft's state if it goes to the same rhost with the same credentials
+def runSharedCommand(batchRft, rft):
+    if( not rft.canShareTransportState(batchRft) ):
+        return(runCommand(rft))
+    rft.inheritTransportState(batchRft)
+    try:
+        rc=runCommand(rft, cleanup=False)
+    finally:
+        batchRft.inheritTransportState(rft)
+    return(rc)
+
+
+# the commandline options, in getopt format
+shortOptions="Vhvsqu:p:r:t:c:T:P:d:EI:M:F1L:i:m:l:aW:A:S:R:H:D:CNn"
+longOptions=["Version", "help", "verbose", "status", "quiet", 
+             "user=", "password=", "rhost=", "token=", "config=", "Timeout=",
+             "Prop=", "data=", "Entries", "Id=", "Match=", "First", "One", "Link=",
+             "id=", "match=", "link", "all",
+             "Wait=", "Auth=","Secure=", "RedfishVersion=", "Headers=", "Debug=",
+             "CheckRedfishVersion", "NonBlocking", "no-proxy",
+             "pool-size=", "pool-idle-timeout=", "max-inflight=", "max-pages=", "no-compression",
+             "cache-ttl=", "cache-dir=", "session-cache", "fleet-workers=", "fleet-output=", "batch=",
+             "agent", "agent-serve", "agent-socket=", "agent-idle-timeout=",
+             "stats", "stats-file=", "trace=", "profile=", "profile-file="]
+
+# options that apply to a --batch as a whole.  They are not passed to the command of each line of the batch
+# (--stats and --stats-file are: they write the summary of each command)
+batchOnlyOptions=["--batch", "--trace", "--profile", "--profile-file", "--fleet-workers", "--fleet-output",
+                  "--agent", "--agent-serve", "--agent-socket", "--agent-idle-timeout"]
+
+# return the commandline options in argv without the batchOnlyOptions and the subcommand.  The options of each
+# line of a --batch are parsed after these
+def getBatchLineArgv(argv):
+    opts, args = getopt.gnu_getopt(argv[1:], shortOptions, longOptions)
+    lineArgv=[argv[0]]
+    for opt, arg in opts:
+        if opt in batchOnlyOptions:
+            continue
+        if( opt.startswith("--") ):
+            lineArgv.append(opt + "=" + arg if( opt[2:] + "=" in longOptions ) else opt)
+        elif( shortOptions[shortOptions.index(opt[1]) + 1:].startswith(":") ):
+            lineArgv.extend([opt, arg])
+        else:
+            lineArgv.append(opt)
+    return(lineArgv)
+
+
+# parse the options in argv into the transport object rft, and check for invalid option combinations
+# exits with rc=1 if there is a syntax error.  exits with rc=0 after -V, or -h with no subcommand
+def parseOptions(rft, argv):
     try:
-        opts, args = getopt.gnu_getopt(argv[1:],"Vhvsqu:p:r:t:c:T:P:d:EI:M:F1L:i:m:l:aW:A:S:R:H:D:CNn",
-                        ["Version", "help", "verbose", "status", "quiet", 
-                         "user=", "password=", "rhost=", "token=", "config=", "Timeout=",
-                         "Prop=", "data=", "Entries", "Id=", "Match=", "First", "One", "Link=",
-                         "id=", "match=", "link", "all",
-                         "Wait=", "Auth=","Secure=", "RedfishVersion=", "Headers=", "Debug=",
-                         "CheckRedfishVersion", "NonBlocking", "no-proxy"])
+        opts, args = getopt.gnu_getopt(argv[1:], shortOptions, longOptions)
     except getopt.GetoptError:
         rft.printErr("Error parsing options")
         displayUsage(rft)
@@ -165,7 +360,7 @@ def main(argv):
                 if 'user' in configdata and 'password' in configdata:
                     rft.user = configdata['user']
                     rft.password = configdata['password']
-                    rft.printVerbose(1,"Main: get pw from configfile, usr:{}, pw:{}".format(rft.user, rft.password))
+                    rft.printVerboseFmt(1,"Main: get user and password from configfile, usr:{}",rft.user)
                 else:
                     rft.printErr("Invalid --config= filedata: {}".format(configdata))
             except IOError:
@@ -280,7 +475,7 @@ def main(argv):
             dbgMatch=re.search(dbgPattern,arg)
             if( dbgMatch ):
                 rft.dgbFlag=int(arg,0)
-                rft.printVerbose(4,"Main: Flag=0x{:08x}".format(rft.dbgFlag))
+                rft.printVerboseFmt(4,"Main: Flag=0x{:08x}",rft.dbgFlag)
             else:
                 rft.printErr("Invalid -Flag value: {}".format(arg))
                 rft.printErr("     Expect --Flag=<flag> where <flag> is a decimal int",noprog=True)
@@ -291,6 +486,98 @@ def main(argv):
             rft.blocking=False
         elif opt in ("-n", "--no-proxy"):
             rft.no_proxy = True
+        elif opt == "--pool-size":           #max number of keep-alive connections pooled for each host
+            sizeMatch=re.search("^([1-9][0-9]*)$",arg)
+            if( sizeMatch ):
+                rft.poolSize=int(arg)
+            else:
+                rft.printErr("Invalid --pool-size value: {}".format(arg))
+                rft.printErr("     Expect: --pool-size=<num> where <num> is a decimal int",noprog=True)
+                sys.exit(1)
+        elif opt == "--pool-idle-timeout":   #seconds a pooled connection may be idle before reconnecting
+            idleMatch=re.search("^([0-9]+)$",arg)
+            if( idleMatch ):
+                rft.poolIdleTimeout=int(arg)
+            else:
+                rft.printErr("Invalid --pool-idle-timeout value: {}".format(arg))
+                rft.printErr("     Expect: --pool-idle-timeout=<sec> where <sec> is a decimal int",noprog=True)
+                sys.exit(1)
+        elif opt == "--max-inflight":        #max number of concurrent requests to a host when reading collection members
+            inflightMatch=re.search("^([1-9][0-9]*)$",arg)
+            if( inflightMatch ):
+                rft.maxInflight=int(arg)
+            else:
+                rft.printErr("Invalid --max-inflight value: {}".format(arg))
+                rft.printErr("     Expect: --max-inflight=<num> where <num> is a decimal int",noprog=True)
+                sys.exit(1)
+        elif opt == "--max-pages":           #max number of pages read from a paged collection
+            maxPagesMatch=re.search("^([1-9][0-9]*)$",arg)
+            if( maxPagesMatch ):
+                rft.maxPages=int(arg)
+            else:
+                rft.printErr("Invalid --max-pages value: {}".format(arg))
+                rft.printErr("     Expect: --max-pages=<num> where <num> is a decimal int",noprog=True)
+                sys.exit(1)
+        elif opt == "--no-compression":      #don't ask for compressed responses
+            rft.compression=False
+        elif opt == "--cache-ttl":           #seconds the discovery responses are cached on disk. 0=no cache
+            cacheTtlMatch=re.search("^([0-9]+)$",arg)
+            if( cacheTtlMatch ):
+                rft.cacheTtl=int(arg)
+            else:
+                rft.printErr("Invalid --cache-ttl value: {}".format(arg))
+                rft.printErr("     Expect: --cache-ttl=<sec> where <sec> is a decimal int",noprog=True)
+                sys.exit(1)
+        elif opt == "--cache-dir":           #directory for the discovery cache files
+            rft.cacheDir=arg
+        elif opt == "--session-cache":       #reuse Session logins across commands
+            rft.sessionCache=True
+        elif opt == "--fleet-workers":       #max number of hosts run concurrently for -r <hostList>
+            workersMatch=re.search("^([1-9][0-9]*)$",arg)
+            if( workersMatch ):
+                rft.fleetWorkers=int(arg)
+            else:
+                rft.printErr("Invalid --fleet-workers value: {}".format(arg))
+                rft.printErr("     Expect: --fleet-workers=<num> where <num> is a decimal int",noprog=True)
+                sys.exit(1)
+        elif opt == "--batch":               #run the commands in a file, or stdin if -
+            rft.batchFile=arg
+        elif opt == "--fleet-output":        #output format for -r <hostList>
+            if( arg in ("ndjson", "json") ):
+                rft.fleetOutput=arg
+            else:
+                rft.printErr("Invalid --fleet-output value: {}".format(arg))
+                rft.printErr("     Expect: --fleet-output=ndjson|json",noprog=True)
+                sys.exit(1)
+        elif opt == "--agent":               #send the command to a running agent
+            rft.agentClient=True
+        elif opt == "--agent-serve":         #run as an agent on a unix socket
+            rft.agentServe=True
+        elif opt == "--agent-socket":        #unix socket path of the agent
+            rft.agentSocket=arg
+        elif opt == "--agent-idle-timeout":  #seconds the agent keeps the session of an rhost that is not used
+            agentIdleMatch=re.search("^([1-9][0-9]*)$",arg)
+            if( agentIdleMatch ):
+                rft.agentIdleTimeout=int(arg)
+            else:
+                rft.printErr("Invalid --agent-idle-timeout value: {}".format(arg))
+                rft.printErr("     Expect: --agent-idle-timeout=<sec> where <sec> is a decimal int",noprog=True)
+                sys.exit(1)
+        elif opt == "--stats":               #write request counts and latencies to stderr at end of command
+            rft.statsToStderr=True
+        elif opt == "--stats-file":          #append request counts and latencies to a file at end of command
+            rft.statsFile=arg
+        elif opt == "--trace":               #write the timeline of the command to a trace file
+            rft.traceFile=arg
+        elif opt == "--profile":             #profile the cpu time or memory of the command
+            if( arg in ("cpu", "mem") ):
+                rft.profileMode=arg
+            else:
+                rft.printErr("Invalid --profile value: {}".format(arg))
+                rft.printErr("     Expect: --profile=cpu  or  --profile=mem",noprog=True)
+                sys.exit(1)
+        elif opt == "--profile-file":        #file for the cpu profile or memory snapshot
+            rft.profileFile=arg
         else:
             rft.printErr("Error: Unsupported option: {}".format(opt))
             displayUsage(rft)
@@ -346,7 +633,10 @@ def main(argv):
     #after parsing options (GNU style) args should now be a list of arguments starting with the subcommand
     #if no subcommand at this point, it is a syntax error.
     #otherwise, save the subcommand and subcommand argv array for the subcommand to parse
-    if( not args ):
+    #with --batch <file>, the subcommands are in the file.  with --agent-serve, they are sent by the clients
+    if( (not args) and ((rft.batchFile is not None) or (rft.agentServe is True)) ):
+        pass
+    elif( not args ):
         rft.printErr("Syntax error. No subcommand specified.")
         displayUsage(rft)
         sys.exit(1)
@@ -354,52 +644,81 @@ def main(argv):
         rft.subcommand=args[0]
         rft.subcommandArgv=list(args)
 
-    # disable reading of proxy environment variables for --no-proxy
-    if rft.no_proxy:
-        os.environ['NO_PROXY'] = '*'
-
-    rft.printVerbose(5,"Main: subcmd: {}, subCmdArgs:{}".format(rft.subcommand,rft.subcommandArgv))
-    rft.printVerbose(5,"Main: verbose={}, status={}, user={}, password={}, rhost={}".format(rft.verbose, rft.status,
-                                                        rft.user,rft.password,rft.rhost))
-    rft.printVerbose(5,"Main: token={}, RedfishVersion={}, Auth={}, Timeout={}, NonBlocking={}".format(rft.token,
-                                                        rft.protocolVer, rft.auth, rft.timeout, not rft.blocking))
-    rft.printVerbose(5,"Main: prop={}, Id={}, Match={}:{}, First={}, -1={}, Link={}".format( rft.prop,
-                        rft.Id, rft.matchProp,rft.matchValue, rft.firstOptn, rft.oneOptn, rft.Link))
-    rft.printVerbose(5,"Main: gotIdOptn={}, IdOptnCount={}, gotPropOptn={}, gotMatchOptn={}, gotEntriesOptn={}".format(
-                            rft.gotIdOptn, rft.IdOptnCount, rft.gotPropOptn, rft.gotMatchOptn, rft.gotEntriesOptn))
-    rft.printVerbose(5,"Main: 2nd-Level Collection Member reference options: -i<id>={}, -m<match>={}:{}, -l<link>={} -all={}".format(
-                            rft.IdLevel2, rft.matchLevel2Prop, rft.matchLevel2Value, rft.linkLevel2, rft.allOptn))
-    rft.printVerbose(5,"Main: 2nd-level Collection Member parsing: gotIdLevel2Optn={}, gotMatchLevel2Optn={}, IdLevel2OptnCount={}".format(
-                            rft.gotIdLevel2Optn, rft.gotMatchLevel2Optn, rft.IdLevel2OptnCount ))
-    rft.printVerbose(5,"Main: configFile={}, Secure={}, waitNum:waitTime={}:{}, Degug={:08x}".format(
-                                        rft.configFile,rft.secure, rft.waitNum,rft.waitTime,rft.dbgFlag))
-    rft.printVerbose(5,"Main: Headers={}".format(rft.headers))
+    # start counting requests for --stats, --stats-file
+    if( (rft.statsToStderr is True) or (rft.statsFile is not None) ):
+        from .redfishtoolStats import RfStats
+        rft.stats=RfStats()
+
+    # start recording the timeline of the command for --trace
+    if( rft.traceFile is not None ):
+        from .redfishtoolTrace import RfTrace
+        rft.trace=RfTrace(rft.traceFile)
+
+    # --profile: the profiler is started by main around the command
+    if( rft.profileMode is not None ):
+        from .redfishtoolProfile import RfProfile
+        rft.profile=RfProfile(rft.profileMode, rft.profileFile)
+
+    rft.printVerboseFmt(5,"Main: subcmd: {}, subCmdArgs:{}",rft.subcommand,rft.subcommandArgv)
+    # the password and token are not printed, only whether one was given
+    rft.printVerboseFmt(5,"Main: verbose={}, status={}, user={}, password={}, rhost={}",rft.verbose, rft.status,
+                                                        rft.user,"<set>" if rft.password else None,rft.rhost)
+    rft.printVerboseFmt(5,"Main: token={}, RedfishVersion={}, Auth={}, Timeout={}, NonBlocking={}","<set>" if rft.token else None,
+                                                        rft.protocolVer, rft.auth, rft.timeout, not rft.blocking)
+    rft.printVerboseFmt(5,"Main: prop={}, Id={}, Match={}:{}, First={}, -1={}, Link={}", rft.prop,
+                        rft.Id, rft.matchProp,rft.matchValue, rft.firstOptn, rft.oneOptn, rft.Link)
+    rft.printVerboseFmt(5,"Main: gotIdOptn={}, IdOptnCount={}, gotPropOptn={}, gotMatchOptn={}, gotEntriesOptn={}",
+                            rft.gotIdOptn, rft.IdOptnCount, rft.gotPropOptn, rft.gotMatchOptn, rft.gotEntriesOptn)
+    rft.printVerboseFmt(5,"Main: 2nd-Level Collection Member reference options: -i<id>={}, -m<match>={}:{}, -l<link>={} -all={}",
+                            rft.IdLevel2, rft.matchLevel2Prop, rft.matchLevel2Value, rft.linkLevel2, rft.allOptn)
+    rft.printVerboseFmt(5,"Main: 2nd-level Collection Member parsing: gotIdLevel2Optn={}, gotMatchLevel2Optn={}, IdLevel2OptnCount={}",
+                            rft.gotIdLevel2Optn, rft.gotMatchLevel2Optn, rft.IdLevel2OptnCount )
+    rft.printVerboseFmt(5,"Main: configFile={}, Secure={}, waitNum:waitTime={}:{}, Degug={:08x}",
+                                        rft.configFile,rft.secure, rft.waitNum,rft.waitTime,rft.dbgFlag)
+    rft.printVerboseFmt(5,"Main: Headers={}",rft.headers)
 
     rft.printVerbose(5,"Main: options parsed.  Now lookup subcommand and execute it")
+    return(0)
 
+
+# run the subcommand parsed into rft, print the result, and cleanup sessions that we created
+# cleanup=False leaves the session, connection pool and discovery cache open for the next command of a --batch
+# returns the exit code: 0=ok, >0=error
+def runCommand(rft, cleanup=True):
     # instantiate the SubCmd object, and run the specified subcommand
     #rfCmds=RfSubCmds()   
     #rc=rfCmds.runSubCmd(rft)
-    rc,r,j,d=runSubCmd(rft)
+    with rft.traceSpan("operation", subcommand=rft.subcommand):
+        rc,r,j,d=runSubCmd(rft)
+    if( rft.profile is not None ):
+        rft.profile.checkpoint("subcommand")
     if(rc !=0 ):
-            rft.printVerbose(5,"#DB4:Main: subcommand returned with error: rc={}".format(rc))
+            rft.printVerboseFmt(5,"#DB4:Main: subcommand returned with error: rc={}",rc)
             rft.printVerbose(1,"Main: Error: rc={}".format(rc))
             if r is not None:
-                rft.printVerbose(5,"   Response status code:{}".format(r.status_code))
-                rft.printVerbose(5,"   Response headers: {}".format(r.headers))
-            #cleanup any sessions we opened
-            rft.rfCleanup(rft)
-            sys.exit(rc)
+                rft.printVerboseFmt(5,"   Response status code:{}",r.status_code)
+                rft.printVerboseFmt(5,"   Response headers: {}",r.headers)
+            #cleanup any sessions we opened, and drop the discovery cache in case it caused the error
+            if( cleanup is True ):
+                with rft.traceSpan("cleanup"):
+                    rft.rfCleanup(rft)
+                    rft.closeHttpSession()
+                    rft.closeDiscoveryCache(rc)
+            if( rft.stats is not None ):
+                rft.stats.writeSummary(rft, rc)
+            return(rc)
 
     rft.printVerbose(5,"Main: subcommand exited OK.")
     if( r is not None ):
-        rft.printVerbose(5,"    Status code:{}".format(r.status_code))
+        rft.printVerboseFmt(5,"    Status code:{}",r.status_code)
         rft.printStatus(1,r=r)
         rft.printStatus(2,r=r)
         
     # print out result here.
     if( j is True and d is not None):
         output=json.dumps(d,indent=4)
+        if( rft.profile is not None ):
+            rft.profile.checkpoint("output")
         print(output)
     elif( j is False and d is not None):
         output=r.text
@@ -407,13 +726,20 @@ def main(argv):
     else:
         pass
 
-    #cleanup any sessions we opened on the remote service
-    rft.rfCleanup(rft)
+    #cleanup any sessions we opened on the remote service, and close the pooled connections
+    if( cleanup is True ):
+        with rft.traceSpan("cleanup"):
+            rft.rfCleanup(rft)
+            rft.closeHttpSession()
+            rft.closeDiscoveryCache(0)
 
     rft.printVerbose(5,"Main: Done")
     #print("headers:{}".format(r.headers))
-        
-    sys.exit(0)
+
+    # --stats, --stats-file: write the request counts of the command
+    if( rft.stats is not None ):
+        rft.stats.writeSummary(rft, 0)
+    return(0)
 
 
 # enter cmdClasses in other files here:
@@ -425,45 +751,46 @@ def main(argv):
 # rc, r, dt, d=runSubCmd(rft)
 
 def runSubCmd(rft):
-        # instantiate all cmdClasses (note: helloCmd and listSubcommands are in this class)
-        root=RfServiceRoot()
-        systems=RfSystemsMain()
-        chassis=RfChassisMain()
-        managers=RfManagersMain()
-        sessionService=RfSessionServiceMain()
-        accountService=RfAccountServiceMain()
-        raw=RfRawMain()
-
-        #  dispatch table for each subcommand:   "cmdName": cmdClass.cmdFunction"
-        subCmdTable = {
-            "help":             helpSubcmd,
-            "about":            aboutSubcmd,
-            "versions":         rft.getVersions,
-            "serviceRoot":      root.getServiceRoot,
-            "root":             root.getServiceRoot, #alias for serviceRoot
-            "odata":            root.getOdataServiceDocument,
-            "metadata":         root.getOdataMetadataDocument,
-            "Systems":          systems.SystemsMain,
-            "Chassis":          chassis.ChassisMain,
-            "Managers":         managers.ManagersMain,
-            "AccountService":   accountService.AccountServiceMain,
-            "SessionService":   sessionService.SessionServiceMain,
-            "raw":              raw.RawMain,
-            "hello":              helloSubcmd
-        }
-
-        rft.printVerbose(5,"runSubCmd: subcmd: {}".format(rft.subcommand))
-        rft.printVerbose(5,"runSubCmd: argvs:  {}".format(rft.subcommandArgv))
+        subCmdTable=getSubCmdTable(rft)
+        rft.printVerboseFmt(5,"runSubCmd: subcmd: {}",rft.subcommand)
+        rft.printVerboseFmt(5,"runSubCmd: argvs:  {}",rft.subcommandArgv)
             
         if rft.subcommand in subCmdTable:
-            rft.printVerbose(5,"runSubCmd: found SubCmd: {} in table. executing".format(rft.subcommand))
-            rc,r,j,d=subCmdTable[rft.subcommand](rft,cmdTop=True)
+            rft.printVerboseFmt(5,"runSubCmd: found SubCmd: {} in table. executing",rft.subcommand)
+            subCmd=subCmdTable[rft.subcommand]
+            if( isinstance(subCmd,tuple) ):
+                cmdModule,cmdClass,cmdFunction=subCmd
+                module=importlib.import_module(cmdModule, __package__)
+                subCmd=getattr(getattr(module,cmdClass)(), cmdFunction)
+            rc,r,j,d=subCmd(rft,cmdTop=True)
             return(rc,r,j,d)
         
         else: # invalit subcmd
             rft.printErr("Invalid SubCommand: {}".format(rft.subcommand))
             return(1,None,False,None)
 
+
+#  dispatch table for each subcommand:   "cmdName": cmdFunction  or  ("cmdModule", "cmdClass", "cmdFunction")
+#  the cmdModule is only imported, and its cmdClass instantiated, when its subcommand is run
+#  (note: helloCmd and listSubcommands are in this module)
+def getSubCmdTable(rft):
+        return {
+            "help":             helpSubcmd,
+            "about":            aboutSubcmd,
+            "versions":         rft.getVersions,
+            "serviceRoot":      (".ServiceRoot", "RfServiceRoot", "getServiceRoot"),
+            "root":             (".ServiceRoot", "RfServiceRoot", "getServiceRoot"), #alias for serviceRoot
+            "odata":            (".ServiceRoot", "RfServiceRoot", "getOdataServiceDocument"),
+            "metadata":         (".ServiceRoot", "RfServiceRoot", "getOdataMetadataDocument"),
+            "Systems":          (".Systems", "RfSystemsMain", "SystemsMain"),
+            "Chassis":          (".Chassis", "RfChassisMain", "ChassisMain"),
+            "Managers":         (".Managers", "RfManagersMain", "ManagersMain"),
+            "AccountService":   (".AccountService", "RfAccountServiceMain", "AccountServiceMain"),
+            "SessionService":   (".SessionService", "RfSessionServiceMain", "SessionServiceMain"),
+            "raw":              (".raw", "RfRawMain", "RawMain"),
+            "hello":              helloSubcmd
+        }
+
     
 def helloSubcmd(rft, cmdTop=False):
         rft.printVerbose(5,"Main: in hello subcommand")
@@ -0,0 +1,718 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolMockBmc.py
+#
+# Contents:
+# 1. Class RfMockService -- the state of a mock Redfish service, used to test and benchmark redfishtool without hardware
+#  - serves a synthetic tree: the service root, <systems> Systems, each with <processors> Processors, <dimms> Memory,
+#       an EthernetInterface and a SEL LogService with <logEntries> Entries.  One Chassis (Thermal, Power, <sensors>
+#       Sensors, a LogService), one Manager (NetworkProtocol, EthernetInterfaces, a LogService), SessionService,
+#       AccountService (Accounts, Roles), TaskService, odata and $metadata
+#  - collections with more than <pageSize> members are paged with Members@odata.nextLink.  $skip, $top, $select and
+#       $expand (members of collections) are supported.  protocolFeatures=False leaves ProtocolFeaturesSupported out
+#       of the service root, so a client does not use the queries
+#  - auth: Session login (POST to Sessions) returns X-Auth-Token and Location.  Requests other than /redfish,
+#       the service root, odata, $metadata and login need a valid X-Auth-Token or Basic auth with user and password.
+#       sessionTimeout=<sec> expires sessions not used for <sec> seconds, to test session re-login
+#  - ETags: each resource has an ETag, returned on GET and PATCH.  A GET with a matching If-None-Match returns 304.
+#       A PATCH with an If-Match that does not match returns 412
+#  - actions (POST to .../Actions/...) return 202 and a task monitor if taskPolls > 0.  the task monitor returns 202
+#       (with Retry-After: <taskRetryAfter>) for taskPolls GETs, then 200 and the completed Task.  204 if taskPolls=0.
+#       ComputerSystem.Reset sets PowerState, LogService.ClearLog empties the Entries
+#  - POST to a collection creates a member.  DELETE of a member removes it.  DELETE of a session logs it out
+#  - faults: latency (sec) +/- jitter (sec) added to each response. errorRate (0-1) of requests get errorStatus.
+#       dropRate (0-1) of requests get the connection closed without a response.  seed makes the faults repeatable
+#  - counters: requests, connections, and log: the list of (method, path, status) of the requests.  resetCounters()
+# 2. Class RfMockRequestHandler -- http request handler for the service.  Each response is sent in one write
+# 3. Class RfMockBmc -- runs an RfMockService on a local port, in a thread of this process or from the commandline
+#  - usage in a process:
+#       with RfMockBmc(systems=16, latency=0.01) as bmc:
+#           main(["redfishtool", "-r", bmc.rhost, "-u", bmc.service.user, "-p", bmc.service.password, "Systems", "list"])
+#           print(bmc.service.requests)
+#  - usage from the commandline:  python -m redfishtoollib.redfishtoolMockBmc [options]   (see displayMockUsage)
+#
+import os
+import sys
+import ssl
+import json
+import gzip
+import time
+import base64
+import random
+import socket
+import getopt
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+serviceRootPath="/redfish/v1"
+
+
+class RfMockService():
+    def __init__(self, systems=4, processors=2, dimms=2, logEntries=25, sensors=4, pageSize=50, protocolFeatures=True,
+                 user="admin", password="password", sessionTimeout=0, taskPolls=1, taskRetryAfter=0,
+                 latency=0.0, jitter=0.0, errorRate=0.0, errorStatus=503, dropRate=0.0, seed=None, compress=True):
+        self.pageSize=pageSize                 # max members in a collection response. 0=all
+        self.protocolFeatures=protocolFeatures
+        self.user=user
+        self.password=password
+        self.sessionTimeout=sessionTimeout     # seconds. 0=sessions don't expire
+        self.taskPolls=taskPolls               # GETs of a task monitor that return 202 before the task completes
+        self.taskRetryAfter=taskRetryAfter     # Retry-After of a 202 response, in seconds
+        self.latency=latency
+        self.jitter=jitter
+        self.errorRate=errorRate
+        self.errorStatus=errorStatus
+        self.dropRate=dropRate
+        self.compress=compress                 # gzip responses if the request has Accept-Encoding: gzip
+        self.random=random.Random(seed)
+        self.lock=threading.Lock()
+        self.resources=dict()                  # path: resource dict
+        self.etags=dict()                      # path: version, incremented by each change
+        self.sessions=dict()                   # X-Auth-Token: {"Id", "path", "lastUsed"}
+        self.taskMonitors=dict()               # task monitor path: {"task": <task path>, "polls": <202s left>}
+        self.nextId=1
+        self.resetCounters()
+        self.buildTree(systems, processors, dimms, logEntries, sensors)
+
+    def resetCounters(self):
+        with self.lock:
+            self.requests=0
+            self.connections=0
+            self.log=list()
+
+    def addResource(self, path, resource):
+        resource["@odata.id"]=path
+        self.resources[path]=resource
+        self.etags[path]=self.etags.get(path,0) + 1
+        return(resource)
+
+    def addCollection(self, path, odataType, members):
+        return(self.addResource(path, {"@odata.type": "#{0}.{0}".format(odataType), "Name": path.rsplit("/",1)[-1],
+                                       "Members@odata.count": len(members),
+                                       "Members": [{"@odata.id": m} for m in members]}))
+
+    def addMember(self, collectionPath, path):
+        collection=self.resources[collectionPath]
+        collection["Members"].append({"@odata.id": path})
+        collection["Members@odata.count"]=len(collection["Members"])
+        self.etags[collectionPath]+=1
+
+    # return an Id for a new member of a collection that is not used by another member
+    def newMemberId(self, collectionPath):
+        while "{}/{}".format(collectionPath, self.nextId) in self.resources:
+            self.nextId+=1
+        self.nextId+=1
+        return(str(self.nextId - 1))
+
+    def removeMember(self, collectionPath, path):
+        collection=self.resources[collectionPath]
+        collection["Members"]=[m for m in collection["Members"] if m["@odata.id"] != path]
+        collection["Members@odata.count"]=len(collection["Members"])
+        self.etags[collectionPath]+=1
+
+    def addLogService(self, path, logEntries):
+        self.addResource(path, {"@odata.type": "#LogService.v1_1_0.LogService", "Id": path.rsplit("/",1)[-1],
+                                "Name": "Log Service", "MaxNumberOfRecords": 1000, "OverWritePolicy": "WrapsWhenFull",
+                                "Entries": {"@odata.id": path + "/Entries"},
+                                "Actions": {"#LogService.ClearLog": {"target": path + "/Actions/LogService.ClearLog"}}})
+        entries=[path + "/Entries/{}".format(k) for k in range(1, logEntries + 1)]
+        self.addCollection(path + "/Entries", "LogEntryCollection", entries)
+        for k,entry in enumerate(entries, 1):
+            self.addResource(entry, {"@odata.type": "#LogEntry.v1_4_0.LogEntry", "Id": str(k), "Name": "Log Entry",
+                                     "EntryType": "SEL", "Severity": "OK", "Created": "2023-08-16T12:00:00Z",
+                                     "Message": "Event {} of the mock service".format(k), "MessageId": "Mock.1.0.Event"})
+
+    def addEthernetInterfaces(self, path, mac):
+        self.addCollection(path, "EthernetInterfaceCollection", [path + "/NIC1"])
+        self.addResource(path + "/NIC1", {"@odata.type": "#EthernetInterface.v1_4_0.EthernetInterface", "Id": "NIC1",
+                                          "Name": "Ethernet Interface", "MACAddress": mac, "SpeedMbps": 1000,
+                                          "InterfaceEnabled": True, "Status": {"State": "Enabled", "Health": "OK"},
+                                          "IPv4Addresses": [{"Address": "192.168.0.2", "SubnetMask": "255.255.255.0",
+                                                             "AddressOrigin": "DHCP"}]})
+
+    def buildTree(self, systems, processors, dimms, logEntries, sensors):
+        root={"@odata.type": "#ServiceRoot.v1_5_0.ServiceRoot", "Id": "RootService", "Name": "Mock Root Service",
+              "RedfishVersion": "1.6.0", "UUID": "92384634-2938-2342-8820-489239905423",
+              "Systems": {"@odata.id": serviceRootPath + "/Systems"},
+              "Chassis": {"@odata.id": serviceRootPath + "/Chassis"},
+              "Managers": {"@odata.id": serviceRootPath + "/Managers"},
+              "SessionService": {"@odata.id": serviceRootPath + "/SessionService"},
+              "AccountService": {"@odata.id": serviceRootPath + "/AccountService"},
+              "TaskService": {"@odata.id": serviceRootPath + "/TaskService"},
+              "Links": {"Sessions": {"@odata.id": serviceRootPath + "/SessionService/Sessions"}}}
+        if( self.protocolFeatures is True ):
+            root["ProtocolFeaturesSupported"]={"ExpandQuery": {"ExpandAll": True, "Levels": True, "Links": True,
+                                                               "NoLinks": True, "MaxLevels": 3},
+                                               "SelectQuery": True, "TopSkipQuery": True}
+        self.addResource(serviceRootPath, root)
+
+        chassisPath=serviceRootPath + "/Chassis/1"
+        managerPath=serviceRootPath + "/Managers/BMC"
+        systemPaths=[serviceRootPath + "/Systems/{}".format(i) for i in range(1, systems + 1)]
+        self.addCollection(serviceRootPath + "/Systems", "ComputerSystemCollection", systemPaths)
+        for i,path in enumerate(systemPaths, 1):
+            self.addResource(path, {"@odata.type": "#ComputerSystem.v1_5_0.ComputerSystem", "Id": str(i),
+                                    "Name": "System {}".format(i), "SystemType": "Physical", "AssetTag": "",
+                                    "Manufacturer": "Mock", "Model": "Mock Server", "SerialNumber": "MOCK{:06d}".format(i),
+                                    "UUID": "00000000-0000-0000-0000-{:012d}".format(i), "HostName": "host{}".format(i),
+                                    "PowerState": "On", "IndicatorLED": "Off",
+                                    "Status": {"State": "Enabled", "Health": "OK"},
+                                    "Boot": {"BootSourceOverrideEnabled": "Disabled", "BootSourceOverrideTarget": "None",
+                                             "BootSourceOverrideMode": "UEFI", "UefiTargetBootSourceOverride": None,
+                                             "BootSourceOverrideTarget@Redfish.AllowableValues": ["None", "Pxe", "Cd",
+                                                 "Usb", "Hdd", "BiosSetup", "Utilities", "Diags", "UefiTarget"]},
+                                    "ProcessorSummary": {"Count": processors, "Model": "Mock CPU"},
+                                    "MemorySummary": {"TotalSystemMemoryGiB": 16 * dimms},
+                                    "Processors": {"@odata.id": path + "/Processors"},
+                                    "Memory": {"@odata.id": path + "/Memory"},
+                                    "EthernetInterfaces": {"@odata.id": path + "/EthernetInterfaces"},
+                                    "SimpleStorage": {"@odata.id": path + "/SimpleStorage"},
+                                    "LogServices": {"@odata.id": path + "/LogServices"},
+                                    "Links": {"Chassis": [{"@odata.id": chassisPath}],
+                                              "ManagedBy": [{"@odata.id": managerPath}]},
+                                    "Actions": {"#ComputerSystem.Reset": {"target": path + "/Actions/ComputerSystem.Reset",
+                                                "ResetType@Redfish.AllowableValues": ["On", "ForceOff", "GracefulShutdown",
+                                                    "GracefulRestart", "ForceRestart", "Nmi", "ForceOn", "PushPowerButton"]}}})
+            procs=[path + "/Processors/CPU{}".format(k) for k in range(1, processors + 1)]
+            self.addCollection(path + "/Processors", "ProcessorCollection", procs)
+            for k,proc in enumerate(procs, 1):
+                self.addResource(proc, {"@odata.type": "#Processor.v1_3_0.Processor", "Id": "CPU{}".format(k),
+                                        "Name": "Processor", "Socket": "CPU {}".format(k), "ProcessorType": "CPU",
+                                        "Manufacturer": "Mock", "Model": "Mock CPU", "TotalCores": 16, "TotalThreads": 32,
+                                        "Status": {"State": "Enabled", "Health": "OK"}})
+            mems=[path + "/Memory/DIMM{}".format(k) for k in range(1, dimms + 1)]
+            self.addCollection(path + "/Memory", "MemoryCollection", mems)
+            for k,mem in enumerate(mems, 1):
+                self.addResource(mem, {"@odata.type": "#Memory.v1_6_0.Memory", "Id": "DIMM{}".format(k),
+                                       "Name": "DIMM {}".format(k), "CapacityMiB": 16384, "MemoryDeviceType": "DDR4",
+                                       "OperatingSpeedMhz": 2666, "Status": {"State": "Enabled", "Health": "OK"}})
+            self.addEthernetInterfaces(path + "/EthernetInterfaces", "00:00:00:00:{:02x}:{:02x}".format(i // 256, i % 256))
+            self.addCollection(path + "/SimpleStorage", "SimpleStorageCollection", [])
+            self.addCollection(path + "/LogServices", "LogServiceCollection", [path + "/LogServices/SEL"])
+            self.addLogService(path + "/LogServices/SEL", logEntries)
+
+        self.addCollection(serviceRootPath + "/Chassis", "ChassisCollection", [chassisPath])
+        self.addResource(chassisPath, {"@odata.type": "#Chassis.v1_5_0.Chassis", "Id": "1", "Name": "Chassis",
+                                       "ChassisType": "RackMount", "AssetTag": "", "IndicatorLED": "Off",
+                                       "PowerState": "On", "Status": {"State": "Enabled", "Health": "OK"},
+                                       "Thermal": {"@odata.id": chassisPath + "/Thermal"},
+                                       "Power": {"@odata.id": chassisPath + "/Power"},
+                                       "Sensors": {"@odata.id": chassisPath + "/Sensors"},
+                                       "LogServices": {"@odata.id": chassisPath + "/LogServices"},
+                                       "Links": {"ComputerSystems": [{"@odata.id": p} for p in systemPaths],
+                                                 "ManagedBy": [{"@odata.id": managerPath}]},
+                                       "Actions": {"#Chassis.Reset": {"target": chassisPath + "/Actions/Chassis.Reset"}}})
+        self.addResource(chassisPath + "/Thermal", {"@odata.type": "#Thermal.v1_3_0.Thermal", "Id": "Thermal",
+                         "Name": "Thermal",
+                         "Temperatures": [{"MemberId": "0", "Name": "Inlet Temp", "ReadingCelsius": 25,
+                                           "UpperThresholdCritical": 40, "Status": {"State": "Enabled", "Health": "OK"}}],
+                         "Fans": [{"MemberId": "0", "Name": "Fan 1", "Reading": 6000, "ReadingUnits": "RPM",
+                                   "Status": {"State": "Enabled", "Health": "OK"}}]})
+        self.addResource(chassisPath + "/Power", {"@odata.type": "#Power.v1_3_0.Power", "Id": "Power", "Name": "Power",
+                         "PowerControl": [{"MemberId": "0", "Name": "System Power Control", "PowerConsumedWatts": 300,
+                                           "PowerLimit": {"LimitInWatts": 500, "LimitException": "LogEventOnly",
+                                                          "CorrectionInMs": 50}}],
+                         "PowerSupplies": [{"MemberId": "0", "Name": "Power Supply 1", "PowerCapacityWatts": 800,
+                                            "Status": {"State": "Enabled", "Health": "OK"}}]})
+
+        sensorPaths=[chassisPath + "/Sensors/Temp{}".format(k) for k in range(1, sensors + 1)]
+        self.addCollection(chassisPath + "/Sensors", "SensorCollection", sensorPaths)
+        for k,sensor in enumerate(sensorPaths, 1):
+            self.addResource(sensor, {"@odata.type": "#Sensor.v1_0_0.Sensor", "Id": "Temp{}".format(k),
+                                      "Name": "Temperature {}".format(k), "ReadingType": "Temperature",
+                                      "ReadingUnits": "Cel", "Reading": 30 + k,
+                                      "Thresholds": {"UpperCritical": {"Reading": 85}},
+                                      "Status": {"State": "Enabled", "Health": "OK"}})
+        self.addCollection(chassisPath + "/LogServices", "LogServiceCollection", [chassisPath + "/LogServices/Log"])
+        self.addLogService(chassisPath + "/LogServices/Log", logEntries)
+
+        self.addCollection(serviceRootPath + "/Managers", "ManagerCollection", [managerPath])
+        self.addResource(managerPath, {"@odata.type": "#Manager.v1_3_0.Manager", "Id": "BMC", "Name": "Manager",
+                                       "ManagerType": "BMC", "UUID": "58893887-8974-2487-2389-841168418919",
+                                       "FirmwareVersion": "1.00", "DateTime": "2023-08-16T12:00:00+00:00",
+                                       "DateTimeLocalOffset": "+00:00", "Status": {"State": "Enabled", "Health": "OK"},
+                                       "NetworkProtocol": {"@odata.id": managerPath + "/NetworkProtocol"},
+                                       "EthernetInterfaces": {"@odata.id": managerPath + "/EthernetInterfaces"},
+                                       "LogServices": {"@odata.id": managerPath + "/LogServices"},
+                                       "Links": {"ManagerForServers": [{"@odata.id": p} for p in systemPaths],
+                                                 "ManagerForChassis": [{"@odata.id": chassisPath}]},
+                                       "Actions": {"#Manager.Reset": {"target": managerPath + "/Actions/Manager.Reset",
+                                                   "ResetType@Redfish.AllowableValues": ["ForceRestart", "GracefulRestart"]}}})
+        self.addResource(managerPath + "/NetworkProtocol", {"@odata.type": "#ManagerNetworkProtocol.v1_2_0.ManagerNetworkProtocol",
+                         "Id": "NetworkProtocol", "Name": "Manager Network Protocol", "HostName": "bmc",
+                         "HTTP": {"ProtocolEnabled": False, "Port": 80}, "HTTPS": {"ProtocolEnabled": True, "Port": 443},
+                         "SSH": {"ProtocolEnabled": True, "Port": 22}, "IPMI": {"ProtocolEnabled": True, "Port": 623}})
+        self.addEthernetInterfaces(managerPath + "/EthernetInterfaces", "00:00:00:ff:00:01")
+        self.addCollection(managerPath + "/LogServices", "LogServiceCollection", [managerPath + "/LogServices/Log"])
+        self.addLogService(managerPath + "/LogServices/Log", logEntries)
+
+        self.addResource(serviceRootPath + "/SessionService", {"@odata.type": "#SessionService.v1_1_3.SessionService",
+                         "Id": "SessionService", "Name": "Session Service", "ServiceEnabled": True,
+                         "SessionTimeout": self.sessionTimeout or 1800,
+                         "Sessions": {"@odata.id": serviceRootPath + "/SessionService/Sessions"}})
+        self.addCollection(serviceRootPath + "/SessionService/Sessions", "SessionCollection", [])
+
+        accountService=serviceRootPath + "/AccountService"
+        self.addResource(accountService, {"@odata.type": "#AccountService.v1_3_0.AccountService", "Id": "AccountService",
+                         "Name": "Account Service", "ServiceEnabled": True, "MinPasswordLength": 8,
+                         "Accounts": {"@odata.id": accountService + "/Accounts"},
+                         "Roles": {"@odata.id": accountService + "/Roles"}})
+        self.addCollection(accountService + "/Accounts", "ManagerAccountCollection", [accountService + "/Accounts/1"])
+        self.addResource(accountService + "/Accounts/1", {"@odata.type": "#ManagerAccount.v1_1_3.ManagerAccount",
+                         "Id": "1", "Name": "User Account", "UserName": self.user, "Password": None,
+                         "RoleId": "Administrator", "Enabled": True, "Locked": False,
+                         "Links": {"Role": {"@odata.id": accountService + "/Roles/Administrator"}}})
+        roles={"Administrator": ["Login", "ConfigureManager", "ConfigureUsers", "ConfigureSelf", "ConfigureComponents"],
+               "Operator": ["Login", "ConfigureSelf", "ConfigureComponents"], "ReadOnly": ["Login", "ConfigureSelf"]}
+        self.addCollection(accountService + "/Roles", "RoleCollection", [accountService + "/Roles/" + r for r in roles])
+        for role,privileges in roles.items():
+            self.addResource(accountService + "/Roles/" + role, {"@odata.type": "#Role.v1_0_2.Role", "Id": role,
+                             "Name": role, "IsPredefined": True, "AssignedPrivileges": privileges})
+
+        self.addResource(serviceRootPath + "/TaskService", {"@odata.type": "#TaskService.v1_1_0.TaskService",
+                         "Id": "TaskService", "Name": "Task Service", "ServiceEnabled": True,
+                         "Tasks": {"@odata.id": serviceRootPath + "/TaskService/Tasks"}})
+        self.addCollection(serviceRootPath + "/TaskService/Tasks", "TaskCollection", [])
+
+        self.odata={"@odata.context": serviceRootPath + "/$metadata",
+                    "value": [{"name": name, "kind": "Singleton", "url": self.resources[serviceRootPath][name]["@odata.id"]}
+                              for name in ("Systems", "Chassis", "Managers", "SessionService", "AccountService", "TaskService")]}
+        self.metadata=('<?xml version="1.0" encoding="UTF-8"?>\n'
+                       '<edmx:Edmx xmlns:edmx="http://docs.oasis-open.org/odata/ns/edmx" Version="4.0">\n'
+                       '  <edmx:DataServices>\n'
+                       '    <Schema xmlns="http://docs.oasis-open.org/odata/ns/edm" Namespace="Service">\n'
+                       '      <EntityContainer Name="Service" Extends="ServiceRoot.v1_5_0.ServiceContainer"/>\n'
+                       '    </Schema>\n'
+                       '  </edmx:DataServices>\n'
+                       '</edmx:Edmx>\n')
+
+    # return the etag header value of a resource
+    def getEtag(self, path):
+        return('W/"{}"'.format(self.etags.get(path,0)))
+
+    # return True if the request has a valid session token, or Basic auth with the user and password
+    # a session that was not used for sessionTimeout seconds is deleted
+    def isAuthorized(self, headers):
+        token=headers.get("X-Auth-Token")
+        if( token is not None ):
+            session=self.sessions.get(token)
+            if( session is None ):
+                return(False)
+            now=time.time()
+            if( (self.sessionTimeout > 0) and (now - session["lastUsed"] > self.sessionTimeout) ):
+                self.deleteSession(token)
+                return(False)
+            session["lastUsed"]=now
+            return(True)
+        authorization=headers.get("Authorization", "")
+        if( authorization.startswith("Basic ") ):
+            try:
+                user,_,password=base64.b64decode(authorization[6:]).decode("utf-8").partition(":")
+            except ValueError:
+                return(False)
+            return( (user == self.user) and (password == self.password) )
+        return(False)
+
+    def createSession(self, userName):
+        sessionId=self.newMemberId(serviceRootPath + "/SessionService/Sessions")
+        token=secrets.token_hex(16)
+        path=serviceRootPath + "/SessionService/Sessions/" + sessionId
+        self.sessions[token]={"Id": sessionId, "path": path, "lastUsed": time.time()}
+        self.addMember(serviceRootPath + "/SessionService/Sessions", path)
+        resource=self.addResource(path, {"@odata.type": "#Session.v1_1_0.Session", "Id": sessionId,
+                                         "Name": "User Session", "UserName": userName})
+        return(token, resource)
+
+    def deleteSession(self, token):
+        session=self.sessions.pop(token)
+        self.removeMember(serviceRootPath + "/SessionService/Sessions", session["path"])
+        self.resources.pop(session["path"], None)
+
+    # create a task and its task monitor for an action.  returns the task monitor path
+    def createTask(self, actionPath):
+        taskId=self.newMemberId(serviceRootPath + "/TaskService/Tasks")
+        taskPath=serviceRootPath + "/TaskService/Tasks/" + taskId
+        monitorPath=serviceRootPath + "/TaskService/TaskMonitors/" + taskId
+        self.addMember(serviceRootPath + "/TaskService/Tasks", taskPath)
+        self.addResource(taskPath, {"@odata.type": "#Task.v1_4_0.Task", "Id": taskId, "Name": "Task " + taskId,
+                                    "TaskState": "Running", "TaskStatus": "OK", "PercentComplete": 0,
+                                    "TaskMonitor": monitorPath, "Payload": {"TargetUri": actionPath}})
+        self.taskMonitors[monitorPath]={"task": taskPath, "polls": self.taskPolls}
+        return(monitorPath)
+
+    # GET of a task monitor. returns (status, task resource)
+    def pollTask(self, monitorPath):
+        monitor=self.taskMonitors[monitorPath]
+        task=self.resources[monitor["task"]]
+        if( monitor["polls"] > 0 ):
+            monitor["polls"]-=1
+            task["PercentComplete"]=100 * (self.taskPolls - monitor["polls"]) // (self.taskPolls + 1)
+            return(202, task)
+        task.update({"TaskState": "Completed", "PercentComplete": 100})
+        self.etags[monitor["task"]]+=1
+        return(200, task)
+
+    # run the action at actionPath on the resource at resourcePath
+    def runAction(self, resourcePath, action, body):
+        resource=self.resources.get(resourcePath)
+        if( resource is None ):
+            return(False)
+        if( action.endswith(".Reset") and ("PowerState" in resource) ):
+            resetType=body.get("ResetType", "On")
+            resource["PowerState"]="Off" if( resetType in ("ForceOff", "GracefulShutdown") ) else "On"
+            self.etags[resourcePath]+=1
+        elif( action == "LogService.ClearLog" ):
+            entriesPath=resourcePath + "/Entries"
+            for member in self.resources[entriesPath]["Members"]:
+                self.resources.pop(member["@odata.id"], None)
+            self.resources[entriesPath].update({"Members": [], "Members@odata.count": 0})
+            self.etags[entriesPath]+=1
+        return(True)
+
+    # return the GET response of a resource, with the $skip, $top, $select and $expand queries applied
+    # collections with more than pageSize members are paged with Members@odata.nextLink
+    def getResource(self, path, query):
+        d=dict(self.resources[path])
+        if( "Members" in d ):
+            members=d["Members"]
+            skip=int(query.get("$skip", ["0"])[0])
+            if( "$top" in query ):
+                d["Members"]=members[skip:skip + int(query["$top"][0])]
+            elif( (self.pageSize > 0) and (len(members) - skip > self.pageSize) ):
+                d["Members"]=members[skip:skip + self.pageSize]
+                nextLink="{}?$skip={}".format(path, skip + self.pageSize)
+                if( "$expand" in query ):
+                    nextLink+="&$expand=" + query["$expand"][0]
+                d["Members@odata.nextLink"]=nextLink
+            else:
+                d["Members"]=members[skip:]
+            if( "$expand" in query ):
+                d["Members"]=[self.resources.get(m["@odata.id"], m) for m in d["Members"]]
+        if( "$select" in query ):
+            keep=query["$select"][0].split(",")
+            d={k: v for k,v in d.items() if( (k in keep) or k.startswith("@odata") or k.startswith("Members") )}
+        return(d)
+
+    # return the fault to inject into a request: "drop", "error", or None. and sleep for the latency
+    def injectFaults(self):
+        with self.lock:
+            delay=self.latency + (self.random.uniform(-self.jitter, self.jitter) if( self.jitter > 0 ) else 0)
+            draw=self.random.random()
+        if( delay > 0 ):
+            time.sleep(delay)
+        if( draw < self.dropRate ):
+            return("drop")
+        if( draw < self.dropRate + self.errorRate ):
+            return("error")
+        return(None)
+
+
+class RfMockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version="HTTP/1.1"
+    server_version="RedfishMockBmc/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        try:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        service=self.server.service
+        with service.lock:
+            service.connections+=1
+
+    # return the response (status, headers, data, contentType), with the body encoded.  called with the service lock
+    # held, so that the resource is encoded before another request changes it
+    def makeResponse(self, status, body=None, headers=None, contentType="application/json"):
+        if( body is None ):
+            data=b""
+        elif( isinstance(body, str) ):
+            data=body.encode("utf-8")
+        else:
+            data=json.dumps(body).encode("utf-8")
+        return(status, headers, data, contentType)
+
+    def makeError(self, status, message, headers=None):
+        return(self.makeResponse(status, {"error": {"code": "Base.1.0.GeneralError", "message": message}}, headers))
+
+    # send the status line, headers and body in one write, so that the client is not delayed by Nagle's algorithm
+    def sendResponse(self, response):
+        status,headers,data,contentType=response
+        service=self.server.service
+        lines=["HTTP/1.1 {} {}".format(status, self.responses.get(status, ("",))[0]),
+               "Server: " + self.version_string(), "Date: " + self.date_time_string(), "OData-Version: 4.0"]
+        if( data ):
+            if( service.compress and ("gzip" in self.headers.get("Accept-Encoding", "")) ):
+                data=gzip.compress(data, compresslevel=1)
+                lines.append("Content-Encoding: gzip")
+            lines.append("Content-Type: {}; charset=utf-8".format(contentType))
+        lines.append("Content-Length: {}".format(len(data)))
+        for name,value in (headers or {}).items():
+            lines.append("{}: {}".format(name, value))
+        if( self.close_connection ):
+            lines.append("Connection: close")
+        self.wfile.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + data)
+        with service.lock:
+            service.log.append((self.command, self.path, status))
+        return(0)
+
+    # read the json body of the request.  returns None if it is not valid json
+    def readBody(self):
+        length=int(self.headers.get("Content-Length", 0))
+        data=self.rfile.read(length) if( length > 0 ) else b""
+        try:
+            return(json.loads(data or b"{}"))
+        except ValueError:
+            return(None)
+
+    # count the request, inject faults, read the body, and run handler(path, query, body) with the service lock held
+    # then send the response it returns.  A dropped request closes the connection without a response
+    def runRequest(self, handler):
+        service=self.server.service
+        with service.lock:
+            service.requests+=1
+        fault=service.injectFaults()
+        body=self.readBody() if( self.command in ("POST", "PATCH") ) else {}
+        if( fault == "drop" ):
+            self.close_connection=True
+            with service.lock:
+                service.log.append((self.command, self.path, None))
+            return(0)
+        if( fault == "error" ):
+            return(self.sendResponse(self.makeError(service.errorStatus, "injected error", {"Retry-After": "0"})))
+        if( body is None ):
+            return(self.sendResponse(self.makeError(400, "request body is not valid json")))
+        url=urlparse(self.path)
+        path=unquote(url.path).rstrip("/") or "/"
+        with service.lock:
+            response=handler(service, path, parse_qs(url.query), body)
+        return(self.sendResponse(response))
+
+    def do_GET(self):
+        self.runRequest(self.getResponse)
+
+    def do_HEAD(self):
+        self.runRequest(lambda service, path, query, body: self.makeResponse(200))
+
+    def do_POST(self):
+        self.runRequest(self.postResponse)
+
+    def do_PATCH(self):
+        self.runRequest(self.patchResponse)
+
+    def do_DELETE(self):
+        self.runRequest(self.deleteResponse)
+
+    def getResponse(self, service, path, query, body):
+        if( path == "/redfish" ):
+            return(self.makeResponse(200, {"v1": serviceRootPath + "/"}))
+        if( path == serviceRootPath + "/odata" ):
+            return(self.makeResponse(200, service.odata))
+        if( path == serviceRootPath + "/$metadata" ):
+            return(self.makeResponse(200, service.metadata, contentType="application/xml"))
+        if( (path != serviceRootPath) and (not service.isAuthorized(self.headers)) ):
+            return(self.makeError(401, "authentication required"))
+        if( path in service.taskMonitors ):
+            status,task=service.pollTask(path)
+            headers={"Location": path, "Retry-After": str(service.taskRetryAfter)} if( status == 202 ) else None
+            return(self.makeResponse(status, task, headers))
+        if( path not in service.resources ):
+            return(self.makeError(404, "resource not found: {}".format(path)))
+        etag=service.getEtag(path)
+        if( self.headers.get("If-None-Match") == etag ):
+            return(self.makeResponse(304, None, {"ETag": etag}))
+        return(self.makeResponse(200, service.getResource(path, query), {"ETag": etag}))
+
+    def postResponse(self, service, path, query, body):
+        if( path == serviceRootPath + "/SessionService/Sessions" ):
+            if( (body.get("UserName") != service.user) or (body.get("Password") != service.password) ):
+                return(self.makeError(401, "invalid credentials"))
+            token,session=service.createSession(body["UserName"])
+            return(self.makeResponse(201, session, {"X-Auth-Token": token, "Location": session["@odata.id"]}))
+        if( not service.isAuthorized(self.headers) ):
+            return(self.makeError(401, "authentication required"))
+        if( "/Actions/" in path ):
+            resourcePath,_,action=path.partition("/Actions/")
+            if( not service.runAction(resourcePath, action, body) ):
+                return(self.makeError(404, "resource not found: {}".format(resourcePath)))
+            if( service.taskPolls > 0 ):
+                monitorPath=service.createTask(path)
+                return(self.makeResponse(202, service.resources[service.taskMonitors[monitorPath]["task"]],
+                                         {"Location": monitorPath, "Retry-After": str(service.taskRetryAfter)}))
+            return(self.makeResponse(204))
+        collection=service.resources.get(path)
+        if( (collection is None) or ("Members" not in collection) ):
+            return(self.makeError(405, "POST is not allowed on {}".format(path)))
+        memberId=service.newMemberId(path)
+        memberPath="{}/{}".format(path, memberId)
+        body["Id"]=memberId
+        service.addMember(path, memberPath)
+        member=service.addResource(memberPath, body)
+        return(self.makeResponse(201, member, {"Location": memberPath, "ETag": service.getEtag(memberPath)}))
+
+    def patchResponse(self, service, path, query, body):
+        if( not service.isAuthorized(self.headers) ):
+            return(self.makeError(401, "authentication required"))
+        if( path not in service.resources ):
+            return(self.makeError(404, "resource not found: {}".format(path)))
+        ifMatch=self.headers.get("If-Match")
+        if( (ifMatch is not None) and (ifMatch != service.getEtag(path)) ):
+            return(self.makeError(412, "If-Match does not match the ETag of {}".format(path)))
+        mergePatch(service.resources[path], body)
+        service.etags[path]+=1
+        return(self.makeResponse(200, service.resources[path], {"ETag": service.getEtag(path)}))
+
+    def deleteResponse(self, service, path, query, body):
+        if( not service.isAuthorized(self.headers) ):
+            return(self.makeError(401, "authentication required"))
+        for token,session in service.sessions.items():
+            if( session["path"] == path ):
+                service.deleteSession(token)
+                return(self.makeResponse(204))
+        collectionPath=path.rsplit("/",1)[0]
+        collection=service.resources.get(collectionPath)
+        if( (path not in service.resources) or (collection is None) or ("Members" not in collection) ):
+            return(self.makeError(405, "DELETE is not allowed on {}".format(path)))
+        service.removeMember(collectionPath, path)
+        del service.resources[path]
+        return(self.makeResponse(204))
+
+
+# merge the PATCH body patch into resource: dicts are merged, other values replaced
+def mergePatch(resource, patch):
+    for key,value in patch.items():
+        if( isinstance(value, dict) and isinstance(resource.get(key), dict) ):
+            mergePatch(resource[key], value)
+        else:
+            resource[key]=value
+
+
+class RfMockBmc():
+    # keyword args are the RfMockService options.  certFile and keyFile serve https.  port=0 picks a free port
+    def __init__(self, host="127.0.0.1", port=0, certFile=None, keyFile=None, **serviceOptions):
+        self.service=RfMockService(**serviceOptions)
+        self.server=ThreadingHTTPServer((host, port), RfMockRequestHandler)
+        self.server.daemon_threads=True
+        self.server.service=self.service
+        self.scheme="http"
+        if( certFile is not None ):
+            context=ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certFile, keyFile)
+            # the handshake is done by the request handler thread, not by the thread accepting connections
+            self.server.socket=context.wrap_socket(self.server.socket, server_side=True, do_handshake_on_connect=False)
+            self.scheme="https"
+        self.thread=None
+
+    # the -r <rhost> of the service, eg 127.0.0.1:41234
+    @property
+    def rhost(self):
+        host,port=self.server.server_address[:2]
+        return("{}:{}".format(host, port))
+
+    @property
+    def url(self):
+        return("{}://{}".format(self.scheme, self.rhost))
+
+    # serve in a daemon thread of this process
+    def start(self):
+        self.thread=threading.Thread(target=self.server.serve_forever, name="RfMockBmc", daemon=True)
+        self.thread.start()
+        return(self)
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if( self.thread is not None ):
+            self.thread.join()
+            self.thread=None
+        return(0)
+
+    def __enter__(self):
+        return(self.start())
+
+    def __exit__(self, excType, excValue, traceback):
+        self.stop()
+        return(False)
+
+
+def displayMockUsage(program):
+    print("Usage: {} [options]".format(program))
+    print("  runs a mock Redfish service on a local port until it is killed. prints the url it listens on")
+    print("   --host=<addr>         -- address to listen on. Default=127.0.0.1")
+    print("   --port=<port>         -- port to listen on. Default=0 (a free port)")
+    print("   --cert=<file> --key=<file> -- serve https with the certificate and key in <file>s")
+    print("   --systems=<num>       -- number of Systems. Default=4")
+    print("   --processors=<num>    -- number of Processors of each System. Default=2")
+    print("   --dimms=<num>         -- number of Memory DIMMs of each System. Default=2")
+    print("   --log-entries=<num>   -- number of Entries of each LogService. Default=25")
+    print("   --sensors=<num>       -- number of Sensors of the Chassis. Default=4")
+    print("   --page-size=<num>     -- max members in a collection response, paged with nextLink. 0=no paging. Default=50")
+    print("   --no-protocol-features -- leave ProtocolFeaturesSupported ($expand, $select, $top/$skip) out of the service root")
+    print("   --user=<user> --password=<passwd> -- credentials of the service. Default: admin, password")
+    print("   --session-timeout=<sec> -- expire sessions not used for <sec> seconds. Default=0 (never)")
+    print("   --task-polls=<num>    -- GETs of the task monitor of an action that return 202 before it completes.")
+    print("                            0=actions return 204. Default=1")
+    print("   --task-retry-after=<sec> -- Retry-After of the 202 responses of a task. Default=0")
+    print("   --latency=<sec>       -- delay added to each response. Default=0")
+    print("   --jitter=<sec>        -- random +/- variation of the latency. Default=0")
+    print("   --error-rate=<0-1>    -- fraction of requests that get the --error-status response. Default=0")
+    print("   --error-status=<code> -- status of the injected errors. Default=503")
+    print("   --drop-rate=<0-1>     -- fraction of requests whose connection is closed without a response. Default=0")
+    print("   --seed=<num>          -- seed of the random faults, to make them repeatable")
+
+
+# commandline: python -m redfishtoollib.redfishtoolMockBmc [options]
+def main(argv):
+    program=os.path.basename(argv[0])
+    intOptions={"systems": "systems", "processors": "processors", "dimms": "dimms", "log-entries": "logEntries", "sensors": "sensors",
+                "page-size": "pageSize", "session-timeout": "sessionTimeout", "task-polls": "taskPolls",
+                "task-retry-after": "taskRetryAfter", "error-status": "errorStatus", "seed": "seed", "port": "port"}
+    floatOptions={"latency": "latency", "jitter": "jitter", "error-rate": "errorRate", "drop-rate": "dropRate"}
+    strOptions={"host": "host", "cert": "certFile", "key": "keyFile", "user": "user", "password": "password"}
+    try:
+        opts, args = getopt.getopt(argv[1:], "h", ["help", "no-protocol-features"] +
+                                   [name + "=" for name in list(intOptions) + list(floatOptions) + list(strOptions)])
+    except getopt.GetoptError as e:
+        print("{}: Error: {}".format(program, e), file=sys.stderr)
+        displayMockUsage(program)
+        return(1)
+    options=dict()
+    for opt, arg in opts:
+        name=opt[2:]
+        if opt in ("-h", "--help"):
+            displayMockUsage(program)
+            return(0)
+        elif opt == "--no-protocol-features":
+            options["protocolFeatures"]=False
+        elif name in strOptions:
+            options[strOptions[name]]=arg
+        else:
+            try:
+                if name in intOptions:
+                    options[intOptions[name]]=int(arg)
+                else:
+                    options[floatOptions[name]]=float(arg)
+            except ValueError:
+                print("{}: Invalid --{} value: {}".format(program, name, arg), file=sys.stderr)
+                return(1)
+
+    bmc=RfMockBmc(**options)
+    print("{} listening on {}  (user: {}, password: {})".format(program, bmc.url, bmc.service.user,
+          bmc.service.password), flush=True)
+    try:
+        bmc.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    bmc.server.server_close()
+    return(0)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,139 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolProfile.py
+#
+# Contents:
+# 1. Class RfProfile -- profiles the cpu time or memory of a command for --profile=cpu|mem
+#  - run -- runs the command (a single command, a --batch, or a -r <hostList>) with the profiler on, and reports
+#  - --profile=cpu  uses cProfile.  Threads started by the command (concurrent member reads, fleet hosts) are
+#       profiled too.  Writes the pstats file --profile-file=<file> (default: redfishtool.pstats), and prints the
+#       functions with the most cumulative time to stderr.  View the file with:  python -m pstats <file>
+#  - --profile=mem  uses tracemalloc.  Prints the peak memory of the command, and the lines that allocated the most
+#       memory at the checkpoint where the most memory was allocated.  Writes the tracemalloc snapshot of that
+#       checkpoint to --profile-file=<file> if specified.  View with: tracemalloc.Snapshot.load(<file>)
+#  - checkpoint -- called by main after the subcommand returns its data, and after the output is formatted, so the
+#       memory report shows what held the memory (json parsing, member lists, json.dumps output...)
+#
+import sys
+import threading
+
+defaultCpuProfileFile="redfishtool.pstats"
+
+
+class RfProfile():
+    def __init__(self, mode, profileFile=None, top=15):
+        self.mode=mode                 # "cpu" or "mem"
+        self.profileFile=profileFile
+        self.top=top                   # number of functions or allocation sites reported
+        self.profiles=list()
+        self.profilesLock=threading.Lock()
+        self.snapshot=None
+        self.snapshotSize=0
+        self.snapshotName=None
+
+    # run runCommand() with the profiler on, report, and return its exit code
+    def run(self, rft, runCommand):
+        if( self.mode == "cpu" ):
+            return(self.runCpu(rft, runCommand))
+        return(self.runMem(rft, runCommand))
+
+    # start a profiler in each thread the command starts.  cProfile only profiles the thread that enables it
+    def startThreadProfile(self, frame, event, arg):
+        import cProfile
+        profile=cProfile.Profile()
+        with self.profilesLock:
+            self.profiles.append(profile)
+        profile.enable()    # replaces this function as the profiler of the thread
+
+    def runCpu(self, rft, runCommand):
+        import cProfile
+        import pstats
+        profile=cProfile.Profile()
+        self.profiles.append(profile)
+        threading.setprofile(self.startThreadProfile)
+        profile.enable()
+        try:
+            rc=runCommand()
+        finally:
+            profile.disable()
+            threading.setprofile(None)
+
+        stats=pstats.Stats(profile, stream=sys.stderr)
+        for threadProfile in self.profiles[1:]:
+            stats.add(threadProfile)
+        profileFile=self.profileFile or defaultCpuProfileFile
+        try:
+            stats.dump_stats(profileFile)
+        except OSError as e:
+            rft.printErr("Error: can't write profile file: {}: {}".format(profileFile, e))
+        else:
+            print("#PROFILE: cpu: wrote {} ({} threads). view with: python -m pstats {}".format(profileFile,
+                  len(self.profiles), profileFile), file=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(self.top)
+        sys.stderr.flush()
+        return(rc)
+
+    def runMem(self, rft, runCommand):
+        import tracemalloc
+        tracemalloc.start(10)
+        try:
+            rc=runCommand()
+            self.checkpoint("end")
+            current,peak=tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        print("#PROFILE: mem: peak {}, {} still allocated at end".format(formatSize(peak), formatSize(current)),
+              file=sys.stderr)
+        if( self.snapshot is not None ):
+            self.reportSnapshot(rft)
+        sys.stderr.flush()
+        return(rc)
+
+    # --profile=mem: take a snapshot if more memory is allocated now than at the earlier checkpoints
+    def checkpoint(self, name):
+        if( self.mode != "mem" ):
+            return(0)
+        import tracemalloc
+        if( not tracemalloc.is_tracing() ):
+            return(0)
+        with self.profilesLock:     # the hosts of a fleet run checkpoints concurrently
+            current,peak=tracemalloc.get_traced_memory()
+            if( current > self.snapshotSize ):
+                self.snapshot=tracemalloc.take_snapshot()
+                self.snapshotSize=current
+                self.snapshotName=name
+        return(0)
+
+    def reportSnapshot(self, rft):
+        import tracemalloc
+        snapshot=self.snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>")])
+        print("#PROFILE: mem: {} allocated at checkpoint \"{}\". top allocation sites:".format(
+              formatSize(self.snapshotSize), self.snapshotName), file=sys.stderr)
+        for stat in snapshot.statistics("lineno")[:self.top]:
+            frame=stat.traceback[0]
+            print("#PROFILE:   {:>10}  {:>8} blocks  {}:{}".format(formatSize(stat.size), stat.count,
+                  frame.filename, frame.lineno), file=sys.stderr)
+        if( self.profileFile is not None ):
+            try:
+                self.snapshot.dump(self.profileFile)
+            except OSError as e:
+                rft.printErr("Error: can't write profile file: {}: {}".format(self.profileFile, e))
+                return(5)
+            print("#PROFILE: mem: wrote tracemalloc snapshot {}".format(self.profileFile), file=sys.stderr)
+        return(0)
+
+
+# return size in bytes as a string, eg "12.3 MiB"
+def formatSize(size):
+    for unit in ("B", "KiB", "MiB"):
+        if( abs(size) < 1024 ):
+            return("{:.1f} {}".format(size, unit) if( unit != "B" ) else "{} B".format(size))
+        size/=1024.0
+    return("{:.1f} GiB".format(size))
@@ -0,0 +1,120 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolStats.py
+#
+# Contents:
+# 1. percentile, summarizeTimes -- nearest-rank percentile of a sorted list, and the total/p50/p95/max of a list
+# 2. Class RfStats -- counts the http requests a command sends, for --stats and --stats-file=<file>
+#  - recordRequest -- called by the transport httpRequest for every request sent to rhost, including resends
+#  - countEvent -- counts other events: retries, task polls, logins, logouts, discovery cache and GET memo hits
+#  - getSummary -- returns the summary dict
+#  - writeSummary -- called by main at the end of a command. --stats writes the summary as one json line to stderr,
+#       --stats-file=<file> appends it as one json line to <file>
+#  - the summary is:
+#       {"subcommand": <subcmd>, "rhost": <rhost>, "rc": <exitCode>, "elapsed": <sec>,
+#        "requests": <num>, "byMethod": {"GET": <num>,...}, "byStatus": {"200": <num>,..., "error": <num>},
+#        "latency": {"total": <sec>, "p50": <sec>, "p95": <sec>, "max": <sec>},
+#        "phases": {"connect": {"total","p50","p95","max"}, "tls":.., "send":.., "ttfb":.., "body":..},
+#             the phase timings of the requests (see redfishtoolTiming.py). connect and tls are only counted for
+#             requests that opened a new connection: "newConnections": <num>
+#        "bytesSent": <num>, "bytesReceived": <num>,  (bytes of request and response bodies, as sent on the wire)
+#        "retries": {"staleConnection": <num>, "wait": <num>, "sessionExpired": <num>},
+#        "taskPolls": <num>, "logins": <num>, "logouts": <num>, "cacheHits": <num>, "memoHits": <num>}
+#
+import sys
+import json
+import math
+import time
+import threading
+
+# the request phases timed by redfishtoolTiming.py, in the order they are reported
+phaseNames=["connect", "tls", "send", "ttfb", "body"]
+
+
+# return the nearest-rank percentile pct (0-100) of the sorted list values.  0 if the list is empty
+def percentile(values, pct):
+    if( not values ):
+        return(0)
+    rank=math.ceil(pct/100.0 * len(values)) - 1
+    return(values[min(max(rank,0), len(values)-1)])
+
+
+# return {"total", "p50", "p95", "max"} of a list of times in seconds
+def summarizeTimes(values):
+    values=sorted(values)
+    return({"total": round(sum(values), 6), "p50": round(percentile(values,50), 6),
+            "p95": round(percentile(values,95), 6), "max": round(max(values or [0]), 6)})
+
+
+class RfStats():
+    retryKinds=["staleConnection", "wait", "sessionExpired"]
+    eventKinds=["taskPolls", "logins", "logouts", "cacheHits", "memoHits"]
+
+    def __init__(self):
+        self.startTime=time.time()
+        self.lock=threading.Lock()
+        self.requests=0
+        self.byMethod=dict()
+        self.byStatus=dict()
+        self.latencies=list()
+        self.phases=dict()
+        self.newConnections=0
+        self.bytesSent=0
+        self.bytesReceived=0
+        self.retries={kind: 0 for kind in self.retryKinds}
+        self.events={kind: 0 for kind in self.eventKinds}
+
+    # count one request.  status is the response status code, or None if no response was received
+    # phases is the dict of phase timings of the request from redfishtoolTiming.stopTiming()
+    def recordRequest(self, method, status, elapsed, bytesSent=0, bytesReceived=0, phases=None):
+        status="error" if( status is None ) else str(status)
+        with self.lock:
+            self.requests+=1
+            self.byMethod[method]=self.byMethod.get(method,0) + 1
+            self.byStatus[status]=self.byStatus.get(status,0) + 1
+            self.latencies.append(elapsed)
+            self.bytesSent+=bytesSent
+            self.bytesReceived+=bytesReceived
+            for name,seconds in (phases or {}).items():
+                if( name == "newConnections" ):
+                    self.newConnections+=seconds
+                else:
+                    self.phases.setdefault(name, list()).append(seconds)
+
+    # count a retry (one of retryKinds) or other event (one of eventKinds)
+    def countEvent(self, kind):
+        with self.lock:
+            if( kind in self.retries ):
+                self.retries[kind]+=1
+            else:
+                self.events[kind]=self.events.get(kind,0) + 1
+
+    def getSummary(self, rft, rc):
+        with self.lock:
+            summary={"subcommand": rft.subcommand, "rhost": rft.rhost, "rc": rc,
+                     "elapsed": round(time.time() - self.startTime, 6),
+                     "requests": self.requests, "byMethod": dict(self.byMethod), "byStatus": dict(self.byStatus),
+                     "latency": summarizeTimes(self.latencies),
+                     "phases": {name: summarizeTimes(self.phases[name]) for name in phaseNames if name in self.phases},
+                     "newConnections": self.newConnections,
+                     "bytesSent": self.bytesSent, "bytesReceived": self.bytesReceived,
+                     "retries": dict(self.retries)}
+            summary.update(self.events)
+        return(summary)
+
+    # write the summary to stderr (--stats) and/or append it to the --stats-file.  returns 0, or 5 if the file failed
+    def writeSummary(self, rft, rc):
+        line=json.dumps(self.getSummary(rft, rc))
+        if( rft.statsToStderr is True ):
+            print(line, file=sys.stderr)
+            sys.stderr.flush()
+        if( rft.statsFile is not None ):
+            try:
+                with open(rft.statsFile, "a") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                rft.printErr("Error: can't write stats file: {}: {}".format(rft.statsFile, e))
+                return(5)
+        return(0)
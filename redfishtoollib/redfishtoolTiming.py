@@ -0,0 +1,130 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolTiming.py
+#
+# Contents:
+# 1. startTiming, stopTiming, addPhase -- collect the phase timings of the request being sent by the calling thread
+#  - phases (seconds, from time.perf_counter):
+#       connect -- resolving the rhost name and TCP connect  } only if the request opened a new connection.
+#       tls     -- TLS handshake (https only)                } a request on a reused keep-alive connection has neither
+#       send    -- sending the request line, headers and body
+#       ttfb    -- time to first byte: from the request sent to the response headers received
+#       body    -- reading (and decompressing) the response body
+#  - newConnections is the number of connections the request opened (0 if it reused a pooled connection)
+# 2. Classes RfTimedHTTPConnection, RfTimedHTTPSConnection -- urllib3 connections that record the phase timings
+# 3. Class RfTimedHTTPAdapter -- requests HTTPAdapter whose connection pools use the timed connections.
+#       mounted on the requests session by RfTransport.getHttpSession
+#
+# This module imports urllib3 and requests, so it is only imported when the first request is sent
+#
+import time
+import threading
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from requests.adapters import HTTPAdapter
+
+phaseNames=["connect", "tls", "send", "ttfb", "body"]
+
+timingLocal=threading.local()
+
+
+# start collecting the phase timings of the next request sent by this thread
+def startTiming():
+    timingLocal.phases={"newConnections": 0}
+    timingLocal.headersAt=None
+    return(timingLocal.phases)
+
+
+# stop collecting, and return the phase timings.  body is the time from the response headers until now
+def stopTiming():
+    phases=getattr(timingLocal, "phases", None)
+    timingLocal.phases=None
+    if( phases is None ):
+        return(None)
+    if( timingLocal.headersAt is not None ):
+        phases["body"]=time.perf_counter() - timingLocal.headersAt
+    return(phases)
+
+
+# add seconds to a phase of the request being timed by this thread. redirects add to the same phases
+def addPhase(name, seconds):
+    phases=getattr(timingLocal, "phases", None)
+    if( phases is not None ):
+        phases[name]=phases.get(name, 0) + seconds
+
+
+# format the phase timings for the -ss and -sss status output, eg:
+#   "connect 0.002s, tls 0.031s, send 0.000s, ttfb 0.045s, body 0.001s"
+#   "send 0.000s, ttfb 0.045s, body 0.001s (reused connection)"
+def formatPhases(phases):
+    text=", ".join("{} {:.3f}s".format(name, phases[name]) for name in phaseNames if name in phases)
+    if( phases.get("newConnections",0) == 0 ):
+        text+=" (reused connection)"
+    return(text)
+
+
+class RfTimedConnectionMixin():
+    # open the TCP connection.  urllib3 resolves the rhost name (with its address family, socket options and fallback
+    # to the next address) and connects in one call, so the name lookup is part of the connect phase
+    def _new_conn(self):
+        t1=time.perf_counter()
+        try:
+            sock=super()._new_conn()
+        finally:
+            self.rfNewConnTime=time.perf_counter() - t1
+            addPhase("connect", self.rfNewConnTime)
+        addPhase("newConnections", 1)
+        return(sock)
+
+    # the tls handshake is the time connect() spends after the TCP connection is made
+    def connect(self):
+        self.rfNewConnTime=0
+        t1=time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            self.rfConnectTime=time.perf_counter() - t1
+            if( isinstance(self, HTTPSConnection) ):
+                addPhase("tls", self.rfConnectTime - self.rfNewConnTime)
+
+    # send the request.  For http, the connection is opened here too: that time is not counted in send
+    def request(self, *args, **kwargs):
+        self.rfConnectTime=0
+        t1=time.perf_counter()
+        try:
+            super().request(*args, **kwargs)
+        finally:
+            self.rfSentAt=time.perf_counter()
+            addPhase("send", self.rfSentAt - t1 - self.rfConnectTime)
+
+    def getresponse(self, *args, **kwargs):
+        r=super().getresponse(*args, **kwargs)
+        now=time.perf_counter()
+        addPhase("ttfb", now - getattr(self, "rfSentAt", now))
+        timingLocal.headersAt=now
+        return(r)
+
+
+class RfTimedHTTPConnection(RfTimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class RfTimedHTTPSConnection(RfTimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class RfTimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls=RfTimedHTTPConnection
+
+
+class RfTimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls=RfTimedHTTPSConnection
+
+
+class RfTimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme={"http": RfTimedHTTPConnectionPool,
+                                                 "https": RfTimedHTTPSConnectionPool}
@@ -0,0 +1,75 @@
+# Copyright Notice:
+# Copyright 2016 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfishtool/blob/main/LICENSE.md
+
+# redfishtool:  redfishtoolTrace.py
+#
+# Contents:
+# 1. Class RfTrace -- records the timeline of a command for --trace=<file>
+#  - the file is in the Chrome trace event json format, which loads in https://ui.perfetto.dev, chrome://tracing,
+#       speedscope and other trace viewers without a collector
+#  - span -- context manager that records a span for a phase of the command:
+#       discovery (GET /redfish and the service root), login, resolution (finding the -I|-M|-F|-1|-L member),
+#       operation (the subcommand), taskWait (waiting for an async task), cleanup (logout)
+#  - addSpan -- records a span.  The transport adds one "http" span per request, with the url, status, bytes and
+#       the connect, tls, send, ttfb, body phase timings of the request
+#  - spans are recorded on the thread that ran them (tid), so concurrent requests to collection members, and the
+#       hosts of a -r <hostList>, are shown on separate rows.  A span on a row contains the spans that ran inside it
+#  - write -- adds the "command" span for the whole command and writes the file. called by main at the end
+#
+import os
+import json
+import time
+import threading
+import contextlib
+
+
+class RfTrace():
+    def __init__(self, traceFile):
+        self.traceFile=traceFile
+        self.pid=os.getpid()
+        self.startTime=time.perf_counter()
+        self.events=list()
+        self.threadNames=dict()
+        self.lock=threading.Lock()
+
+    # record a complete span from start to end (time.perf_counter() values) on the calling thread
+    def addSpan(self, name, cat, start, end, args=None):
+        tid=threading.get_ident()
+        event={"name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": tid,
+               "ts": round((start - self.startTime) * 1000000, 1), "dur": round((end - start) * 1000000, 1)}
+        if( args ):
+            event["args"]=args
+        with self.lock:
+            self.events.append(event)
+            if( tid not in self.threadNames ):
+                self.threadNames[tid]=threading.current_thread().name
+
+    # usage:  with rft.trace.span("login"):  ...
+    # yields the args dict of the span, so the caller can add to it
+    @contextlib.contextmanager
+    def span(self, name, cat="phase", **args):
+        start=time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.addSpan(name, cat, start, time.perf_counter(), args)
+
+    # add the span of the whole command, and write the trace file.  returns 0, or 5 if the file could not be written
+    def write(self, rft, rc):
+        self.addSpan("command", "command", self.startTime, time.perf_counter(),
+                     {"subcommand": rft.subcommand, "rhost": rft.rhost, "rc": rc})
+        with self.lock:
+            events=[{"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": rft.program}}]
+            for tid,threadName in self.threadNames.items():
+                events.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": threadName}})
+            events.extend(self.events)
+        trace={"traceEvents": events, "displayTimeUnit": "ms",
+               "otherData": {"program": rft.program, "version": rft.version}}
+        try:
+            with open(self.traceFile, "w") as f:
+                json.dump(trace, f)
+        except OSError as e:
+            rft.printErr("Error: can't write trace file: {}: {}".format(self.traceFile, e))
+            return(5)
+        return(0)
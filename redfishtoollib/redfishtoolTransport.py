@@ -6,47 +6,116 @@
 #
 # Contents:
 # 1. Class RfSessionAuth --  holds auto-created session Auth info.  'requests' calls to get credentials
-# 2. Class RfTransport -- has the generic functions to send/receive http requests, generic print functions, etc  
+# 2. Class RfBasicAuth --  Basic auth with the Authorization header computed once
+# 3. Class RfCallContext -- the member selection options and request timing of one call into the transport
+# 4. Class RfTransport -- has the generic functions to send/receive http requests, generic print functions, etc  
 #  - transport object variables used to pass transport parameters from main to cmdTable and subcommand objects
 #  - getApiScheme function -- generates proper scheme (http|https) based on input options and type of API
+#  - getHttpSession, closeHttpSession -- create/close the requests Session holding the keep-alive connection pool
+#  - canShareTransportState, inheritTransportState -- reuse the pool, session and discovery of another transport
+#         for the commands of a --batch run
+#  - getCallContext, callContext -- the per-thread stack of call contexts.  rft.Link, rft.allOptn, rft.elapsed...
+#         are properties that go to the calling thread's current context (see RfCallContext)
+#  - httpRequest function -- sends one http request over the pooled session. reconnects on stale keep-alive sockets
 #  - getVersionAndSetRootPath  function -- executes GET /redfish with optional retry loop to negotiate protocol ver
 #         between this program and remote service, and creates the path of the root object
+#  - getDiscoveryCache, getCachedResponse, putCachedResponse, closeDiscoveryCache -- use the --cache-ttl on-disk
+#         cache of /redfish, the service root, and the top-level collections (see redfishtoolCache.py)
 #  - rftSendRecvRequest function--general function to send/receive Requests. handles exceptions, retries, error handling, headers
 #         handles proper joining of relative urls, selecting proper Auth and Scheme specified by user, etc
+#  - getRequestHeaders, buildRequestHeaders -- the default, caller and -H headers of a request. built once per method
+#  - getEnvironSettings -- the proxy environment variables and ~/.netrc auth, read once for each host of the command
+#  - getRequestMemoKey, getMemoizedResponse, memoizeResponse, clearRequestMemo -- per-command memo of GET responses
+#         used by rftSendRecvRequest so repeated identical GETs are only sent once
 #  - getPropFromDict --extracts a single property from a dict
 #  - getVersions      -- function to return the service versions:  GET ^/redfish
 #  - printVerbose -- common function used to print based on verbose level
+#  - printVerboseFmt -- printVerbose that only formats the message if the verbose level is enabled
+#  - isVerbose, isStatus -- True if printVerbose, printStatus would print at a level.  checked before formatting
+#  - writeOutput -- writes and flushes printVerbose, printStatus and printErr output, serialized by outputLock
 #  - printErr -- common function to print errors
 #  - printStatusErr4xx -- expands status_codes >400 to include description eg Unauthorized
+#  - formatPhases -- the connect, tls, send, ttfb, body timings of a request for the -ss and -sss status output
+#  - getResponseSize, getResponseBytes -- response body size, and size on the wire if compressed, for the -ss and
+#         -sss status output and --stats
+#  - recordRequest, countStat -- count requests, retries, logins... for --stats (see redfishtoolStats.py),
+#         and add the span of each request to the --trace (see redfishtoolTrace.py)
+#  - traceSpan -- records a span for a phase of the command (discovery, login, ...) in the --trace
 #  - rfSessionLogin, rfSessionDelete -- function to create or delete session if -ASession is selected (default)
 #  - rfCleanup -- called at end before returning. Deletes auto-created sessions
-#  - getPathBy --function that walks collection looking for a specific instance
-#  - getLevel2ResourceById -- searches a 2nd level collection (Processors) for -l urlLink, -m prop:val
+#  - loadCachedSession, saveCachedSession, dropCachedSession -- reuse Session logins across commands (--session-cache)
+#  - forgetSession -- forget a session that rhost rejected, so the next request logs in again (--agent)
+#  - getPathBy, findPathBy --function that walks collection looking for a specific instance
+#  - getLevel2ResourceById, findLevel2ResourceById -- searches a 2nd level collection (Processors) for -l urlLink, -m prop:val
+#         the get functions record the search as a "resolution" span in the --trace
+#  - getMemberPathsById -- finds the collection member links ending in /<Id>, used to resolve -I <Id> and -i <id>
+#         with one request instead of reading every member of the collection
 #  - listCollection -- create a list of a collection members including Id, <prop>, <rpath> of each member
 #         this is used by Systems and Chassis... to implement 'list' redfishtool command
 #  - getAllCollectionMembers -- given a url to a collection, get it, and then get all members,
 #         return dict with all members expanded
+#  - getProtocolFeature, getExpandQuery, addQueryToPath -- read ProtocolFeaturesSupported from the service root,
+#         and build OData query options the rhost supports
+#  - getExpandedCollection -- read a collection with $expand so all members are returned in one response
+#  - iterCollectionPages -- generator that reads the pages of a paged collection (Members@odata.nextLink),
+#         reading them concurrently with $skip/$top if rhost supports it
+#  - getMemberResponses -- GETs a list of member paths using up to maxInflight concurrent requests,
+#         yields the responses in the order of the list
+#  - runOnMembers -- runs an operation concurrently on each member of a collection, for the -a write operations
+#         (reset, patch, setAssetTag, setIndicatorLed, setPowerLimit).  returns the rc and data of each member
 #  - patchResource - generic patch function-handles etags and re-reading patched resource if response is 204
 #  - parseOdataType --parse the @odata.type property of a resource into Namespace, VersionString, ResourceType
 #
 # **Reference links for main requests
 #      https://github.com/kennethreitz/requests
 #
+# requests, urllib3, dateutil, and ipaddress are imported in the functions that use them, so that
+#   options parsing, -V, -h and help do not pay for importing them
+import io
 import os
 import re
-import requests
 import json
 import sys
-import socket
+import base64
 import time
-import ipaddress
-from datetime import datetime, timedelta
-from dateutil import parser
-from urllib.parse import urljoin, urlparse, urlunparse
-from requests.auth import HTTPBasicAuth, AuthBase
-from .ServiceRoot import RfServiceRoot
-
-class RfSessionAuth(AuthBase):
+import copy
+import threading
+import contextlib
+import functools
+from urllib.parse import urljoin, urlparse, urlunparse, unquote
+from .redfishtoolCache import RfDiscoveryCache, RfSessionCache, defaultCacheDir
+from .redfishtoolFleet import getOutputCapture, inheritOutputCapture
+
+# serializes the printVerbose, printStatus and printErr output of concurrent threads
+outputLock=threading.Lock()
+
+# a property name that can be used in a $select query option (no annotations or paths)
+selectablePropMatch=re.compile(r'^[A-Za-z0-9_]+$')
+
+# the @odata.type formats:  #<namespace>.<version>.<type>  where version may have periods in it,  or #<namespace>.<type>
+odataTypeMatch=re.compile(r'^#([a-zA-Z0-9]*)\.([a-zA-Z0-9\._]*)\.([a-zA-Z0-9]*)$')
+odataTypeNoVersionMatch=re.compile(r'^#([a-zA-Z0-9]*)\.([a-zA-Z0-9]*)$')
+
+# join the url of a request from the baseUrl and relPath passed to rftSendRecvRequest.  returns (urlBase2, url)
+# a command sends many requests with the same few baseUrls and relPaths, so the parsed and joined urls are cached
+@functools.lru_cache(maxsize=1024)
+def joinRequestUrl(scheme, baseUrl, relPath):
+    urlp=urlparse(baseUrl)
+    # if baseUrl scheme is https, use https no matter what the user specified scheme is.
+    #     this got upgraded from the service side as a redirect.
+    #     but we don't allow service to redirect us to a less secure scheme than the user specified one
+    if( urlp.scheme == 'https' ):
+        scheme='https'
+    # now unparse the api with most secure scheme
+    urlBase2=urlunparse([scheme, urlp.netloc, urlp.path, "","",""])
+    #join the baseURL and relative path passed in
+    #  note that if no relPath was specified, it defaults to None, which joins nothing to base URL
+    # this re-joining logic makes redfishtool correctly follow normal relative URL rules.
+    # although redfish does not allow local relative paths, redfishtool will work if they were implemented
+    return(urlBase2, urljoin(urlBase2,relPath))
+
+# requests accepts any callable as auth, so this does not need to subclass requests.auth.AuthBase
+class RfSessionAuth():
     def __init__(self,authToken):
         self.authToken=authToken
         #print("INIT SESSION AUTH")
@@ -56,6 +125,75 @@ class RfSessionAuth(AuthBase):
         #print("Call SESSION AUTH")
         return(r)
 
+# Basic auth with the Authorization header computed once, instead of base64 encoding the credentials on every
+#   request like requests.auth.HTTPBasicAuth
+class RfBasicAuth():
+    def __init__(self,user,password):
+        self.user=user
+        self.password=password
+        credentials="{}:{}".format(user,password).encode("latin1")
+        self.authorization="Basic " + base64.b64encode(credentials).decode("ascii")
+
+    def __call__(self, r):
+        r.headers['Authorization']=self.authorization
+        return(r)
+
+# the state of one call into the transport: the member selection options, and the timing of the last request.
+#   RfTransport reads and sets these through properties (rft.Link, rft.allOptn, rft.elapsed...) that go to the
+#   current context of the calling thread, so one transport (its connection pool, session login and caches) can be
+#   used by many threads that each select a different member.  see RfTransport.callContext
+class RfCallContext():
+    # the attributes of a context, and their values in a new transport
+    defaults={
+        # option parsing variables
+        "prop": None,
+        "Id": None,
+        "firstOptn": False,
+        "gotIdOptn": False,
+        "IdOptnCount": 0,
+        "gotPropOptn": False,
+        "oneOptn": False,
+        "allOptn": False,
+        "gotMatchOptn": False,
+        "matchProp": None,
+        "matchValue": None,
+        "gotEntriesOptn": False,
+        "IdLevel2": None,
+        "gotIdLevel2Optn": False,
+        "IdLevel2OptnCount": 0,
+        "gotMatchLevel2Optn": False,
+        "matchLevel2Prop": None,
+        "matchLevel2Value": None,
+        "linkLevel2": None,  # -l <link> or --link=<link>
+        "Link": None,        # -L <Link> or --Link=<link>
+        # the url of the collection that Link was read from, if the caller already read it (-a operations).
+        #     the operation then uses Link without reading the service root and the collection again
+        "collectionUrl": None,
+        # measured execution time, and the connect, tls, send, ttfb, body timings of the last request
+        "elapsed": None,
+        "lastPhases": None,
+        # True while sending a request whose error response the caller handles (eg the $expand probe of a collection):
+        #     a 4xx/5xx status is not printed
+        "quietStatusErr": False,
+    }
+    # the attributes copied back to the parent context when a context is popped, so the -ss status of the caller
+    #   shows the last request sent by the calls it made
+    resultAttrs=["elapsed", "lastPhases"]
+
+    # a new context starts as a copy of parent (or the defaults), with the overrides applied
+    def __init__(self, parent=None, **overrides):
+        self.parent=parent
+        if( parent is None ):
+            self.__dict__.update(self.defaults)
+        else:
+            for attr in self.defaults:
+                setattr(self, attr, getattr(parent, attr))
+        for attr,value in overrides.items():
+            if( attr not in self.defaults ):
+                raise AttributeError("RfCallContext has no attribute {}".format(attr))
+            setattr(self, attr, value)
+
+
 class RfTransport():
     def __init__(self):
         # constant parameters-- these dont change and are not updated
@@ -71,7 +209,6 @@ class RfTransport():
         self.authValidValues=["None", "Basic", "Session"]
         self.secureValidValues=["Never", "IfSendingCredentials", "IfLoginOrAuthenticatedApi", "Always"]
         self.supportedVersions=["v1"]      # list of RedfishProtocolVersions that this program supports
-        self.MaxNextLinks=10                # max number of requests allowed with NextLink
         self.dfltPatchPostPutHdrs = {'OData-Version': '4.0', 'Content-Type': 'application/json', 'Accept': 'application/json'  }
         self.dfltGetDeleteHeadHdrs = {'Accept': 'application/json', 'OData-Version': '4.0' }
 
@@ -92,34 +229,39 @@ class RfTransport():
         self.checkProtocolVer=False  # if -C option, then we need to check/verify the protocol ver. dflt=false
         self.blocking=True
         self.no_proxy=False
+        self.poolSize=10             # max number of keep-alive connections kept in the pool for each host
+        self.poolIdleTimeout=15      # seconds a pooled connection can be idle before we reconnect instead of reusing it
+        self.staleConnRetries=1      # times an idempotent request is resent if rhost dropped a pooled keep-alive connection
+        self.maxInflight=4           # max number of concurrent requests sent to a host when reading collection members
+        self.maxPages=None           # max number of pages read from a paged collection (Members@odata.nextLink). None=no limit
+        self.compression=True        # ask rhost for gzip/deflate compressed responses. False with --no-compression
+        self.cacheTtl=0              # seconds discovery responses are kept in the on-disk cache. 0=cache disabled
+        self.cacheDir=None           # directory for the discovery and session cache files. None=defaultCacheDir()
+        self.sessionCache=False      # if True (--session-cache), reuse a Session login saved by an earlier command
+        self.fleetWorkers=16         # max number of hosts a fleet command (-r <host1>,<host2>...) runs concurrently
+        self.batchFile=None          # --batch <file>: file with a redfishtool command per line.  "-" for stdin
+        self.fleetOutput="ndjson"    # fleet output format: "ndjson" (a record per line per host) or "json" (a list of records)
+        self.agentServe=False        # --agent-serve: run as an agent that runs the commands sent to it over a unix socket
+        self.agentClient=False       # --agent: send the command to a running agent instead of running it in this process
+        self.agentSocket=None        # unix socket path of the agent. None=default, see redfishtoolAgent.py
+        self.agentIdleTimeout=600    # seconds the agent keeps the session and discovery of an rhost that is not used
+        self.stats=None              # RfStats request counters if --stats or --stats-file.  see redfishtoolStats.py
+        self.statsToStderr=False     # --stats: write the stats summary to stderr at the end of the command
+        self.statsFile=None          # --stats-file=<file>: append the stats summary to <file> at the end of the command
+        self.trace=None              # RfTrace timeline of the command if --trace.  see redfishtoolTrace.py
+        self.traceFile=None          # --trace=<file>: write the timeline of the command to <file> at the end of the command
+        self.profile=None            # RfProfile if --profile=cpu|mem.  see redfishtoolProfile.py
+        self.profileMode=None        # --profile=<mode>: "cpu" or "mem"
+        self.profileFile=None        # --profile-file=<file>: cpu pstats file, or mem tracemalloc snapshot file
+
+        # the selection options (-P -I -M -L -1 -a -F -E, -i -m -l), and the timing of the last request, are
+        #     in the call context.  see RfCallContext.  rft.Link, rft.allOptn, rft.elapsed... are properties that
+        #     read and set the calling thread's current context
+        self.baseCallContext=RfCallContext()
+        self.callContextLocal=threading.local()
 
-        # more option parsing variables
-        self.prop=None
         self.requestMethod=None  #used by raw subcommand
         self.requestData=None    #used by raw subcommand
-        self.Id=None
-        self.firstOptn=False
-        self.gotIdOptn=False
-        self.IdOptnCount=0
-        self.gotPropOptn=False
-        self.oneOptn=False
-        self.allOptn=False
-        self.gotMatchOptn=False
-        self.matchProp=None
-        self.matchValue=None
-        self.gotEntriesOptn = False
-        
-        self.IdLevel2=None
-        self.gotIdLevel2Optn=False
-        self.IdLevel2OptnCount=0
-        
-        self.gotMatchLevel2Optn=False
-        self.matchLevel2Prop=None
-        self.matchLevel2Value=None
-
-        self.linkLevel2=None  # -l <link> or --link=<link>
-        
-        self.Link=None   # -L <Link> or --Link=<link>
         self.configFile=""      
         self.secure="IfLoginOrAuthenticatedApi" #Never
         self.waitTime=3
@@ -137,6 +279,27 @@ class RfTransport():
         self.rootResponseDict=None
         self.rhostSupportedVersions=None
         self.versionToUse=None
+
+        # requests Session holding the pooled keep-alive connections to rhost.
+        #     created on the 1st request, and reused by all APIs called for the command
+        self.httpSession=None
+        self.httpPoolSize=0          # the number of connections the session's adapter pools for each host
+        self.lastRequestTime=None
+        # the proxies and netrc auth from the environment for each scheme://host, read once (see getEnvironSettings)
+        self.environSettings=dict()
+
+        # per-request values that only depend on the command options, computed on first use by rftSendRecvRequest
+        self.basicAuth=None            # RfBasicAuth for rft.user, rft.password
+        self.requestHdrs=dict()        # default request headers by method, with -H and Accept-Encoding applied
+
+        # per-command memo of GET responses, so composite operations that read the same resource more than once
+        #     (eg Systems inventory) only send the request once.  cleared by any PATCH, POST, PUT or DELETE
+        self.requestMemo=dict()
+        self.requestMemoLock=threading.Lock()
+
+        # on-disk cache of the discovery responses (/redfish, service root, top-level collections) for rhost
+        #     created on first use if --cache-ttl was specified
+        self.discoveryCache=None
         
         # API parameters that are calculated for each (multiple) API call used to execute the cmd
         self.scheme=None   #not used any longer
@@ -149,11 +312,9 @@ class RfTransport():
         self.sessionLink=None
         self.authToken=None
         self.cleanupOnExit=True
-
-        # measured execution time
-        self.elapsed=None
-
-        requests.packages.urllib3.disable_warnings()
+        self.sessionLock=threading.RLock()   # so concurrent requests only login once
+        self.sessionFromCache=False          # True if authToken was read from the --session-cache file
+        self.reloginOn401=False              # True to login again if rhost rejects a session we still hold (--agent)
 
              
     # calculate the user-specified minimum security scheme based on APItype and --Secure options
@@ -178,6 +339,203 @@ class RfTransport():
             scheme="http"
             #print("else HTTP dflt")
         return(scheme)  #return ok
+
+
+    # get the requests Session used to send all requests for the command.
+    # The session keeps a pool of keep-alive connections for each host, so that multi-request commands only pay
+    #   the TCP connect and TLS handshake once instead of on every request
+    def getHttpSession(self):
+        if( self.httpSession is None ):
+            import requests
+            requests.packages.urllib3.disable_warnings()
+            session=requests.Session()
+            # requests reads the proxy environment variables, and ~/.netrc, on every request when trust_env is set.
+            # httpRequest reads them once for each host instead (see getEnvironSettings).  Without trust_env:
+            #  - a redirect to another host is sent with the proxies of the first host, and without its ~/.netrc auth
+            #  - REQUESTS_CA_BUNDLE and CURL_CA_BUNDLE are not read.  they are only used to verify certificates,
+            #    and redfishtool sends its requests with verify=False
+            session.trust_env=False
+            self.httpSession=session
+            self.httpPoolSize=0
+        # the pool must hold at least one connection for each concurrent request, or they will not be reused.
+        # a session inherited from an earlier --batch or --agent command may have a smaller pool: replace its adapter
+        # the adapter's connections record the connect, tls... timings of each request (see redfishtoolTiming.py)
+        poolSize=max(self.poolSize, self.maxInflight)
+        if( self.httpPoolSize < poolSize ):
+            from .redfishtoolTiming import RfTimedHTTPAdapter
+            oldAdapter=self.httpSession.adapters.get("https://")
+            adapter=RfTimedHTTPAdapter(pool_maxsize=poolSize)
+            self.httpSession.mount("http://", adapter)
+            self.httpSession.mount("https://", adapter)
+            if( oldAdapter is not None ):
+                oldAdapter.close()
+            self.httpPoolSize=poolSize
+        return(self.httpSession)
+
+
+    # return the settings requests would read from the environment for a request to url: the proxies from the
+    #   *_PROXY and NO_PROXY variables, and the ~/.netrc auth for the host.  --no-proxy bypasses all proxies for
+    #   this command only, without changing the environment of the process (eg an --agent-serve that outlives it)
+    #   They are read once for each scheme://host of the command, and cached
+    def getEnvironSettings(self, url):
+        urlp=urlparse(url)
+        key=(urlp.scheme, urlp.netloc, self.no_proxy)
+        settings=self.environSettings.get(key)
+        if( settings is None ):
+            from requests.utils import get_environ_proxies, get_netrc_auth
+            noProxy="*" if self.no_proxy else None
+            settings={"proxies": get_environ_proxies(url, no_proxy=noProxy), "netrcAuth": get_netrc_auth(url)}
+            self.environSettings[key]=settings
+        return(settings)
+
+
+    # close all pooled connections.  A new session is created if another request is sent
+    def closeHttpSession(self):
+        if( self.httpSession is not None ):
+            self.httpSession.close()
+            self.httpSession=None
+            self.httpPoolSize=0
+        self.lastRequestTime=None
+
+
+    # transport state that is reused by the commands of a --batch run, so they share one connection pool,
+    # one session login, and one discovery of rhost
+    sharedStateAttrs=["httpSession", "httpPoolSize", "lastRequestTime", "environSettings", "discoveryCache",
+                      "rhostVersions", "rootPath", "rootUri", "rootResponseDict", "rhostSupportedVersions", "versionToUse",
+                      "sessionLock", "sessionId", "sessionLink", "authToken", "cleanupOnExit", "sessionFromCache",
+                      "reloginOn401"]
+
+    # True if this command goes to the same rhost with the same credentials as rft, so it can share rft's state
+    def canShareTransportState(self, rft):
+        return( (self.rhost == rft.rhost) and (self.user == rft.user) and (self.password == rft.password) and
+                (self.auth == rft.auth) and (self.token == rft.token) and (self.secure == rft.secure) and
+                (self.protocolVer == rft.protocolVer) )
+
+    # copy the shared transport state from rft to this transport
+    def inheritTransportState(self, rft):
+        for attr in self.sharedStateAttrs:
+            setattr(self, attr, getattr(rft, attr))
+        return(0)
+
+
+    # return the current call context of the calling thread: the last one it pushed with callContext(), or the
+    #   transport's base context (the command-line options) if it has not pushed one
+    def getCallContext(self):
+        stack=getattr(self.callContextLocal, "stack", None)
+        if( stack ):
+            return(stack[-1])
+        return(self.baseCallContext)
+
+    # run calls with a new call context on the calling thread.  usage:
+    #     with rft.callContext(Link=memberLink, allOptn=False, gotIdOptn=True, IdOptnCount=1):
+    #         rc,r,j,d=op.get(sc,op,rft)
+    #  -- the new context is a copy of parent, or of the calling thread's current context, with the overrides applied.
+    #     A worker thread passes the context of the thread that started it as parent
+    #  -- when the block exits, the previous context is current again, and gets the elapsed and lastPhases of the
+    #     last request sent in the block
+    @contextlib.contextmanager
+    def callContext(self, parent=None, **overrides):
+        if( parent is None ):
+            parent=self.getCallContext()
+        context=RfCallContext(parent, **overrides)
+        stack=getattr(self.callContextLocal, "stack", None)
+        if( stack is None ):
+            stack=self.callContextLocal.stack=list()
+        stack.append(context)
+        try:
+            yield context
+        finally:
+            stack.pop()
+            for attr in RfCallContext.resultAttrs:
+                setattr(parent, attr, getattr(context, attr))
+
+
+    # send one http request to rhost over the pooled session
+    # usage:  r=rft.httpRequest(method, url, <requests kwargs: headers, auth, verify, data, timeout...>)
+    #  -- sets rft.elapsed to the response time of the request, and rft.lastPhases to its phase timings
+    #  -- requests exceptions are raised to the caller, which handles them
+    def httpRequest(self, method, url, **kwargs):
+        import requests
+        from urllib3.exceptions import ProtocolError
+        from .redfishtoolTiming import startTiming, stopTiming
+        session=self.getHttpSession()
+        environSettings=self.getEnvironSettings(url)
+        kwargs.setdefault("proxies", environSettings["proxies"])
+        if( (kwargs.get("auth") is None) and (environSettings["netrcAuth"] is not None) ):
+            kwargs["auth"]=environSettings["netrcAuth"]
+
+        # BMCs commonly close keep-alive connections after a few seconds of idle time.
+        # If the pool has been idle longer than poolIdleTimeout, drop the pooled connections and reconnect
+        if( (self.lastRequestTime is not None) and (time.time() - self.lastRequestTime > self.poolIdleTimeout) ):
+            self.printVerboseFmt(5,"Transport: pool idle for more than {} sec. reconnecting",self.poolIdleTimeout)
+            session.close()
+
+        attempt=0
+        while True:
+            t1=time.perf_counter()
+            startTiming()
+            try:
+                r=session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self.lastPhases=stopTiming()
+                self.recordRequest(method, url, None, t1, time.perf_counter(), kwargs.get("data"), self.lastPhases, error=e)
+                if( not isinstance(e, requests.exceptions.ConnectionError) ):
+                    raise
+                # if rhost dropped a pooled keep-alive connection as we reused it, the request fails with a ProtocolError
+                # (eg "Connection aborted, RemoteDisconnected").  Resend idempotent requests on a new connection.
+                # POST and PATCH are not resent since we can't tell if rhost executed them
+                staleConn=( (len(e.args) > 0) and isinstance(e.args[0], ProtocolError) )
+                if( staleConn and (attempt < self.staleConnRetries) and (method in ("GET","HEAD","DELETE","PUT")) ):
+                    attempt+=1
+                    self.countStat("staleConnection")
+                    self.printVerbose(5,"Transport: pooled connection dropped by rhost, resending on new connection")
+                    session.close()
+                    continue
+                raise
+            finally:
+                self.lastRequestTime=time.time()
+            t2=time.perf_counter()
+            self.elapsed=t2 - t1
+            self.lastPhases=stopTiming()
+            self.recordRequest(method, url, r, t1, t2, kwargs.get("data"), self.lastPhases)
+            return(r)
+
+    # count a request for --stats, and add its span to the --trace.  start and end are time.perf_counter() values
+    # r is the response, or None if the request failed without a response (error is the exception)
+    def recordRequest(self, method, url, r, start, end, data, phases=None, error=None):
+        if( (self.stats is None) and (self.trace is None) ):
+            return(0)
+        if( isinstance(data,str) ):
+            data=data.encode("utf-8")
+        bytesSent=len(data) if( isinstance(data,(bytes,bytearray)) ) else 0
+        status=None
+        bytesReceived=0
+        if( r is not None ):
+            status=r.status_code
+            bodyBytes,encoding,wireBytes=self.getResponseBytes(r)
+            bytesReceived=bodyBytes if( wireBytes is None ) else wireBytes
+        if( self.stats is not None ):
+            self.stats.recordRequest(method, status, end - start, bytesSent, bytesReceived, phases=phases)
+        if( self.trace is not None ):
+            args={"url": url, "status": status, "bytesSent": bytesSent, "bytesReceived": bytesReceived}
+            if( phases is not None ):
+                args.update({name: round(seconds, 6) for name,seconds in phases.items()})
+            if( error is not None ):
+                args["error"]=str(error)
+            self.trace.addSpan("{} {}".format(method, urlparse(url).path), "http", start, end, args)
+        return(0)
+
+    # usage:  with rft.traceSpan("login"):  ...   records a span for a phase of the command if --trace
+    def traceSpan(self, name, **args):
+        if( self.trace is None ):
+            return(contextlib.nullcontext(args))
+        return(self.trace.span(name, **args))
+
+    # count a retry or other event for --stats.  see RfStats for the kinds of events
+    def countStat(self, kind):
+        if( self.stats is not None ):
+            self.stats.countEvent(kind)
+        return(0)
             
     def getVersionsAndSetRootPath(self,rft,forceCheckProtocolVer=False):
         # Read the Redfish Versions API (/redfish) to determine which protocol versions the service supports
@@ -196,6 +554,7 @@ class RfTransport():
         #    shared NICs where the network path can goes away for a few seconds as the host OS boots and NICs
         #    reset and authenticate with switches. If we wait until we have a connection to start, most false
         #    failures are avoided (although the connection can also go away during cmd exec-but that window is smaller
+        import requests
         rft.printVerbose(5,"getVersionsAndRootPath: read versions from rhost")
 
         # if already executed, just return
@@ -220,6 +579,7 @@ class RfTransport():
 
             rhost = rft.rhost
             try:
+                import ipaddress
                 if ipaddress.ip_address(rhost).version == 6:
                     rhost = '[{}]'.format(rhost)
             except ValueError:
@@ -231,7 +591,7 @@ class RfTransport():
             # save parameters
             rft.rhostSupportedVersions=None
             rft.versionToUse=rft.protocolVer
-            rft.printVerbose(5,"Transport.getRootPath: protocolVer to use={},  rootPath={}".format(rft.versionToUse, rft.rootPath))
+            rft.printVerboseFmt(5,"Transport.getRootPath: protocolVer to use={},  rootPath={}",rft.versionToUse,rft.rootPath)
             return(0,None,False,None) # return ok
 
         # create scheme based on input parameters and apiType(set here) using setApiScheme() function above.
@@ -243,19 +603,22 @@ class RfTransport():
         scheme_tuple=[scheme, rft.rhost, "/redfish", "","",""]
         url=urlunparse(scheme_tuple)                # url= "http[s]://<rhost>[:<port>]/redfish"
         
-        rft.printVerbose(5,"Transport.getRootPath: url={}".format(url))
+        rft.printVerboseFmt(5,"Transport.getRootPath: url={}",url)
 
         # now send request to rhost, with retries based on -W <waitNum>:<waitTime> option.
         # handle exceptions including timeouts.
         success=None
-        r=None
-        for attempt in range(0,rft.waitNum):
+        waitNum=rft.waitNum
+        r=rft.getCachedResponse('GET', url)
+        if( r is not None ):   # read from the --cache-ttl discovery cache. no need to wait for rhost
+            success=True
+            waitNum=0
+        for attempt in range(0,waitNum):
+            if( attempt > 0 ):
+                rft.countStat("wait")
             try:
-                rft.printVerbose(3,"Transport:getVersions: GET {}".format(url))
-                t1=time.time()
-                r = requests.get(url, headers=hdrs, verify=False, timeout=(rft.waitTime,rft.timeout))  # GET ^/redfish
-                t2=time.time()
-                rft.elapsed = t2 - t1
+                rft.printVerboseFmt(3,"Transport:getVersions: GET {}",url)
+                r = rft.httpRequest('GET', url, headers=hdrs, verify=False, timeout=(rft.waitTime,rft.timeout))  # GET ^/redfish
                 # print request headers
                 rft.printStatus(3,r=r,authMsg=None)
 
@@ -263,7 +626,7 @@ class RfTransport():
                 # connect timeout occurred.  try again w/o sleeping since a timeout already occurred
                 rft.printVerbose(5,"Transport: connectTimeout, try again")
                 pass
-            except (socket.error):
+            except (OSError):
                 # this exception needed as requests is not catching socket timeouts
                 #  especially "connection refused" eg web server not started
                 # issue: https://github.com/kennethreitz/requests/issues/1236
@@ -303,9 +666,10 @@ class RfTransport():
         
         #print the response status (-ssss)
         rft.printStatus(4,r=r)
+        rft.putCachedResponse('GET', url, r)
         
         # if here, r is the response to the GET /redfish  request
-        rft.printVerbose(5,"Transport: getVersionsAndRootPath: Get /redfish: statusCode: {}".format(r.status_code))
+        rft.printVerboseFmt(5,"Transport: getVersionsAndRootPath: Get /redfish: statusCode: {}",r.status_code)
             
         # load it into a python dictionary
         try:
@@ -364,9 +728,77 @@ class RfTransport():
         #rft.rootUri=self.scheme+self.rhost+self.rootPath
         rft.rhostSupportedVersions=list(serviceSupportedVersions)
         rft.versionToUse=rfVer
-        rft.printVerbose(5,"Transport.getRootPath: protocolVer to use={},  rootPath={}".format(rfVer, rft.rootPath))
+        rft.printVerboseFmt(5,"Transport.getRootPath: protocolVer to use={},  rootPath={}",rfVer,rft.rootPath)
         return(0,r,True,rft.rhostVersions) # return ok
 
+    # return the discovery cache for rhost and user, or None if --cache-ttl was not specified
+    def getDiscoveryCache(self):
+        if( (self.cacheTtl <= 0) or (self.rhost is None) ):
+            return(None)
+        if( self.discoveryCache is None ):
+            cacheDir=self.cacheDir
+            if( cacheDir is None ):
+                cacheDir=defaultCacheDir()
+            self.discoveryCache=RfDiscoveryCache(cacheDir, self.cacheTtl, self.rhost, self.user)
+        return(self.discoveryCache)
+
+    # the discovery cache only holds: GET /redfish, the service root, and the top-level collections that the
+    #   service root links to (eg /redfish/v1/Systems).  urls with a query are not cached
+    def isDiscoveryUrl(self, url):
+        urlp=urlparse(url)
+        if( urlp.query ):
+            return(False)
+        path=urlp.path.rstrip('/')
+        if( path == "/redfish" ):
+            return(True)
+        if( (self.rootPath is not None) and (path == self.rootPath.rstrip('/')) ):
+            return(True)
+        if( isinstance(self.rootResponseDict,dict) ):
+            for prop in self.rootResponseDict.values():
+                if( isinstance(prop,dict) and isinstance(prop.get("@odata.id"),str) and
+                    (prop["@odata.id"].rstrip('/') == path) ):
+                    return(True)
+        return(False)
+
+    # return the cached response to GET url, or None if it has to be read from rhost
+    def getCachedResponse(self, method, url):
+        cache=self.getDiscoveryCache()
+        if( (cache is None) or (method != 'GET') or (not self.isDiscoveryUrl(url)) ):
+            return(None)
+        r=cache.get(url)
+        if( r is not None ):
+            self.countStat("cacheHits")
+            self.printVerboseFmt(4,"Transport: read {} from discovery cache",url)
+            self.elapsed=0.0
+            self.lastPhases=None
+        return(r)
+
+    # add the response to GET url to the discovery cache if it is a discovery url. paged collections are not cached
+    def putCachedResponse(self, method, url, r):
+        cache=self.getDiscoveryCache()
+        if( (cache is None) or (method != 'GET') or (r is None) or (r.status_code != 200) or
+            getattr(r,"fromCache",False) or (not self.isDiscoveryUrl(url)) ):
+            return(0)
+        if( "Members@odata.nextLink" in r.text ):
+            return(0)
+        cache.put(url, r)
+        return(0)
+
+    # called by main at the end of a command: save the discovery cache if the command succeeded.
+    # If it failed, delete it--it may be what caused the failure, eg a member that no longer exists
+    def closeDiscoveryCache(self, rc):
+        if( self.discoveryCache is None ):
+            return(0)
+        if( rc == 0 ):
+            if( self.discoveryCache.save() != 0 ):
+                self.printVerbose(1,"Transport: could not write discovery cache file: {}".format(self.discoveryCache.cacheFile))
+        else:
+            self.printVerboseFmt(4,"Transport: command failed. deleting discovery cache: {}",self.discoveryCache.cacheFile)
+            self.discoveryCache.invalidate()
+        self.discoveryCache=None
+        return(0)
+
+
     #'''
     # the main workhorse send/receive request function used to send gets, patches, posts, deletes...
     # handles the following processing within this function:
@@ -390,74 +822,47 @@ class RfTransport():
 
     def rftSendRecvRequest( rft, apiType, method, baseUrl, relPath=None, data=None, jsonData=True,  prop=None,
                             redirects=True, reqData=None, verify=False,
-                            headersInput=None, **kwargs ):
+                            headersInput=None, followNextLink=True, **kwargs ):
+        import requests
 
-        rft.printVerbose(5,"Transport.rftProcessRequest: method={}, baseUrl={}, rpath={}".format(method,baseUrl,relPath))
-        rft.printVerbose(5,"Transport.rftProcessRequest: apiType={}".format(apiType))
+        rft.printVerboseFmt(5,"Transport.rftProcessRequest: method={}, baseUrl={}, rpath={}",method,baseUrl,relPath)
+        rft.printVerboseFmt(5,"Transport.rftProcessRequest: apiType={}",apiType)
         # get scheme based on input parameters and apiType(set here) using getApiScheme() function above.
         userSpecifiedScheme=rft.getApiScheme(apiType)
 
-        # parse url into its parts: scheme, netloc, path, params, query fragment
+        # join baseUrl and relPath with the most secure scheme.  see joinRequestUrl()
         # the assumption is that baseUrl was the url sent back from the previous request--might have been a redirect
-        # urlp is a urlparse Response class
-        urlp=urlparse(baseUrl)
-
-        # if baseUrl scheme is https, use https no matter what the user specified scheme is.
-        #     this got upgraded from the service side as a redirect.
-        #     but we don't allow service to redirect us to a less secure scheme than the user specified one
-        if( urlp.scheme == 'https' ):
-            scheme='https'
-        else:
-            scheme=userSpecifiedScheme;
-
-        # now unparse the api with most secure scheme
-        scheme_tuple=[scheme, urlp.netloc, urlp.path, "","",""]
-        urlBase2=urlunparse(scheme_tuple)
+        urlBase2,url=joinRequestUrl(userSpecifiedScheme, baseUrl, relPath)
+
+        # if only one property is needed (-P <prop>) and rhost supports $select, only ask rhost for that property.
+        # the full resource is not sent by rhost, and getPropFromDict() below has much less json to parse
+        if( (method == "GET") and (prop is not None) and (selectablePropMatch.match(prop) is not None) and
+            (rft.getProtocolFeature(rft,"SelectQuery") is True) ):
+            url=rft.addQueryToPath(url, "$select=" + prop)
+
+        # if this GET was already done in this command, return the same response again.
+        # any request that could change a resource clears all the saved responses
+        # the pages of a paged collection (followNextLink=False) are only read once, so they are not saved
+        memoKey=None
+        if( (method == "GET") and followNextLink ):
+            memoKey=rft.getRequestMemoKey(apiType, url, prop, jsonData, followNextLink, headersInput)
+            memo=rft.getMemoizedResponse(memoKey)
+            if( memo is not None ):
+                rft.printVerboseFmt(4,"Transport:SendRecv: {} {}: response already read in this command",method,url)
+                return(memo)
+        elif( method != "HEAD" ):
+            rft.clearRequestMemo()
         
-        #join the baseURL and relative path passed in
-        #  note that if no relPath was specified, it defaults to None, which joins nothing to base URL
-        # this re-joining logic makes redfishtool correctly follow normal relative URL rules.
-        # although redfish does not allow local relative paths, redfishtool will work if they were implemented
-        url=urljoin(urlBase2,relPath)
-        
-        #define headers.
-        # the transport will use defaults specified in the Transport defaults properties dfltXYZHdrs depending on method XYZ.
-        # if headers were passed in by a command function in property headersInput, then add them or modify default with those values
-        # And also: if addl headers were specified in the commandline -H <hdrs> option, add them to the defaults above
-
-        # ex self.dfltPatchPostPutHdrs  = {"content-type": "application/json", "Accept": "application/json", "OData-Version": "4.0" }
-        # ex self.dfltGetDeleteHeadHdrs = {"Accept": "application/json", "OData-Version": "4.0" }
-
-
-        # get default headers based on the method being called
-        if( (method == 'PATCH') or (method == 'POST') or (method == 'PUT') ):
-            hdrlist=rft.dfltPatchPostPutHdrs
-        else:  # method is GET, DELETE, HEAD
-            hdrlist=rft.dfltGetDeleteHeadHdrs
-
-        # make copy of the dict.  Otherwise Requests is sometimes not adding addl headers.  a byte vs string bug in requests
-        hdrs=dict(hdrlist)
-
-        # if a list of headers was sent in in the function, then add them (or update defaults with new values)
-        if( headersInput is not None):  # headers passed in from a calling function overrides defaults
-            for key in headersInput:
-                hdrs[key]=headersInput[key]
-            
-        # check and see if an additional/alternate hdr value was passed in on CLI as -H option
-        if( rft.headers is not None):
-            # a user passed-in an addl header using -H {A:B, C:D},
-            # This changes the current value or adds the new header if it doesn't already exist
-            for key in rft.headers:
-                hdrs[key]=rft.headers[key]
-                           
-        #print("hdrs:{}".format(hdrs))
-        hdrs['Accept-Encoding']=None
+        #define headers.  see getRequestHeaders()
+        # get default headers based on the method being called, with the -H headers and Accept-Encoding applied.
+        # they are the same for every request of the command, so they are only built once for each method
+        hdrs=rft.getRequestHeaders(method, headersInput)
                 
         #calculate the authentication method
         authType=None
         authMsg=None
 
-        rft.printVerbose(5,"Transport.ProcessRequest: url={}".format(url))
+        rft.printVerboseFmt(5,"Transport.ProcessRequest: url={}",url)
         authenticatedApi=None
         if( (apiType==rft.UNAUTHENTICATED_API) or (apiType==rft.UNAUTHENTICATED_WITH_CREDENTIALS_API)):
             authenticatedApi=False
@@ -468,17 +873,27 @@ class RfTransport():
             authType=None
             authMsg=None
         elif( (authenticatedApi is True) and (rft.auth=="Basic")):
-            authType=HTTPBasicAuth(rft.user, rft.password)
+            if( (rft.basicAuth is None) or (rft.basicAuth.user != rft.user) or (rft.basicAuth.password != rft.password) ):
+                rft.basicAuth=RfBasicAuth(rft.user, rft.password)
+            authType=rft.basicAuth
             authMsg="Basic"
         elif( (authenticatedApi is True) and (rft.auth=="Session")):
-            if( rft.authToken is None):   # ie: we dont already have a token that was passed in or previously loggedin
-                rc,r,j,d=rft.rfSessionLogin(rft)  #cleanup=true tells the transport to logout at end of cmd
-                #this will save the authToken at rft.token, and sessionLink at rft.sessionLink
-                if( rc != 0):  # error logging in
-                    return(rc,r,j,d)
+            with rft.sessionLock:
+                # if --session-cache, first try the session saved by an earlier command
+                if( (rft.authToken is None) and (rft.sessionCache is True) ):
+                    rft.loadCachedSession(rft)
+                if( rft.authToken is None):   # ie: we dont already have a token that was passed in or previously loggedin
+                    with rft.traceSpan("login"):
+                        rc,r,j,d=rft.rfSessionLogin(rft)  #cleanup=true tells the transport to logout at end of cmd
+                    #this will save the authToken at rft.token, and sessionLink at rft.sessionLink
+                    if( rc != 0):  # error logging in
+                        return(rc,r,j,d)
+                    if( rft.sessionCache is True ):
+                        rft.saveCachedSession(rft)
+                authToken=rft.authToken
             # now we should have a valid auth token. create an instance of this auth
             authMsg="Session"
-            authType=RfSessionAuth(rft.authToken)
+            authType=RfSessionAuth(authToken)
         else:  # unknown auth type or API
             rft.printErr("Transport: Invalid auth type specified, aborting command")
             return(4,None,False,None)
@@ -487,128 +902,220 @@ class RfTransport():
         # handle exceptions including timeouts.
         success=None
         r=None
-        respd=None
-        nextLink=True
-        for attempt in range(0,rft.MaxNextLinks):
-            try:
-                rft.printVerbose(3,"Transport:SendRecv:    {} {}".format(method,url))
-                t1=time.time()
-                r = requests.request(method, url, headers=hdrs, auth=authType, verify=verify, data=reqData,
+        try:
+            rft.printVerboseFmt(3,"Transport:SendRecv:    {} {}",method,url)
+            r=rft.getCachedResponse(method, url)
+            if( r is None ):
+                r = rft.httpRequest(method, url, headers=hdrs, auth=authType, verify=verify, data=reqData,
                                      timeout=(rft.waitTime,rft.timeout),**kwargs)  # GET ^/redfish
-                t2=time.time()
-                rft.elapsed = t2 - t1
-                # print request headers
-                rft.printStatus(3,r=r,authMsg=authMsg)
-
-            except requests.exceptions.ConnectTimeout:
-                # connect timeout occured.  try again w/o sleeping since a timeout already occured
-                rft.printVerbose(5,"Transport: connectTimeout, try again")
-                return(5,r,False,None)
-            except (socket.error):
-                # this exception needed as requests is not catching socket timeouts
-                #  especially "connection refused" eg web server not started
-                # issue: https://github.com/kennethreitz/requests/issues/1236
-                # Nothing timed out.  this is a connect error. So wait and retry
-                rft.printVerbose(5,"Transport: socket.error,  wait and try again")
-                time.sleep(rft.waitTime)
-                return(5,r,False,None)
-            except (requests.exceptions.ReadTimeout):
-                # read timeout occurred. This shouldn't happen, so fail it
-                rft.printErr("Transport: Fatal timeout waiting for response from rhost")
-                return(5,r,False,None)
-            except (requests.exceptions.ConnectionError):
-                # eg DNS error, connection refused.  wait and try again
-                rft.printVerbose(5,"Transport: ConnectionError, wait and try again")
-                time.sleep(rft.waitTime)
+                rft.putCachedResponse(method, url, r)
+            # print request headers
+            rft.printStatus(3,r=r,authMsg=authMsg)
+
+        except requests.exceptions.ConnectTimeout:
+            # connect timeout occured.  try again w/o sleeping since a timeout already occured
+            rft.printVerbose(5,"Transport: connectTimeout, try again")
+            return(5,r,False,None)
+        except (OSError):
+            # this exception needed as requests is not catching socket timeouts
+            #  especially "connection refused" eg web server not started
+            # issue: https://github.com/kennethreitz/requests/issues/1236
+            # Nothing timed out.  this is a connect error. So wait and retry
+            rft.printVerbose(5,"Transport: socket.error,  wait and try again")
+            time.sleep(rft.waitTime)
+            return(5,r,False,None)
+        except (requests.exceptions.ReadTimeout):
+            # read timeout occurred. This shouldn't happen, so fail it
+            rft.printErr("Transport: Fatal timeout waiting for response from rhost")
+            return(5,r,False,None)
+        except (requests.exceptions.ConnectionError):
+            # eg DNS error, connection refused.  wait and try again
+            rft.printVerbose(5,"Transport: ConnectionError, wait and try again")
+            time.sleep(rft.waitTime)
+            return(5,r,False,None)
+        except requests.exceptions.RequestException as e:
+            # otherl requests exceptions.  return with error
+            rft.printErr("Transport: Fatal exception trying to connect to rhost. Error:{}".format(e))
+            return(5,r,False,None)
+        else:  # if no exception
+            rc=0
+            #print the response status (-ssss)
+            rft.printStatus(4,r=r,authMsg=authMsg)
+            rft.printStatus(5,r=r,authMsg=authMsg)
+            #rft.printStatus(5,data=r.text)  # print the response data (-ssssss)
+            
+            # if the cached or held session has expired or was deleted, forget it, login again and resend the request
+            if( (r.status_code == 401) and (authMsg == "Session") and (rft.sessionFromCache or rft.reloginOn401) ):
+                with rft.sessionLock:
+                    if( rft.authToken == authToken ):
+                        rft.printVerbose(4,"Transport: session was rejected. login again")
+                        if( rft.sessionFromCache ):
+                            rft.dropCachedSession(rft)
+                        else:
+                            rft.forgetSession(rft)
+                rft.countStat("sessionExpired")
+                return(rft.rftSendRecvRequest(apiType, method, baseUrl, relPath=relPath, data=data, jsonData=jsonData,
+                                              prop=prop, redirects=redirects, reqData=reqData, verify=verify,
+                                              headersInput=headersInput, followNextLink=followNextLink, **kwargs))
+            if( r.status_code >= 400):
+                if( not rft.quietStatusErr ):
+                    rft.printStatusErr4xx(r.status_code)
                 return(5,r,False,None)
-            except requests.exceptions.RequestException as e:
-                # otherl requests exceptions.  return with error
-                rft.printErr("Transport: Fatal exception trying to connect to rhost. Error:{}".format(e))
+            if( r.status_code == 302):
+                rft.printErr("Transport: Redirected: status_code: {}".format(r.status_code))
                 return(5,r,False,None)
-            else:  # if no exception
-                rc=0
-                #print the response status (-ssss)
-                rft.printStatus(4,r=r,authMsg=authMsg)
-                rft.printStatus(5,r=r,authMsg=authMsg)
-                #rft.printStatus(5,data=r.text)  # print the response data (-ssssss)
-                
-                if( r.status_code >= 400):
-                    rft.printStatusErr4xx(r.status_code)
-                    return(5,r,False,None)
-                if( r.status_code == 302):
-                    rft.printErr("Transport: Redirected: status_code: {}".format(r.status_code))
-                    return(5,r,False,None)
 
-                if( r.status_code==204):
-                    success=True
-                    return(rc,r,False,None)
-                elif( (r.status_code==200) and (method=="HEAD") ):
-                    success=True
-                    return(rc,r,False,None)
-                elif (r.status_code == 202 and method in ["DELETE", "PATCH", "POST", "PUT"]):
-                    success = True
-                    if rft.blocking and r.headers.get("Location"):
+            if( r.status_code==204):
+                success=True
+                return(rc,r,False,None)
+            elif( (r.status_code==200) and (method=="HEAD") ):
+                success=True
+                return(rc,r,False,None)
+            elif (r.status_code == 202 and method in ["DELETE", "PATCH", "POST", "PUT"]):
+                success = True
+                if rft.blocking and r.headers.get("Location"):
+                    with rft.traceSpan("taskWait", taskMonitor=r.headers.get("Location")):
                         return rft.waitForTask(r, urlBase2, headers=hdrs, auth=authType,
                                                verify=verify, jsonData=jsonData, **kwargs)
+                else:
+                    rft.printTaskStatus("Task Monitor URL is %s\n" %
+                                        r.headers.get("Location", "<not available>"))
+                    return (rc, r, False, None)
+            elif((r.status_code==200) or (r.status_code==201) ):  
+                if( jsonData is True):
+                    try:
+                        d=json.loads(r.text)
+                    except ValueError:
+                        rft.printErr("Transport: Error loading Data: uri: {}".format(url))
+                        rc=5
+                        jsonData=False
+                        return(rc,r,False,None)
+                else:
+                    d=r.text #xml data
+                    return(rft.memoizeResponse(memoKey,rc,r,jsonData,d))
+
+                #if here, no error, and its json data
+                # if specific property was specified, filter here
+                if(( method == "GET") and (prop is not None) ):
+                    rc,r,j,d=rft.getPropFromDict(rft,r,d,prop)
+                    return(rft.memoizeResponse(memoKey,rc,r,j,d))
+                # if this is a paged collection, read the rest of the pages and return all members in one response
+                if( followNextLink and isinstance(d,dict) and ("Members@odata.nextLink" in d) and
+                    isinstance(d.get("Members"),list) ):
+                    respd=dict(d)
+                    members=list()
+                    for rc,r,j,pd in rft.iterCollectionPages(rft, apiType, r, d, headersInput=headersInput):
+                        if( rc != 0 ):
+                            return(rc,r,j,pd)
+                        members.extend(pd.get("Members",[]))
+                        lastd=pd
+                    respd["Members"]=members
+                    # only keep the nextLink if --max-pages stopped us before the last page
+                    if( "Members@odata.nextLink" in lastd ):
+                        respd["Members@odata.nextLink"]=lastd["Members@odata.nextLink"]
                     else:
-                        rft.printTaskStatus("Task Monitor URL is %s\n" %
-                                            r.headers.get("Location", "<not available>"))
-                        return (rc, r, False, None)
-                elif((r.status_code==200) or (r.status_code==201) ):  
-                    if( jsonData is True):
-                        try:
-                            d=json.loads(r.text)
-                        except ValueError:
-                            rft.printErr("Transport: Error loading Data: uri: {}".format(url))
-                            respd=None
-                            rc=5
-                            jsonData=False
-                            return(rc,r,False,None)
-                    else:
-                        d=r.text #xml data
-                        return(rc,r,jsonData,d)
-
-                    #if here, no error, and its json data
-                    # if specific property was specified, filter here
-                    if(( method == "GET") and (prop is not None) ):
-                        rc,r,j,d=rft.getPropFromDict(rft,r,d,prop)
-                        return(rc,r,j,d)
-                    if( (respd is None) and ( not "Members@odata.nextLink" in d)):
-                        # normal case where single response w/ no next link
-                        return(rc,r,jsonData,d)
-                    elif( (respd is None ) and ("Members@odata.nextLink" in d)):
-                        #then this is the 1st nextlink
-                        respd=d
-                        url=urljoin(urlBase2,d["Members@odata.nextLink"])
-                        #dont return--keep looping
-                    elif( not respd is None )and ("Members@odata.nextLink" in d):
-                        # this is 2nd or later response-that has a nextlink
-                        respd["Members"]= respd["Members"] + d["Members"]
-                        url=urljoin(urlBase2,d["Members@odata.nextLink"])
-                    elif( not respd is None )and (not "Members@odata.nextLink" in d):
-                        # this final response to a multi-response request, and it has not nextlink
-                        respd["Members"]= respd["Members"] + d["Members"]
-                        return(rc,r,jsonData,respd)
-                    if respd is not None and attempt + 1 >= rft.MaxNextLinks:
-                        # return what we have if we've reached MaxNextLinks
-                        return rc, r, jsonData, respd
-                elif( r.status_code!=200):
-                    success=False
-                    rft.printErr("Transport: unexpected response status code {} for method {}"
-                                 .format(r.status_code, method))
-                    return(5,r,False,None)
+                        del respd["Members@odata.nextLink"]
+                    return(rft.memoizeResponse(memoKey,rc,r,jsonData,respd))
+                return(rft.memoizeResponse(memoKey,rc,r,jsonData,d))
+            elif( r.status_code!=200):
+                success=False
+                rft.printErr("Transport: unexpected response status code {} for method {}"
+                             .format(r.status_code, method))
+                return(5,r,False,None)
 
         # Should not get here, but log error if we do
         rft.printErr("Transport: Internal error; reached end of function without returning")
         return 5, r, False, None
 
+    # return the request headers for method, in a new dict the caller can change
+    # the transport will use defaults specified in the Transport defaults properties dfltXYZHdrs depending on method XYZ.
+    # if headers were passed in by a command function in headersInput, then add them or modify default with those values
+    # And also: if addl headers were specified in the commandline -H <hdrs> option, add them to the defaults above
+    #   ex self.dfltPatchPostPutHdrs  = {"content-type": "application/json", "Accept": "application/json", "OData-Version": "4.0" }
+    #   ex self.dfltGetDeleteHeadHdrs = {"Accept": "application/json", "OData-Version": "4.0" }
+    # the headers without headersInput are only built once for each method, and copied
+    def getRequestHeaders(self, method, headersInput=None):
+        if( headersInput is None ):
+            hdrs=self.requestHdrs.get(method)
+            if( hdrs is None ):
+                hdrs=self.buildRequestHeaders(method, None)
+                self.requestHdrs[method]=hdrs
+            # make copy of the dict.  Otherwise Requests is sometimes not adding addl headers.  a byte vs string bug in requests
+            return(dict(hdrs))
+        return(self.buildRequestHeaders(method, headersInput))
+
+    def buildRequestHeaders(self, method, headersInput):
+        # get default headers based on the method being called
+        if( (method == 'PATCH') or (method == 'POST') or (method == 'PUT') ):
+            hdrlist=self.dfltPatchPostPutHdrs
+        else:  # method is GET, DELETE, HEAD
+            hdrlist=self.dfltGetDeleteHeadHdrs
+
+        hdrs=dict(hdrlist)
+
+        # if a list of headers was sent in in the function, then add them (or update defaults with new values)
+        if( headersInput is not None):  # headers passed in from a calling function overrides defaults
+            for key in headersInput:
+                hdrs[key]=headersInput[key]
+
+        # check and see if an additional/alternate hdr value was passed in on CLI as -H option
+        if( self.headers is not None):
+            # a user passed-in an addl header using -H {A:B, C:D},
+            # This changes the current value or adds the new header if it doesn't already exist
+            for key in self.headers:
+                hdrs[key]=self.headers[key]
+
+        # ask for compressed responses unless --no-compression, or unless the caller or -H already set Accept-Encoding
+        # redfish json (and $metadata xml) typically compresses 5-10x, which matters on slow management networks
+        if( not any(key.lower() == 'accept-encoding' for key in hdrs) ):
+            if( self.compression is True ):
+                hdrs['Accept-Encoding']='gzip, deflate'
+            else:
+                hdrs['Accept-Encoding']=None
+        return(hdrs)
+
+
+    # the per-command GET memo.  The key is everything that can change the response rftSendRecvRequest returns
+    def getRequestMemoKey(self, apiType, url, prop, jsonData, followNextLink, headersInput):
+        hdrs=None
+        if( headersInput is not None ):
+            hdrs=tuple(sorted((str(k),str(v)) for k,v in headersInput.items()))
+        return((apiType, url, prop, jsonData, followNextLink, hdrs))
+
+    # returns rc,r,j,d of an earlier identical GET, or None.  d is a copy, so callers can modify it.
+    #   most GETs are never repeated, so the copy is only made here, when the response is read again
+    def getMemoizedResponse(self, memoKey):
+        with self.requestMemoLock:
+            memo=self.requestMemo.get(memoKey)
+        if( memo is None ):
+            return(None)
+        self.countStat("memoHits")
+        rc,r,j,d=memo
+        return(rc,r,j,copy.deepcopy(d))
+
+    # save a successful GET response in the memo, and return rc,r,j,d unchanged
+    #   the memo keeps a shallow copy of d: the caller may replace or remove its top-level properties (eg Members of a
+    #   collection it expanded), but not modify the values in it
+    def memoizeResponse(self, memoKey, rc, r, j, d):
+        if( (memoKey is not None) and (rc == 0) ):
+            with self.requestMemoLock:
+                self.requestMemo[memoKey]=(rc,r,j,dict(d) if isinstance(d,dict) else d)
+        return(rc,r,j,d)
+
+    def clearRequestMemo(self):
+        with self.requestMemoLock:
+            self.requestMemo.clear()
+        return(0)
+
     def sleepFor(self, response):
+        from datetime import datetime, timedelta
         retry_after = response.headers.get("Retry-After", 1)
         if isinstance(retry_after, int) or retry_after.isdigit():
             # Retry-After: 120
             sleep_for = timedelta(seconds=int(retry_after))
         else:
             # Retry-After: Fri, 31 Dec 1999 23:59:59 GMT
+            from dateutil import parser
             sleep_for = parser.parse(retry_after) - datetime.now()
         return max(0, sleep_for.total_seconds())
 
@@ -655,11 +1162,10 @@ class RfTransport():
             sleep_for = self.sleepFor(r)
             self.printVerbose(2, "Transport:waitForTask: sleep for %s seconds" % sleep_for)
             time.sleep(sleep_for)
-            self.printVerbose(3, "Transport:SendRecv:    {} {}".format('GET', url))
-            t1 = time.time()
-            r = requests.get(url, headers=headers, auth=auth, verify=verify,
-                             timeout=timeout, **kwargs)
-            self.elapsed = time.time() - t1
+            self.countStat("taskPolls")
+            self.printVerboseFmt(3, "Transport:SendRecv:    {} {}",'GET',url)
+            r = self.httpRequest('GET', url, headers=headers, auth=auth, verify=verify,
+                                 timeout=timeout, **kwargs)
             self.printStatus(1, r=r)
             self.printStatus(2, r=r)
             if time.time() >= timeout_at and r.status_code == 202:
@@ -736,6 +1242,7 @@ class RfTransport():
         #if we don't have a root resource response, then get it now
         if( d is  None ):
             # read the rootService
+            from .ServiceRoot import RfServiceRoot
             svcRoot=RfServiceRoot()
             rc,r,j,d = svcRoot.getServiceRoot(rft)
             if(rc!=0):
@@ -781,6 +1288,7 @@ class RfTransport():
             return(4,None,False,None)
         rft.sessionLink=r.headers["Location"]
         rft.cleanupOnExit=cleanupOnExit
+        rft.countStat("logins")
         
         rft.printStatus(3,r=r,addSessionLoginInfo=True)
 
@@ -795,8 +1303,8 @@ class RfTransport():
         if(sessionLink is None):
             # delete this session saved in rft.sessionId, rft.sessionLink
             # delete in rft
-            self.printVerbose(5,"rfSessionDelete: deleting session:{}".format(rft.sessionId))
-            rft.printVerbose(4,"Transport: delete session: id:{},  link:{}".format(rft.sessionId, rft.sessionLink))
+            self.printVerboseFmt(5,"rfSessionDelete: deleting session:{}",rft.sessionId)
+            rft.printVerboseFmt(4,"Transport: delete session: id:{},  link:{}",rft.sessionId,rft.sessionLink)
             sessionLink=rft.sessionLink
             
         # now we have a login uri,  login
@@ -806,6 +1314,7 @@ class RfTransport():
             rft.printErr("Error: Logout: Session Delete Failed: Delete to Sessions collection failed")
             rft.printErr("  sessionId:{}".format(sessionLink))
             return(rc,None,False,None)
+        rft.countStat("logouts")
 
         # save the sessionId and SessionAuthToken to None
         self.sessionId=None
@@ -814,9 +1323,52 @@ class RfTransport():
         return(rc,r,False,None)
 
     
+    # --session-cache: use the session saved by an earlier command for this rhost and user.
+    # The session is not deleted at the end of the command, so it can be reused again
+    # returns True if a cached session was found
+    def loadCachedSession(self,rft):
+        cache=RfSessionCache(rft.cacheDir or defaultCacheDir(), rft.rhost, rft.user, rft.password)
+        session=cache.load()
+        if( session is None ):
+            return(False)
+        rft.authToken=session["X-Auth-Token"]
+        rft.sessionId=session.get("SessionId")
+        rft.sessionLink=session["SessionLocation"]
+        rft.sessionFromCache=True
+        rft.cleanupOnExit=False
+        rft.printVerboseFmt(4,"Transport: using cached session: id:{},  link:{}",rft.sessionId,rft.sessionLink)
+        return(True)
+
+    # --session-cache: save the session we just created so later commands can reuse it, and don't delete it at exit
+    def saveCachedSession(self,rft):
+        cache=RfSessionCache(rft.cacheDir or defaultCacheDir(), rft.rhost, rft.user, rft.password)
+        if( cache.save(rft.authToken, rft.sessionId, rft.sessionLink) != 0 ):
+            rft.printVerbose(1,"Transport: could not write session cache file: {}".format(cache.cacheFile))
+            return(5)
+        rft.cleanupOnExit=False
+        return(0)
+
+    # forget the cached session (eg rhost returned 401 for it).  the next request will login again
+    # sessionFromCache is left False after that login, so a 401 for the new session is not retried again
+    def dropCachedSession(self,rft):
+        cache=RfSessionCache(rft.cacheDir or defaultCacheDir(), rft.rhost, rft.user, rft.password)
+        cache.remove()
+        rft.sessionFromCache=False
+        return(rft.forgetSession(rft))
+
+    # forget the session we hold without touching the --session-cache file.  the next request will login again
+    # reloginOn401 is left False after that login, so a 401 for the new session is not retried again
+    def forgetSession(self,rft):
+        rft.authToken=None
+        rft.sessionId=None
+        rft.sessionLink=None
+        rft.reloginOn401=False
+        rft.cleanupOnExit=True
+        return(0)
+
     def rfCleanup(self,rft):       
         #if we created a temp session in this cmd, logout
-        self.printVerbose(5,"rfCleanup:Cleaningup session: {}".format(self.sessionId))
+        self.printVerboseFmt(5,"rfCleanup:Cleaningup session: {}",self.sessionId)
         if((rft.cleanupOnExit is True ) and (rft.sessionId is not None) ):
 
             #delete the session
@@ -827,73 +1379,143 @@ class RfTransport():
          return(0)
 
 
+    # True if printVerbose(v,...) would print.  Call sites that build expensive verbose output check it first
+    def isVerbose(self, v, printV12=True):
+        if( self.quiet ):
+            return(False)
+        if( v==0 ):    #print no mater value of verbose, but not if quiet=1
+            return(True)
+        if( v==1 or v==2 ):
+            return( ((printV12 is True) and (self.verbose >= v)) or (self.verbose > 4) )
+        if( v==3 ):
+            return( (printV12 is True) and (self.verbose >= v) )
+        if( v==4 or v==5 ):
+            return( self.verbose >= v )
+        return(False)     #if you set v= anything except 0,1,2,3,4,5 it is ignored
+
+    # True if printStatus(s,...) would print
+    def isStatus(self, s):
+        return( (not self.quiet) and (1 <= s <= 5) and (self.status >= s) )
+
+    # write text to stream in one write, and flush.  The lock keeps the lines of concurrent member reads and
+    #   fleet workers from interleaving.  stream is looked up by the caller at the time of the call, so the
+    #   --batch and -r <hostList> per-thread output capture still sees it
+    def writeOutput(self, stream, text):
+        with outputLock:
+            stream.write(text)
+            stream.flush()
+        return(0)
+
+    # print argv if the verbose level v is enabled.  argv is printed like print() does
+    #   the level is checked before anything is formatted, and nothing is flushed if the message is not printed
     def printVerbose(self,v,*argv, skip1=False, printV12=True,**kwargs): 
-        if(self.quiet):
+        if( (v > self.verbose) and (v > 2) ):     # the usual case: a debug message without -vvv
+            return(0)
+        if( not self.isVerbose(v, printV12) ):
             return(0)
-        if( (v==1 or v==2) and (printV12 is True) and (self.verbose >= v )):
-            if(skip1 is True):  print("#")
-            print("#",*argv, **kwargs)
-        elif( (v==1 or v==2) and (self.verbose >4 )):
-            if(skip1 is True):  print("#")
-            print("#",*argv, **kwargs)            
-        elif((v==3 ) and (printV12 is True) and (self.verbose >=v)):
-            if(skip1 is True):  print("#")
-            print("#REQUEST:",*argv,file=sys.stdout,**kwargs)
-        elif((v==4 or v==5) and (self.verbose >=v)):
-            if(skip1 is True):  print("#")
-            print("#DB{}:".format(v),*argv,file=sys.stdout,**kwargs)
-        elif( v==0):  #print no mater value of verbose, but not if quiet=1
-            if(skip1 is True):  print("")
-            print(*argv, **kwargs)
+        if( v==0 ):
+            prefix=()
+            skipLine=""
+        elif( v==1 or v==2 ):
+            prefix=("#",)
+            skipLine="#"
+        elif( v==3 ):
+            prefix=("#REQUEST:",)
+            skipLine="#"
         else:
-            pass
+            prefix=("#DB{}:".format(v),)
+            skipLine="#"
+        out=io.StringIO()
+        if(skip1 is True):  print(skipLine, file=out)
+        print(*(prefix + argv), file=out, **kwargs)
+        self.writeOutput(sys.stdout, out.getvalue())
+        return(0)
 
-        sys.stdout.flush()
-        #if you set v= anything except 0,1,2,3,4,5 it is ignored
+    # lazily formatted printVerbose:  rft.printVerboseFmt(5,"Transport: url={}",url)
+    #   fmt.format(*args, **fmtKwargs) is only called if the verbose level v is enabled, so hot paths
+    #   (each request, each collection member) do not pay for formatting messages that are not printed
+    def printVerboseFmt(self, v, fmt, *args, skip1=False, printV12=True, **fmtKwargs):
+        if( (v > self.verbose) and (v > 2) ):
+            return(0)
+        if( not self.isVerbose(v, printV12) ):
+            return(0)
+        return(self.printVerbose(v, fmt.format(*args, **fmtKwargs), skip1=skip1, printV12=printV12))
 
 
     def printStatus(self, s, r=None, hdrs=None, authMsg=None, addSessionLoginInfo=False): 
-        if(self.quiet):
+        if( not self.isStatus(s) ):
             return(0)
-        if(   (s==1 ) and (self.status >= s ) and (r is not None) ):
-            print("#STATUS: Last Response: r.status_code: {}".format(r.status_code))
-        elif( (s==2 ) and (self.status >= s ) and (r is not None) ):
-            print("#STATUS: Last Response: r.url: {}".format(r.url))
-            print("#STATUS: Last Response: r.elapsed(responseTime): {0:.2f} sec".format(self.elapsed))
-        elif( (s==3 ) and (self.status >= s ) and (r is not None) ):
+        lines=list()
+        if(   (s==1 ) and (r is not None) ):
+            lines.append("#STATUS: Last Response: r.status_code: {}".format(r.status_code))
+        elif( (s==2 ) and (r is not None) ):
+            lines.append("#STATUS: Last Response: r.url: {}".format(r.url))
+            lines.append("#STATUS: Last Response: r.elapsed(responseTime): {0:.2f} sec".format(self.elapsed))
+            if( self.lastPhases is not None ):
+                lines.append("#STATUS: Last Response: phases: {}".format(self.formatPhases(self.lastPhases)))
+            lines.append("#STATUS: Last Response: size: {}".format(self.getResponseSize(r)))
+        elif( (s==3 ) and (r is not None) ):
             if( addSessionLoginInfo is True):
-                print("#____AUTH_TOKEN:  {}".format(self.authToken))
-                print("#____SESSION_ID:  {}".format(self.sessionId))
-                print("#____SESSION_URI: {}".format(self.sessionLink))
+                lines.append("#____AUTH_TOKEN:  {}".format(self.authToken))
+                lines.append("#____SESSION_ID:  {}".format(self.sessionId))
+                lines.append("#____SESSION_URI: {}".format(self.sessionLink))
             else:
-                print("#REQUEST:  {}     {} ".format(r.request.method, r.request.url))
-                print("#__Request.Headers:  {}".format(r.request.headers))
-                print("#__Request AuthType: {}".format(authMsg))
-                print("#__Request Data: {}".format(r.request.body))
-                print("#__Response.status_code: {},         r.url: {}".format(r.status_code,r.url))
-                print("#__Response.elapsed(responseTime): {0:.2f} sec".format(self.elapsed))
-        elif( (s==4 ) and (self.status >= s ) and (r is not None) ):
-            print("#__Response.Headers: {}".format(r.headers))
-        elif( (s==5 ) and (self.status >= s )  ):
-            print("#__Response. Data: {}".format(r.text))
-        else:
-            pass
-            #if you set v= anything except 1,2,3,4,5 it is ignored
-        sys.stdout.flush()
+                lines.append("#REQUEST:  {}     {} ".format(r.request.method, r.request.url))
+                lines.append("#__Request.Headers:  {}".format(r.request.headers))
+                lines.append("#__Request AuthType: {}".format(authMsg))
+                lines.append("#__Request Data: {}".format(r.request.body))
+                lines.append("#__Response.status_code: {},         r.url: {}".format(r.status_code,r.url))
+                lines.append("#__Response.elapsed(responseTime): {0:.2f} sec".format(self.elapsed))
+                if( self.lastPhases is not None ):
+                    lines.append("#__Response.phases: {}".format(self.formatPhases(self.lastPhases)))
+                lines.append("#__Response.size: {}".format(self.getResponseSize(r)))
+        elif( (s==4 ) and (r is not None) ):
+            lines.append("#__Response.Headers: {}".format(r.headers))
+        elif( s==5 ):
+            lines.append("#__Response. Data: {}".format(r.text))
+        if( lines ):
+            self.writeOutput(sys.stdout, "\n".join(lines) + "\n")
+        return(0)
         
 
 
 
+    # return a string with the size of the response body, and the bytes read from the network if it was compressed
+    #   eg:  "2116 bytes (gzip: 393 bytes on wire)"
+    def getResponseSize(self, r):
+        bodyBytes,encoding,wireBytes=self.getResponseBytes(r)
+        if( wireBytes is None ):
+            return("{} bytes".format(bodyBytes))
+        return("{} bytes ({}: {} bytes on wire)".format(bodyBytes, encoding, wireBytes))
+
+    # return the phase timings of a request as a string, eg: "connect 0.002s, tls 0.031s, ..."
+    def formatPhases(self, phases):
+        from .redfishtoolTiming import formatPhases
+        return(formatPhases(phases))
+
+    # return bodyBytes, Content-Encoding, wireBytes of the response.  wireBytes is None if it was not compressed
+    def getResponseBytes(self, r):
+        bodyBytes=len(r.content) if( r.content is not None ) else 0
+        encoding=r.headers.get("Content-Encoding")
+        wireBytes=None
+        raw=getattr(r,"raw",None)
+        if( (encoding is not None) and (raw is not None) and hasattr(raw,"tell") ):
+            try:
+                wireBytes=raw.tell()
+            except (OSError, ValueError):
+                wireBytes=None
+        return(bodyBytes,encoding,wireBytes)
+
+
     def printErr(self,*argv,noprog=False,prepend="",**kwargs):
-        if( self.quiet == False):
-            if(noprog is True):
-                print(prepend,*argv, file=sys.stderr, **kwargs)
-            else:
-                print(prepend,"  {}:".format(self.program),*argv, file=sys.stderr, **kwargs)
+        if( self.quiet ):
+            return(0)
+        out=io.StringIO()
+        if(noprog is True):
+            print(prepend,*argv, file=out, **kwargs)
         else:
-            pass
-        
-        sys.stderr.flush()
+            print(prepend,"  {}:".format(self.program),*argv, file=out, **kwargs)
+        self.writeOutput(sys.stderr, out.getvalue())
         return(0)
 
 
@@ -948,13 +1570,16 @@ class RfTransport():
             else:
                 errMsg=""
             self.printErr("Transport: Response Error: status_code: {} -- {}".format(status_code, errMsg ))
-            
-        sys.stdout.flush()
         return(0)
 
 
 
+    # find the member of top-level collection coll specified by -I|-M|-F|-1|-L.  returns <path> rc, r, j, d
     def getPathBy(self,rft, r, coll, prop=None):
+        with rft.traceSpan("resolution"):
+            return(self.findPathBy(rft, r, coll, prop))
+
+    def findPathBy(self,rft, r, coll, prop=None):
         if('Members'  not in coll):
             rft.printErr("Error: getPathBy: no members array in collection")
             return(None,1,None,False,None)
@@ -1008,17 +1633,33 @@ class RfTransport():
 
         elif(rft.gotMatchOptn):
             baseUrl=r.url
-            matchedPath,matchedRc,matchedR,matchedJ,matchedD=None,1,None,False,None
-            matches=0
+
+            # -I <Id> (or -M Id:<Id>): redfish services normally put collection members at <collectionUri>/<Id>.
+            # So first read the member whose link ends with /<Id> and verify its Id property.
+            # Only if that doesn't find it, read every member of the collection looking for the match
+            if( rft.matchProp == "Id" ):
+                for path in rft.getMemberPathsById(rft, coll, rft.matchValue):
+                    rc,r,j,d=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', baseUrl, relPath=path)
+                    if( (rc==0) and isinstance(d,dict) and (d.get("Id") == rft.matchValue) ):
+                        return(path,rc,r,j,d)
+                rft.printVerbose(4,"Transport:getPathBy: no member link ends with the Id. searching all collection members")
+
+            paths=list()
             for i in range (0,numOfLinks):
                 if( '@odata.id'  not in coll['Members'][i] ):
                     rft.printErr("Error: getPathBy --Id or --Match option: improper formatted link-no @odata.id")
                     return(None,1,None,False,None)
-                else:
-                    path=coll['Members'][i]['@odata.id']
-                    rc,r,j,d=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', baseUrl, relPath=path)
+                paths.append(coll['Members'][i]['@odata.id'])
+
+            # read the members concurrently, but check them in collection order so -F still returns the first match.
+            # closing the responses generator cancels the reads not yet started once we have an answer
+            matchedPath,matchedRc,matchedR,matchedJ,matchedD=None,1,None,False,None
+            matches=0
+            responses=rft.getMemberResponses(rft, baseUrl, paths)
+            try:
+                for path,rc,r,j,d in responses:
                     if(rc==0):  # if matchProp found
-                        if( d[rft.matchProp] == rft.matchValue ):
+                        if( d.get(rft.matchProp) == rft.matchValue ):
                             matchedPath,matchedRc,matchedR,matchedJ,matchedD=path,rc,r,j,d
                             matches +=1
                             if( matches > 1 ):
@@ -1027,11 +1668,13 @@ class RfTransport():
                             if(rft.firstOptn):
                                 return(matchedPath,matchedRc,matchedR,matchedJ,matchedD)
                         else:
-                            rft.printVerbose(4,"Transport:getPathBy:Match: failed match: matchProp={}, matchValue={}, readValue={}".format(rft.matchProp,rft.matchValue,d[rft.matchProp]))
+                            rft.printVerboseFmt(4,"Transport:getPathBy:Match: failed match: matchProp={}, matchValue={}, readValue={}",rft.matchProp,rft.matchValue,d.get(rft.matchProp))
                             pass
                     else:    # the request to this member failed
                         rft.printErr("Error: getPathBy --Id or --Match option: failed request to read collection member.")
                         pass
+            finally:
+                responses.close()
             #after looping over all members in the array,
             #if here, if we got a match, return the path.  If not, then no match was found. return none
             if( matches > 0 ):
@@ -1045,8 +1688,12 @@ class RfTransport():
             return(None,1,None,False,None)
 
 
-    # returns <path> rc, r, j, d
+    # find the member of 2nd level collection coll specified by -i|-m|-l.  returns <path> rc, r, j, d
     def getLevel2ResourceById(self,rft, r, coll):
+        with rft.traceSpan("resolution"):
+            return(self.findLevel2ResourceById(rft, r, coll))
+
+    def findLevel2ResourceById(self,rft, r, coll):
         if('Members'  not in coll):
             rft.printErr("Error: getPathBy2: no members array in collection")
             return(None,1,None,False,None)
@@ -1071,21 +1718,37 @@ class RfTransport():
             return(None,1,None,False,None)
         elif(rft.gotMatchLevel2Optn is True):
             baseUrl=r.url
+
+            # -i <id> (or -m Id:<id>): first try the member whose link ends with /<id>, as in getPathBy()
+            if( rft.matchLevel2Prop == "Id" ):
+                for path in rft.getMemberPathsById(rft, coll, rft.matchLevel2Value):
+                    rc,r,j,d=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', baseUrl, relPath=path)
+                    if( (rc==0) and isinstance(d,dict) and (d.get("Id") == rft.matchLevel2Value) ):
+                        return(path,rc,r,j,d)
+                rft.printVerbose(5,"Transport:getPathBy2: no member link ends with the id. searching all collection members")
+
+            paths=list()
             for i in range (0,numOfLinks):
                 if( '@odata.id'  not in coll['Members'][i] ):
                     rft.printErr("Error: getPathBy2 --Id or --Match option: improper formatted link-no @odata.id")
                     return(None,1,None,False,None)
-                else:
-                    path=coll['Members'][i]['@odata.id']
-                    rc,r,j,d=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', baseUrl, relPath=path)
+                paths.append(coll['Members'][i]['@odata.id'])
+
+            # read the members concurrently and return the first match in collection order.
+            # closing the responses generator cancels the reads not yet started
+            responses=rft.getMemberResponses(rft, baseUrl, paths)
+            try:
+                for path,rc,r,j,d in responses:
                     if(rc==0):  # if matchProp found
-                        if( d[rft.matchLevel2Prop] == rft.matchLevel2Value ):
+                        if( d.get(rft.matchLevel2Prop) == rft.matchLevel2Value ):
                             return(path,rc,r,j,d)
                         else:
-                            rft.printVerbose(5,"Transport:getPathBy2:Match: failed match: matchProp={}, matchValue={}, readValue={}".format(rft.matchLevel2Prop,rft.matchLevel2Value,d[rft.matchLevel2Prop]))
+                            rft.printVerboseFmt(5,"Transport:getPathBy2:Match: failed match: matchProp={}, matchValue={}, readValue={}",rft.matchLevel2Prop,rft.matchLevel2Value,d.get(rft.matchLevel2Prop))
                             pass
                     else:    # the request to this member failed
                         pass
+            finally:
+                responses.close()
             #after looping over all members in the array,
             #if here, if we got a match, return the path.  If not, then no match was found. return none
             return(None,1,None,False,None)
@@ -1097,6 +1760,24 @@ class RfTransport():
 
 
 
+    # return the list of collection member links whose last path segment is <memberId>
+    #   eg: memberId="1" matches "/redfish/v1/Systems/1" and "/redfish/v1/Systems/1/"
+    # The member must still be read to verify its Id, since the service doesn't have to use the Id in the URI
+    def getMemberPathsById(self, rft, coll, memberId):
+        paths=list()
+        if( memberId is None ):
+            return(paths)
+        for member in coll['Members']:
+            if( (not isinstance(member,dict)) or ('@odata.id' not in member) ):
+                continue
+            path=member['@odata.id']
+            lastSegment=urlparse(path).path.rstrip('/').rsplit('/',1)[-1]
+            if( unquote(lastSegment) == memberId ):
+                paths.append(path)
+        return(paths)
+
+
+
     # create a dict list of the collection containing: Id, <prop>, <rpath>
     # if prop=None, then the additional property is not included
     # return rc,r,j,d
@@ -1113,14 +1794,30 @@ class RfTransport():
 
         baseUrl=r.url
 
-        members=list()
+        paths=list()
         for i in range (0,numOfLinks):
             if( '@odata.id'  not in coll['Members'][i] ):
                 rft.printErr("Error: listCollection  improper formatted link-no @odata.id")
                 return(4,None,False,None)
             else:
-                path=coll['Members'][i]['@odata.id']
-                rc,r,j,d=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', r.url, relPath=path)
+                paths.append(coll['Members'][i]['@odata.id'])
+
+        # if rhost supports $expand, read all of the members in one request.
+        # otherwise (or if the expanded response is not complete) read the members one by one.
+        #   If rhost supports $select, only ask for the Id and <prop> properties of each member
+        rc,er,ej,ed=rft.getExpandedCollection(rft, baseUrl)
+        if( (rc==0) and (len(ed["Members"])==numOfLinks) ):
+            memberResponses=[ (path,0,er,True,member) for path,member in zip(paths,ed["Members"]) ]
+        else:
+            selectQuery=None
+            if( rft.getProtocolFeature(rft,"SelectQuery") is True ):
+                selectQuery="$select=Id"
+                if( (prop is not None) and (selectablePropMatch.match(prop) is not None) ):
+                    selectQuery=selectQuery + "," + prop
+            memberResponses=rft.getMemberResponses(rft, baseUrl, paths, query=selectQuery)
+
+        members=list()
+        for path,rc,r,j,d in memberResponses:
                 if(rc==0):  # if remote host returned a response
                     if( "Id" not in d ):
                         rft.printErr("Error: listCollection: no \"Id\" property in Collection member")
@@ -1131,7 +1828,7 @@ class RfTransport():
                         else:
                             propVal=d[prop]
                     # create a member dict. Always include  Id and path
-                    listMember={"Id": d["Id"], "@odata.id": d["@odata.id"] }
+                    listMember={"Id": d["Id"], "@odata.id": d.get("@odata.id",path) }
                     # if a property was specified to include, add it to the list dict
                     if( prop in d ):
                         listMember[prop]=propVal           
@@ -1151,8 +1848,16 @@ class RfTransport():
     # given a url to a collection, get it, and then get all members, return dict with all members expanded
     def getAllCollectionMembers(self, rft, baseUrl, relPath=None ):
         #get all members of a collection expanded
-        #first get the collection
+        #if rhost supports $expand, get the collection with all members expanded in one request
+        rc,r,j,coll=rft.getExpandedCollection(rft, baseUrl, relPath=relPath)
+        if( rc==0 ):
+            rft.printVerbose(4,"getAllCollectionMembers: read expanded collection using $expand")
+            return(rc,r,j,coll)
+
+        #otherwise, first get the collection
         rc,r,j,coll=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', baseUrl, relPath=relPath)
+        if( rc != 0 ):
+            return(rc,r,False,None)
         if('Members'  not in coll):
             rft.printErr("Error: getAllCollectionMembers: no members array in collection")
             return(4,None,False,None)
@@ -1164,17 +1869,23 @@ class RfTransport():
         #then create new members array
         #for each member in members array, read the link into a new memberEntry
         baseUrl=r.url
-        expandedMembers=list()
+        paths=list()
         for i in range (0,numOfLinks):
             if( '@odata.id'  not in coll['Members'][i] ):
                 rft.printErr("Error: getAllCollectionMembers  improper formatted link-no @odata.id")
                 return(4,None,False,None)
             else:
-                path=coll['Members'][i]['@odata.id']
-                rc,r,j,d=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', baseUrl, relPath=path)
-                if(rc==0):  # if remote host returned a response
-                    #save this as new member entry
-                    expandedMembers.append(d)
+                paths.append(coll['Members'][i]['@odata.id'])
+
+        # the members are read concurrently, but returned in collection order.
+        # if reading a member fails, report it and continue with the rest of the members
+        expandedMembers=list()
+        for path,mrc,mr,mj,md in rft.getMemberResponses(rft, baseUrl, paths):
+            if(mrc==0):  # if remote host returned a response
+                #save this as new member entry
+                expandedMembers.append(md)
+            else:
+                rft.printErr("Error: getAllCollectionMembers: failed to read collection member: {}".format(path))
 
         #update base list dictionary
         coll["Members"]=expandedMembers
@@ -1182,6 +1893,246 @@ class RfTransport():
         return(rc,r,j,coll)
 
 
+    # return property <feature> of ProtocolFeaturesSupported in the service root response, or None if not there
+    # ex:  rft.getProtocolFeature(rft,"SelectQuery") returns True if the service supports $select
+    def getProtocolFeature(self, rft, feature):
+        d=rft.rootResponseDict
+        if( (d is None) or ("ProtocolFeaturesSupported" not in d) or (not isinstance(d["ProtocolFeaturesSupported"],dict)) ):
+            return(None)
+        return(d["ProtocolFeaturesSupported"].get(feature))
+
+
+    # return the $expand query option used to read a collection with all its members expanded,
+    #    or None if the service root does not advertise ExpandQuery support for it.
+    # "." expands the subordinate (non-Links) navigation properties, ie the Members of a collection
+    def getExpandQuery(self, rft):
+        expandQuery=rft.getProtocolFeature(rft,"ExpandQuery")
+        if( (not isinstance(expandQuery,dict)) or (expandQuery.get("NoLinks") is not True) ):
+            return(None)
+        if( expandQuery.get("Levels") is True ):
+            return("$expand=.($levels=1)")
+        return("$expand=.")
+
+
+    # add a query option (eg "$expand=.") to a relative path, that may already have a query
+    def addQueryToPath(self, path, query):
+        if( "?" in path ):
+            return(path + "&" + query)
+        return(path + "?" + query)
+
+
+    # GET a collection with the members expanded using $expand.  returns rc,r,j,d
+    # rc is not 0 if rhost does not support $expand, or if the response did not include all the members expanded
+    #   the caller should then read the collection members one by one
+    def getExpandedCollection(self, rft, baseUrl, relPath=None):
+        expandQuery=rft.getExpandQuery(rft)
+        if( expandQuery is None ):
+            return(4,None,False,None)
+        if( relPath is None ):
+            relPath=urlparse(baseUrl).path
+        # a service may advertise ExpandQuery and still reject $expand.  it is read one by one then, so don't print the error
+        with rft.callContext(quietStatusErr=True):
+            rc,r,j,d=rft.rftSendRecvRequest(rft.AUTHENTICATED_API, 'GET', baseUrl, relPath=rft.addQueryToPath(relPath,expandQuery))
+        if( (rc!=0) or (not isinstance(d,dict)) or (not isinstance(d.get("Members"),list)) ):
+            rft.printVerbose(4,"Transport: $expand of collection failed, reading members one by one")
+            return(4,r,False,None)
+        # an expanded member has more than its @odata.id link
+        for member in d["Members"]:
+            if( (not isinstance(member,dict)) or (len(member) <= 1) ):
+                rft.printVerbose(4,"Transport: $expand response members not expanded, reading members one by one")
+                return(4,r,False,None)
+        return(rc,r,j,d)
+
+
+    # GET each path in the paths list, and yield (path,rc,r,j,d) for each, in the same order as the paths list
+    # Up to rft.maxInflight requests are sent concurrently over the pooled session.
+    # If the caller stops iterating early (eg it found what it was looking for), requests not yet sent are cancelled
+    # if query is specified (eg "$select=Id,Name"), it is added to each member path
+    # usage:   for path,rc,r,j,d in rft.getMemberResponses(rft, baseUrl, paths):
+    def getMemberResponses(self, rft, baseUrl, paths, query=None, apiType=None, **kwargs):
+        if( apiType is None ):
+            apiType=rft.AUTHENTICATED_API
+        # the worker threads each read in their own call context, copied from the caller's, and write their
+        # output to the caller's output (captured for each host of a fleet, or each agent command)
+        callerContext=rft.getCallContext()
+        callerOutput=getOutputCapture()
+        def getMember(path):
+            relPath=path
+            if( query is not None ):
+                relPath=rft.addQueryToPath(path, query)
+            with inheritOutputCapture(callerOutput):
+                try:
+                    with rft.callContext(callerContext):
+                        return(rft.rftSendRecvRequest(apiType, 'GET', baseUrl, relPath=relPath, **kwargs))
+                except Exception as e:
+                    rft.printErr("Transport: Error reading collection member: {}: {}".format(path,e))
+                    return(5,None,False,None)
+
+        numWorkers=min(rft.maxInflight, len(paths))
+        if( numWorkers <= 1 ):
+            for path in paths:
+                rc,r,j,d=getMember(path)
+                yield(path,rc,r,j,d)
+            return
+
+        # keep at most 2*numWorkers reads queued ahead of the caller, so a caller that stops early
+        # (eg a -M search that found its match) doesn't leave the rest of the collection being read
+        from concurrent.futures import ThreadPoolExecutor
+        executor=ThreadPoolExecutor(max_workers=numWorkers)
+        window=2*numWorkers
+        futures=dict()
+        try:
+            for i in range(0,min(window,len(paths))):
+                futures[i]=executor.submit(getMember, paths[i])
+            for i in range(0,len(paths)):
+                rc,r,j,d=futures.pop(i).result()
+                if( i+window < len(paths) ):
+                    futures[i+window]=executor.submit(getMember, paths[i+window])
+                yield(paths[i],rc,r,j,d)
+        finally:
+            # cancel the reads not yet started, and wait for the ones in flight.  They write to the caller's
+            # output, which must not be used after the caller returns (eg the fleet restores sys.stdout)
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+    # run an operation on each member of a collection, for the -a option of the operations that change a member
+    #   (eg Systems -a reset, Chassis -a setAssetTag).  paths are the member links read from the collection at collUrl
+    #  -- runMember() is called in a call context that selects the member with -L <path>, and has collectionUrl set
+    #     so the operation does not read the service root and the collection again to find the member
+    #  -- up to maxInflight members run concurrently
+    #  -- returns rc,r,j,d:  d={"Members": [{"@odata.id": <path>, "rc": <rc>, "data": <data>},...]} in the order of paths.
+    #     rc is 0 if the operation succeeded on all members, otherwise the largest rc of any member.  r is the response
+    #     of the last member.  The members that failed are also listed with printErr
+    def runOnMembers(self, rft, collUrl, paths, runMember):
+        # the workers write their output to the caller's output (captured for each host of a fleet, or agent command)
+        callerContext=rft.getCallContext()
+        callerOutput=getOutputCapture()
+        def runMemberOp(path):
+            with inheritOutputCapture(callerOutput):
+                try:
+                    with rft.callContext(callerContext, Link=path, allOptn=False, gotIdOptn=True, IdOptnCount=1,
+                                         collectionUrl=collUrl):
+                        return(runMember())
+                except Exception as e:
+                    rft.printErr("Transport: Error running operation on collection member: {}: {}".format(path,e))
+                    return(5,None,False,None)
+
+        numWorkers=min(rft.maxInflight, len(paths))
+        rft.printVerboseFmt(4,"Transport:runOnMembers: running on {} members, {} at a time",len(paths),max(numWorkers,1))
+        if( numWorkers <= 1 ):
+            results=[runMemberOp(path) for path in paths]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=numWorkers) as executor:
+                results=list(executor.map(runMemberOp, paths))
+
+        rcAll,rLast=0,None
+        members=list()
+        failed=list()
+        for path,(rc,r,j,d) in zip(paths,results):
+            member={"@odata.id": path, "rc": rc}
+            if( (rc==0) and (d is not None) ):
+                member["data"]=d
+            members.append(member)
+            if( rc != 0 ):
+                failed.append("{} (rc={})".format(path,rc))
+                rcAll=max(rcAll,rc)
+            if( r is not None ):
+                rLast=r
+        if( failed ):
+            rft.printErr("Error: the operation failed on {} of {} members: {}".format(len(failed),len(paths),", ".join(failed)))
+        return(rcAll,rLast,True,{"Members": members})
+
+
+    # generator that reads the pages of a paged collection (one with a Members@odata.nextLink)
+    #   r,d is the response to the first page, which was already read.
+    # yields rc,r,j,d for each page, in order, starting with the first page.
+    # If rhost supports $skip/$top and returns Members@odata.count, the rest of the pages are read concurrently
+    #    using $skip=<n>&$top=<pageSize>.  Otherwise the nextLinks are followed one page at a time.
+    # If --max-pages stops the read before the last page, a warning is printed and the last page yielded
+    #    still has its Members@odata.nextLink
+    # If a nextLink points to a page that was already read, an error is printed and rc=5 is yielded
+    def iterCollectionPages(self, rft, apiType, r, d, headersInput=None):
+        yield(0,r,True,d)
+        numPages=1
+        numMembers=len(d["Members"])
+        nextLink=d.get("Members@odata.nextLink")
+        baseUrl=r.url
+        total=d.get("Members@odata.count")
+        query=urlparse(r.url).query
+
+        if( (nextLink is not None) and (numMembers > 0) and isinstance(total,int) and (total > numMembers) and
+            ("$skip=" not in query) and ("$top=" not in query) and
+            (rft.getProtocolFeature(rft,"TopSkipQuery") is True) ):
+            paths=list()
+            for skip in range(numMembers, total, numMembers):
+                if( (rft.maxPages is not None) and (numPages + len(paths) >= rft.maxPages) ):
+                    break
+                paths.append(rft.addQueryToPath(r.url, "$skip={}&$top={}".format(skip,numMembers)))
+            rft.printVerboseFmt(4,"Transport:iterCollectionPages: reading {} more pages using $skip/$top",len(paths))
+
+            pageSize=numMembers
+            responses=rft.getMemberResponses(rft, baseUrl, paths, apiType=apiType, headersInput=headersInput,
+                                             followNextLink=False)
+            try:
+                for path,rc,pr,pj,pd in responses:
+                    if( rc != 0 ):
+                        yield(rc,pr,pj,pd)
+                        return
+                    members=pd.get("Members") if isinstance(pd,dict) else None
+                    if( (not isinstance(members,list)) or (len(members) != min(pageSize, total-numMembers)) ):
+                        # rhost didn't page the way we asked. read the rest by following its nextLinks
+                        rft.printVerbose(4,"Transport:iterCollectionPages: unexpected $skip/$top page size. following nextLinks")
+                        break
+                    pd.pop("Members@odata.nextLink",None)
+                    numPages+=1
+                    numMembers+=len(members)
+                    # if --max-pages stops the read at this page, it keeps a nextLink to the rest of the members
+                    if( (rft.maxPages is not None) and (numPages >= rft.maxPages) and (numMembers < total) ):
+                        pd["Members@odata.nextLink"]=rft.addQueryToPath(r.url, "$skip={}".format(numMembers))
+                    yield(0,pr,pj,pd)
+            finally:
+                responses.close()
+
+            # continue after the members we have.  rhost returns a nextLink again if there are more pages
+            if( numMembers < total ):
+                nextLink=rft.addQueryToPath(r.url, "$skip={}".format(numMembers))
+            else:
+                nextLink=None
+
+        # the path and query of the pages read.  a nextLink to one of them would loop forever
+        urlp=urlparse(r.url)
+        visitedPages={(urlp.path, urlp.query)}
+        while( nextLink is not None ):
+            if( (rft.maxPages is not None) and (numPages >= rft.maxPages) ):
+                rft.printErr("Warning: collection {} has more than {} pages. Only the first {} members were read. Use --max-pages to read more".format(
+                    urlparse(r.url).path, rft.maxPages, numMembers))
+                return
+            urlp=urlparse(urljoin(baseUrl, nextLink))
+            if( (urlp.path, urlp.query) in visitedPages ):
+                rft.printErr("Transport: Error: collection {}: nextLink {} points to a page that was already read".format(
+                    urlparse(r.url).path, nextLink))
+                yield(5,r,False,None)
+                return
+            visitedPages.add((urlp.path, urlp.query))
+            rc,r,j,d=rft.rftSendRecvRequest(apiType, 'GET', baseUrl, relPath=nextLink, headersInput=headersInput,
+                                            followNextLink=False)
+            if( rc != 0 ):
+                yield(rc,r,j,d)
+                return
+            if( (not isinstance(d,dict)) or (not isinstance(d.get("Members"),list)) ):
+                rft.printErr("Transport: Error: collection page has no Members array: {}".format(r.url))
+                yield(5,r,False,None)
+                return
+            numPages+=1
+            numMembers+=len(d["Members"])
+            baseUrl=r.url
+            nextLink=d.get("Members@odata.nextLink")
+            yield(0,r,j,d)
+
+
     # this is the generic patch routing used by Systems patch, Chassis patch, etc
     def patchResource(self, rft, r, patchData, getResponseAfterPatch=True ):
         if( patchData is None ):
@@ -1249,12 +2200,10 @@ class RfTransport():
         resourceOdataType=resource["@odata.type"]
     
         #the odataType format is:  <namespace>.<version>.<type>   where version may have periods in it 
-        odataTypeMatch = re.compile('^#([a-zA-Z0-9]*)\.([a-zA-Z0-9\._]*)\.([a-zA-Z0-9]*)$')  
-        resourceMatch = re.match(odataTypeMatch, resourceOdataType)
+        resourceMatch = odataTypeMatch.match(resourceOdataType)
         if(resourceMatch is None):
             # try with no version component
-            odataTypeMatch = re.compile('^#([a-zA-Z0-9]*)\.([a-zA-Z0-9]*)$')
-            resourceMatch = re.match(odataTypeMatch, resourceOdataType)
+            resourceMatch = odataTypeNoVersionMatch.match(resourceOdataType)
             if (resourceMatch is None):
                 rft.printErr("Transport:parseOdataType: Error parsing @odata.type")
                 return(None,None,None)
@@ -1285,6 +2234,19 @@ class RfTransport():
             rft.printErr('Error getting AllowableValues from uri {}; rc = {}, response = {}'.format(relPath, rc, r))
         return allowable_values
 
+
+# rft.<attr> of each RfCallContext attribute reads and sets the calling thread's current call context
+def callContextProperty(attr):
+    def getter(self):
+        return(getattr(self.getCallContext(), attr))
+    def setter(self, value):
+        setattr(self.getCallContext(), attr, value)
+    return(property(getter, setter))
+
+for attr in RfCallContext.defaults:
+    setattr(RfTransport, attr, callContextProperty(attr))
+
+
 '''
 TODO:
 1.